@@ -0,0 +1,91 @@
+"""
+첨부 텍스트 블록 모듈
+아주 긴 붙여넣기 내용을 별도 파일로 저장하고, 메모에는 접힌 블록(한 줄 요약)으로 표시
+(펼치면 원래 텍스트를 메모 본문에 삽입)
+"""
+
+import os
+import uuid
+import tkinter as tk
+
+ATTACHMENT_DIR = "memo_attachments"
+SUMMARY_LENGTH = 40  # 블록에 표시할 첫 줄 최대 길이
+
+
+def save_attachment(directory, text):
+    """텍스트를 첨부 파일로 저장하고 경로 반환"""
+    path = os.path.join(directory, f"paste_{uuid.uuid4().hex}.txt")
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    return path
+
+
+def read_attachment(path):
+    """첨부 파일 내용 읽기"""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        return f.read()
+
+
+def format_size(chars):
+    """글자 수를 읽기 쉬운 크기로 표시"""
+    if chars < 1000:
+        return f"{chars}자"
+    if chars < 1_000_000:
+        return f"{chars / 1000:.1f}K자"
+    return f"{chars / 1_000_000:.1f}M자"
+
+
+def first_line(text):
+    """요약에 쓸 첫 번째 비어 있지 않은 줄"""
+    for line in text.split("\n", 20)[:20]:
+        line = line.strip()
+        if line:
+            return line[:SUMMARY_LENGTH] + "..." if len(line) > SUMMARY_LENGTH else line
+    return ""
+
+
+class AttachmentBlock(tk.Frame):
+    """텍스트 편집기에 삽입되는 접힌 첨부 텍스트 블록
+
+    on_expand(block): 펼치기 버튼 콜백 (블록을 본문 텍스트로 바꾸는 것은 에디터가 담당)
+    on_copy(block): 복사 버튼 콜백
+    """
+
+    def __init__(self, master, path, lines, chars, summary="", on_expand=None, on_copy=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.path = path
+        self.lines = lines
+        self.chars = chars
+        self.summary = summary
+
+        bg = master.cget("bg")
+        self.configure(bg=bg, highlightthickness=1, highlightbackground="#555555")
+
+        label = tk.Label(
+            self, text=self.describe(), bg=bg, fg="#cccccc", anchor="w", justify="left",
+            font=("Roboto Medium", 12)
+        )
+        label.pack(side="left", padx=(8, 10), pady=4)
+
+        for text, callback in (("복사", on_copy), ("펼치기", on_expand)):
+            button = tk.Label(self, text=text, bg=bg, fg="#8ab4f8", cursor="hand2", font=("Roboto Medium", 12))
+            button.pack(side="right", padx=(0, 8))
+            if callback:
+                button.bind("<Button-1>", lambda _, cb=callback: cb(self))
+
+    def describe(self):
+        """블록 요약 문자열 (목차에도 사용)"""
+        text = f"📎 붙여넣은 텍스트 · {self.lines:,}줄 · {format_size(self.chars)}"
+        if self.summary:
+            text += f"\n{self.summary}"
+        return text
+
+    def get_data(self):
+        """저장용 세그먼트"""
+        return {
+            "type": "attachment",
+            "path": self.path,
+            "lines": self.lines,
+            "chars": self.chars,
+            "summary": self.summary,
+        }
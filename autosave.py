@@ -0,0 +1,85 @@
+"""
+자동 저장 스케줄러 모듈
+작업(저장, UI 갱신)의 실제 실행 시간을 측정하여 메모별로 디바운스 지연을 조절하고,
+계속 입력 중이어도 최대 지연 시간 안에는 한 번 실행되도록 보장
+"""
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveDebouncer:
+    """실행 비용에 맞춰 지연 시간을 조절하는 디바운서
+
+    지연 = 측정한 실행 시간(지수 이동 평균) × cost_factor, [min_delay, max_delay]로 제한
+    첫 요청 후 max_latency가 지나면 입력이 계속되어도 실행
+    should_defer가 True를 반환하는 동안(IME 조합 중, 메모 로드 중 등)은 실행을 미룸
+    """
+
+    def __init__(self, widget, callback, min_delay, max_delay, max_latency,
+                 cost_factor=10, smoothing=0.3, key=None, should_defer=None):
+        self.widget = widget
+        self.callback = callback
+        self.min_delay = min_delay  # 밀리초
+        self.max_delay = max_delay
+        self.max_latency = max_latency
+        self.cost_factor = cost_factor
+        self.smoothing = smoothing
+        self.key = key or (lambda: None)  # 비용을 따로 측정할 대상 (메모 ID 등)
+        self.should_defer = should_defer or (lambda: False)
+
+        self._costs = {}  # 대상별 실행 시간 이동 평균 (밀리초)
+        self._timer = None
+        self._first_request = None  # 아직 실행되지 않은 첫 요청 시각
+
+    @property
+    def pending(self):
+        """실행 대기 중인 요청이 있는지 여부"""
+        return self._timer is not None
+
+    def delay(self):
+        """현재 대상의 디바운스 지연 (밀리초)"""
+        cost = self._costs.get(self.key(), 0)
+        return int(min(self.max_delay, max(self.min_delay, cost * self.cost_factor)))
+
+    def trigger(self):
+        """실행 요청 (이전 예약을 미루고 다시 예약)"""
+        now = time.monotonic()
+        if self._first_request is None:
+            self._first_request = now
+
+        delay = self.delay()
+        # 최대 지연 보장: 첫 요청부터 max_latency 안에 실행
+        remaining = self.max_latency - (now - self._first_request) * 1000
+        delay = max(0, min(delay, int(remaining)))
+
+        if self._timer:
+            self.widget.after_cancel(self._timer)
+        self._timer = self.widget.after(delay, self._run)
+
+    def cancel(self):
+        """예약된 실행 취소"""
+        if self._timer:
+            self.widget.after_cancel(self._timer)
+        self._timer = None
+        self._first_request = None
+
+    def _run(self):
+        """예약 시각 도달: 미룰 상황이면 다시 예약, 아니면 실행 후 비용 측정"""
+        self._timer = None
+        if self.should_defer():
+            self._timer = self.widget.after(self.min_delay, self._run)
+            return
+
+        self._first_request = None
+        key = self.key()
+        start = time.perf_counter()
+        try:
+            self.callback()
+        finally:
+            cost = (time.perf_counter() - start) * 1000
+            previous = self._costs.get(key)
+            self._costs[key] = cost if previous is None else previous + self.smoothing * (cost - previous)
+            logger.debug(f"{getattr(self.callback, '__name__', 'task')} took {cost:.1f} ms, next delay {self.delay()} ms")
@@ -0,0 +1,75 @@
+"""
+키 입력 처리 마이크로벤치마크
+합성 키 이벤트를 MemoApp.on_key_press에 직접 넣어 키당 처리 시간을 측정
+(임시 디렉토리에서 실행하므로 실제 메모/설정 파일은 건드리지 않음)
+
+사용법: python bench_keypress.py [키 입력 횟수]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+import format_engine
+
+KEY_COUNT = 5000
+SAMPLE_TEXT = "가나다 abc def\n"
+
+
+def make_event(char, state=0, keysym=None, keycode=0):
+    """on_key_press가 읽는 속성만 가진 합성 키 이벤트"""
+    return SimpleNamespace(char=char, state=state, keysym=keysym or char, keycode=keycode)
+
+
+def measure(app, events):
+    """이벤트 목록을 순서대로 처리하며 키당 시간(마이크로초) 목록 반환"""
+    timings = []
+    for event in events:
+        start = time.perf_counter()
+        app.on_key_press(event)
+        timings.append((time.perf_counter() - start) * 1_000_000)
+    return timings
+
+
+def report(name, timings):
+    timings = sorted(timings)
+    count = len(timings)
+    mean = sum(timings) / count
+    p50 = timings[count // 2]
+    p99 = timings[min(count - 1, int(count * 0.99))]
+    print(f"{name:<28} n={count:<6} mean={mean:7.1f}us  p50={p50:7.1f}us  p99={p99:7.1f}us  max={timings[-1]:8.1f}us")
+
+
+def main():
+    key_count = int(sys.argv[1]) if len(sys.argv) > 1 else KEY_COUNT
+    os.chdir(tempfile.mkdtemp(prefix="bench_keypress_"))
+
+    from modern_notepad import MemoApp
+
+    app = MemoApp()
+    app.withdraw()
+    try:
+        chars = [SAMPLE_TEXT[i % len(SAMPLE_TEXT)] for i in range(key_count)]
+
+        # 1. 서식 없는 입력: on_key_press는 기본 바인딩에 맡기고 통과
+        report("plain (pass-through)", measure(app, [make_event(ch) for ch in chars]))
+
+        # 2. 서식 태그가 있는 입력: 태그와 함께 직접 삽입
+        app.textbox.delete("1.0", "end")
+        app.current_input_tags = format_engine.InputTags(["underline", app._get_font_tag("Roboto Medium", 16, "bold", "roman")])
+        report("formatted insert", measure(app, [make_event(ch) for ch in chars]))
+
+        # 3. 특수 키 / 단축키 (테이블 조회 후 통과)
+        report("special keys", measure(app, [make_event("", keysym="Left") for _ in chars]))
+        report("shortcut (unmapped IME)", measure(app, [make_event("", state=0x4, keysym="??", keycode=1) for _ in chars]))
+    finally:
+        app.save_scheduler.cancel()
+        app.ui_scheduler.cancel()
+        app.prefetcher.shutdown()
+        app.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
 import json
 import os
+import memo_delta  # 메모 차분 저장 모듈 임포트
+
+# op 로그가 이 크기를 넘으면 전체 스냅샷으로 압축
+COMPACT_OPS = 100
+COMPACT_BYTES = 256 * 1024
 
 class DataManager:
     def __init__(self, data_file, settings_file):
@@ -11,6 +16,9 @@ class DataManager:
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
 
+        # 메모 ID별 op 로그 상태 [연산 수, 바이트 수]
+        self._oplog_stats = {}
+
     def load_memos(self):
         """메모 데이터 로드 (개별 JSON 파일)"""
         memos = {}
@@ -22,6 +30,7 @@ class DataManager:
                         file_path = os.path.join(self.data_dir, filename)
                         with open(file_path, "r", encoding="utf-8") as f:
                             memos[memo_id] = json.load(f)
+                        self._replay_oplog(memo_id, memos[memo_id])
                     except Exception as e:
                         print(f"Error loading memo {filename}: {e}")
         
@@ -48,14 +57,12 @@ class DataManager:
             current_ids = set()
             for memo_id, data in memos.items():
                 current_ids.add(memo_id)
-                file_path = os.path.join(self.data_dir, f"{memo_id}.json")
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=4)
+                self._write_memo_file(memo_id, data)
             
-            # 2. 삭제된 메모 파일 정리
+            # 2. 삭제된 메모 파일 정리 (op 로그 포함)
             if os.path.exists(self.data_dir):
                 for filename in os.listdir(self.data_dir):
-                    if filename.endswith(".json"):
+                    if filename.endswith((".json", ".oplog")):
                         file_id = os.path.splitext(filename)[0]
                         if file_id not in current_ids:
                             os.remove(os.path.join(self.data_dir, filename))
@@ -63,6 +70,99 @@ class DataManager:
         except Exception as e:
             print(f"Error saving data: {e}")
 
+    def save_memo(self, memo_id, data):
+        """메모 한 개만 저장 (해당 메모 파일만 다시 씀), 성공 여부 반환"""
+        try:
+            self._write_memo_file(memo_id, data)
+            return True
+        except Exception as e:
+            print(f"Error saving memo {memo_id}: {e}")
+            return False
+
+    def save_memo_batch(self, updated_memos, deleted_ids=()):
+        """여러 메모의 변경/삭제를 한 번에 반영 (변경된 메모 파일만 다시 씀)"""
+        try:
+            for memo_id, data in updated_memos.items():
+                self._write_memo_file(memo_id, data)
+
+            for memo_id in deleted_ids:
+                file_path = os.path.join(self.data_dir, f"{memo_id}.json")
+                if os.path.exists(file_path):
+                    os.remove(file_path)
+                self._remove_oplog(memo_id)
+        except Exception as e:
+            print(f"Error saving memo batch: {e}")
+
+    def save_memo_delta(self, memo_id, op, data):
+        """메모의 변경분(op)만 op 로그에 추가 (로그가 커지면 전체 파일로 압축), 성공 여부 반환
+
+        data는 op를 적용한 뒤의 메모 데이터 (기록에 성공한 경우에만 리비전 번호가 갱신됨)
+        실패하면 호출하는 쪽에서 전체 파일로 저장해야 함 (op 로그가 저장된 기준과 어긋나지 않도록)
+        """
+        try:
+            op["rev"] = data.get("revision", 0) + 1
+            line = json.dumps(op, ensure_ascii=False) + "\n"
+            with open(self._oplog_path(memo_id), "a", encoding="utf-8") as f:
+                f.write(line)
+        except Exception as e:
+            print(f"Error saving memo delta {memo_id}: {e}")
+            return False
+        data["revision"] = op["rev"]
+
+        stats = self._oplog_stats.setdefault(memo_id, [0, 0])
+        stats[0] += 1
+        stats[1] += len(line)
+        if stats[0] >= COMPACT_OPS or stats[1] >= COMPACT_BYTES:
+            try:
+                self._write_memo_file(memo_id, data)
+            except Exception as e:
+                # 압축에 실패해도 op는 이미 기록됨 (다음 저장에서 다시 압축)
+                print(f"Error compacting memo {memo_id}: {e}")
+        return True
+
+    def _write_memo_file(self, memo_id, data):
+        """메모 데이터를 개별 JSON 파일에 기록 (스냅샷이 최신이 되므로 op 로그 제거)"""
+        file_path = os.path.join(self.data_dir, f"{memo_id}.json")
+        temp_path = file_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+        os.replace(temp_path, file_path)
+        self._remove_oplog(memo_id)
+
+    def _oplog_path(self, memo_id):
+        return os.path.join(self.data_dir, f"{memo_id}.oplog")
+
+    def _remove_oplog(self, memo_id):
+        """op 로그 파일 및 상태 제거"""
+        self._oplog_stats.pop(memo_id, None)
+        log_path = self._oplog_path(memo_id)
+        if os.path.exists(log_path):
+            os.remove(log_path)
+
+    def _replay_oplog(self, memo_id, data):
+        """스냅샷 로드 후 op 로그에 남은 변경분 적용 (중간에 끊긴 마지막 줄은 무시)"""
+        log_path = self._oplog_path(memo_id)
+        if not os.path.exists(log_path):
+            return
+
+        ops = []
+        size = 0
+        torn = False
+        with open(log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    ops.append(json.loads(line))
+                except ValueError:
+                    torn = True
+                    break
+                size += len(line)
+
+        memo_delta.replay(data, ops)
+        self._oplog_stats[memo_id] = [len(ops), size]
+        if torn:
+            # 끊긴 줄 뒤에 새 연산이 추가되지 않도록 바로 스냅샷으로 압축
+            self._write_memo_file(memo_id, data)
+
     def load_settings(self):
         """설정 데이터 로드"""
         if os.path.exists(self.settings_file):
@@ -0,0 +1,145 @@
+"""
+문서 모델 모듈
+Text 위젯 내용을 Python 쪽에 줄 배열로 유지 (변경 추적 이벤트로 동기화)
+일반 텍스트, 글자 수, 줄 수, 특정 줄 조회를 Tcl에서 전체 텍스트를 복사하지 않고 처리
+"""
+
+# 임베드된 이미지/위젯이 차지하는 한 칸 (Tk 인덱스와 열 위치를 맞추기 위함)
+EMBED_PLACEHOLDER = "￼"
+
+
+def _has_astral(text):
+    """BMP 밖 문자(이모지 등) 포함 여부: Tk는 이 문자를 두 칸으로 세어 열 위치가 어긋날 수 있음"""
+    return any(ord(ch) > 0xFFFF for ch in text)
+
+
+class DocumentModel:
+    """줄 단위 문서 모델
+
+    _lines: 줄바꿈을 제외한 각 줄 텍스트 (임베드는 EMBED_PLACEHOLDER)
+    동기화할 수 없는 변경(reset, 이모지가 있는 줄 편집 등)이 오면 무효화하고
+    다음 조회 때 위젯에서 한 번 다시 읽음
+    """
+
+    def __init__(self, text_widget):
+        self.widget = text_widget
+        self._lines = None
+        self._chars = 0  # 임베드를 제외한 글자 수 (줄바꿈 포함)
+        self._embeds = 0
+
+    # --- 동기화 ---
+
+    @property
+    def valid(self):
+        """모델이 위젯과 동기화된 상태인지 여부 (False면 다음 조회 때 다시 읽음)"""
+        return self._lines is not None
+
+    def invalidate(self):
+        """전체 무효화 (다음 조회 때 다시 읽음)"""
+        self._lines = None
+
+    def apply(self, edit):
+        """변경 추적 이벤트(TextEdit)를 모델에 반영"""
+        if self._lines is None or edit.op in ("tag_add", "tag_remove"):
+            return
+        if edit.op == "reset":
+            self.invalidate()
+            return
+
+        try:
+            if edit.op in ("delete", "replace"):
+                self._delete(edit.start, edit.end)
+            if edit.op in ("insert", "replace"):
+                self._insert(edit.start, edit.text)
+            elif edit.op == "embed":
+                self._insert(edit.start, EMBED_PLACEHOLDER)
+        except (IndexError, ValueError):
+            self.invalidate()
+
+    def _check_line(self, line):
+        """열 위치 계산이 안전한 줄인지 확인 (아니면 ValueError)"""
+        if _has_astral(self._lines[line - 1]):
+            raise ValueError("line contains characters outside the BMP")
+
+    def _insert(self, start, text):
+        line, col = start
+        self._check_line(line)
+        if _has_astral(text):
+            raise ValueError("inserted text contains characters outside the BMP")
+
+        current = self._lines[line - 1]
+        new_lines = (current[:col] + text + current[col:]).split("\n")
+        self._lines[line - 1:line] = new_lines
+        self._chars += len(text) - text.count(EMBED_PLACEHOLDER)
+        self._embeds += text.count(EMBED_PLACEHOLDER)
+
+    def _delete(self, start, end):
+        (first, first_col), (last, last_col) = start, end
+        self._check_line(first)
+        self._check_line(last)
+
+        removed_lines = self._lines[first - 1:last]
+        removed = "\n".join(removed_lines)
+        # 삭제되는 텍스트: 첫 줄 first_col부터 마지막 줄 last_col까지
+        offset_end = len(removed) - (len(removed_lines[-1]) - last_col)
+        removed_text = removed[first_col:offset_end]
+
+        self._lines[first - 1:last] = [self._lines[first - 1][:first_col] + self._lines[last - 1][last_col:]]
+        placeholders = removed_text.count(EMBED_PLACEHOLDER)
+        self._chars -= len(removed_text) - placeholders
+        self._embeds -= placeholders
+
+    def _ensure(self):
+        """무효 상태면 위젯 내용을 dump로 다시 읽음 (임베드 위치 포함)"""
+        if self._lines is not None:
+            return
+
+        parts = []
+        for key, value, _ in self.widget.dump("1.0", "end-1c", text=True, image=True, window=True):
+            parts.append(value if key == "text" else EMBED_PLACEHOLDER)
+        text = "".join(parts)
+        self._lines = text.split("\n")
+        self._embeds = text.count(EMBED_PLACEHOLDER)
+        self._chars = len(text) - self._embeds
+
+    # --- 조회 ---
+
+    def line_count(self):
+        """논리적 줄 수"""
+        self._ensure()
+        return len(self._lines)
+
+    def char_count(self):
+        """글자 수 (임베드 제외, 줄바꿈 포함)"""
+        self._ensure()
+        return self._chars
+
+    def line(self, number):
+        """줄 텍스트 (1부터 시작, 임베드 제외)"""
+        self._ensure()
+        return self._lines[number - 1].replace(EMBED_PLACEHOLDER, "")
+
+    def raw_line(self, number):
+        """줄 텍스트 (임베드 자리 EMBED_PLACEHOLDER 포함, 열 위치가 Tk 인덱스와 같음)"""
+        self._ensure()
+        return self._lines[number - 1]
+
+    def lines(self):
+        """모든 줄 (임베드 제외)"""
+        self._ensure()
+        if not self._embeds:
+            return list(self._lines)
+        return [line.replace(EMBED_PLACEHOLDER, "") for line in self._lines]
+
+    def plain_text(self):
+        """일반 텍스트 (textbox.get("1.0", "end-1c")와 동일)"""
+        self._ensure()
+        text = "\n".join(self._lines)
+        return text.replace(EMBED_PLACEHOLDER, "") if self._embeds else text
+
+    def iter_lines(self):
+        """줄을 앞에서부터 하나씩 반환 (임베드 제외, 필요한 만큼만 읽을 때 사용)"""
+        self._ensure()
+        lines = self._lines
+        for line in lines:
+            yield line.replace(EMBED_PLACEHOLDER, "") if self._embeds else line
@@ -0,0 +1,107 @@
+"""
+에디터 뷰 캐시 모듈
+최근에 연 메모의 Text 위젯(그림판, 표, 이미지 포함)을 숨긴 채 유지하여
+메모를 다시 열 때 내용을 다시 만들지 않고 그대로 표시
+"""
+
+from collections import OrderedDict
+
+from line_cache import LineCache
+
+DEFAULT_MAX_VIEWS = 2  # 숨긴 채 유지할 뷰 수 (0이면 사용 안 함)
+DEFAULT_BUDGET_MB = 64  # 숨긴 뷰 전체의 추정 메모리 한도
+
+# 메모리 추정치 (정확한 값이 아닌 상대적인 크기 비교용)
+BYTES_PER_CHAR = 20  # Tk 텍스트 B-tree 및 태그 정보 포함
+BYTES_PER_PIXEL = 4
+PAINT_LAYERS = 2  # 그림판은 캔버스 외에 레이어 이미지를 가짐
+TABLE_BYTES = 64 * 1024
+
+
+class EditorView:
+    """메모 하나를 표시하는 에디터 뷰 (Text 위젯과 그 위젯에 딸린 상태)"""
+
+    # 활성 뷰일 때 MemoApp 속성으로 옮겨지는 상태
+    STATE = ("textbox", "text_tracker", "tag_registry", "document", "text_stats",
+             "outline", "undo_manager", "highlighter", "_segment_cache", "_content_cache",
+             "_plain_text_cache", "images", "medias", "paint_frames", "table_widgets")
+
+    def __init__(self, textbox, text_tracker, tag_registry, document, text_stats, outline, undo_manager,
+                 highlighter):
+        self.memo_id = None  # 표시 중인 메모 (새 메모면 None)
+        self.source = None  # 뷰를 만든 rich_content 객체 (그 사이 메모가 바뀌었는지 확인용)
+        self.saved_lines = None  # (memo_id, 마지막으로 저장한 줄 목록) 차분 저장 기준
+
+        self.textbox = textbox
+        self.text_tracker = text_tracker
+        self.tag_registry = tag_registry
+        self.document = document
+        self.text_stats = text_stats
+        self.outline = outline
+        self.undo_manager = undo_manager
+        self.highlighter = highlighter
+        self._segment_cache = LineCache()
+        self._content_cache = None
+        self._plain_text_cache = None
+        self.images = {}
+        self.medias = {}
+        self.paint_frames = []
+        self.table_widgets = []
+
+    def estimate_bytes(self, text_length):
+        """뷰가 차지하는 메모리 추정"""
+        total = text_length * BYTES_PER_CHAR
+        for data in list(self.images.values()) + list(self.medias.values()):
+            total += (data.get('display_width') or 0) * (data.get('display_height') or 0) * BYTES_PER_PIXEL
+        for paint_frame in self.paint_frames:
+            total += paint_frame.canvas_width * paint_frame.canvas_height * BYTES_PER_PIXEL * PAINT_LAYERS
+        total += len(self.table_widgets) * TABLE_BYTES
+        return total
+
+    def destroy(self):
+        """위젯과 참조 정리"""
+        self.textbox.destroy()
+        self.text_tracker.detach()
+        self.images.clear()
+        self.medias.clear()
+        self.paint_frames.clear()
+        self.table_widgets.clear()
+
+
+class EditorViewCache:
+    """숨긴 에디터 뷰의 LRU 캐시 (뷰 수와 추정 메모리 한도 적용)"""
+
+    def __init__(self, max_views=DEFAULT_MAX_VIEWS, budget_mb=DEFAULT_BUDGET_MB):
+        self.max_views = max_views
+        self.budget_mb = budget_mb
+        self._views = OrderedDict()  # memo_id → (뷰, 추정 바이트)
+
+    @property
+    def enabled(self):
+        return self.max_views > 0
+
+    def take(self, memo_id):
+        """캐시에서 뷰를 꺼냄 (없으면 None)"""
+        entry = self._views.pop(memo_id, None)
+        return entry[0] if entry else None
+
+    def put(self, view, size):
+        """뷰를 보관하고 한도를 넘어 밀려난 뷰 목록 반환 (호출자가 destroy)"""
+        self._views[view.memo_id] = (view, size)
+        self._views.move_to_end(view.memo_id)
+
+        evicted = []
+        budget = self.budget_mb * 1024 * 1024
+        while self._views and (len(self._views) > self.max_views or self._total_bytes() > budget):
+            _, (old_view, _) = self._views.popitem(last=False)
+            evicted.append(old_view)
+        return evicted
+
+    def clear(self):
+        """모든 뷰를 꺼냄"""
+        views = [view for view, _ in self._views.values()]
+        self._views.clear()
+        return views
+
+    def _total_bytes(self):
+        return sum(size for _, size in self._views.values())
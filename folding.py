@@ -0,0 +1,65 @@
+"""
+줄 접기 모듈
+들여쓰기 블록과 마크다운식 제목(#) 구간을 접을 수 있는 범위로 계산
+접힌 줄은 FOLD_TAG(elide) 태그로 숨기며, 이 태그는 화면 상태이므로 저장하지 않음
+"""
+
+from text_utils import heading_level
+
+FOLD_TAG = "fold"
+TAB_WIDTH = 4
+
+
+def indent_width(text):
+    """줄의 들여쓰기 폭 (탭은 TAB_WIDTH칸)"""
+    width = 0
+    for ch in text:
+        if ch == " ":
+            width += 1
+        elif ch == "\t":
+            width += TAB_WIDTH
+        else:
+            break
+    return width
+
+
+def _ends_block(text, base_indent, level):
+    """text 줄이 접기 블록 밖인지 여부 (공백 줄은 판단하지 않음)"""
+    if level:
+        other = heading_level(text)
+        return 0 < other <= level
+    return indent_width(text) <= base_indent
+
+
+def is_foldable(document, line):
+    """line 아래에 접을 수 있는 줄이 있는지 (다음 공백 아닌 줄만 확인)"""
+    text = document.line(line)
+    if not text.strip():
+        return False
+
+    level = heading_level(text)
+    base = indent_width(text)
+    for number in range(line + 1, document.line_count() + 1):
+        following = document.line(number)
+        if following.strip():
+            return not _ends_block(following, base, level)
+    return False
+
+
+def fold_end(document, line):
+    """line을 접을 때 숨길 마지막 줄 (끝의 공백 줄 제외, 접을 줄이 없으면 None)"""
+    text = document.line(line)
+    if not text.strip():
+        return None
+
+    level = heading_level(text)
+    base = indent_width(text)
+    end = None
+    for number in range(line + 1, document.line_count() + 1):
+        following = document.line(number)
+        if not following.strip():
+            continue
+        if _ends_block(following, base, level):
+            break
+        end = number
+    return end
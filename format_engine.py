@@ -0,0 +1,160 @@
+"""
+서식 적용 엔진 모듈
+선택 영역의 dump 한 번으로 태그 구간을 Python에서 계산하고,
+바꿀 태그별로 여러 구간을 모아 한 번의 tag add/remove 호출로 적용할 수 있게 함
+"""
+
+from text_tracker import parse_index
+
+# 폰트 태그가 없는 텍스트의 기본 폰트
+DEFAULT_FONT = {"family": "Roboto Medium", "size": 16, "weight": "normal", "slant": "roman"}
+
+
+def font_tag_name(family, size, weight, slant):
+    """폰트 속성 조합에 해당하는 태그 이름 (f|Family|Size|Weight|Slant)"""
+    return f"f|{family}|{size}|{weight}|{slant}"
+
+
+def parse_font_tag(tag):
+    """태그 이름에서 폰트 속성 추출 (폰트 태그가 아니면 None)"""
+    if tag.startswith("f|"):
+        parts = tag.split("|")
+        if len(parts) == 5:
+            return {"family": parts[1], "size": int(parts[2]), "weight": parts[3], "slant": parts[4]}
+    return None
+
+
+class InputTags(set):
+    """현재 입력 서식 태그 집합
+
+    키 입력마다 insert에 넘길 튜플을 다시 만들지 않도록, 집합이 바뀔 때만 튜플을 새로 계산
+    """
+
+    def __init__(self, tags=()):
+        super().__init__(tags)
+        self._tuple = None
+
+    def as_tuple(self):
+        if self._tuple is None:
+            self._tuple = tuple(self)
+        return self._tuple
+
+    def add(self, tag):
+        self._tuple = None
+        super().add(tag)
+
+    def discard(self, tag):
+        self._tuple = None
+        super().discard(tag)
+
+    def remove(self, tag):
+        self._tuple = None
+        super().remove(tag)
+
+    def clear(self):
+        self._tuple = None
+        super().clear()
+
+    def update(self, *others):
+        self._tuple = None
+        super().update(*others)
+
+    def difference_update(self, *others):
+        self._tuple = None
+        super().difference_update(*others)
+
+    def intersection_update(self, *others):
+        self._tuple = None
+        super().intersection_update(*others)
+
+    def symmetric_difference_update(self, other):
+        self._tuple = None
+        super().symmetric_difference_update(other)
+
+    def pop(self):
+        self._tuple = None
+        return super().pop()
+
+    # 복합 대입 연산자(|=, -=, &=, ^=)도 집합을 제자리에서 바꾸므로 튜플 무효화
+    def __ior__(self, other):
+        self._tuple = None
+        return super().__ior__(other)
+
+    def __isub__(self, other):
+        self._tuple = None
+        return super().__isub__(other)
+
+    def __iand__(self, other):
+        self._tuple = None
+        return super().__iand__(other)
+
+    def __ixor__(self, other):
+        self._tuple = None
+        return super().__ixor__(other)
+
+
+def tag_segments(dump_data, start, end, initial_tags):
+    """dump 결과를 태그 집합이 같은 (시작, 끝, 태그 집합) 구간 목록으로 변환
+
+    dump가 반환하는 인덱스는 정규화된 "줄.열" 문자열이므로 Tk compare 없이 비교
+    """
+    segments = []
+    current = start
+    tags = set(initial_tags)
+    tags.discard("sel")
+
+    for key, value, index in dump_data:
+        if index != current:
+            segments.append((current, index, frozenset(tags)))
+            current = index
+        if value == "sel":
+            continue
+        if key == "tagon":
+            tags.add(value)
+        elif key == "tagoff":
+            tags.discard(value)
+
+    if parse_index(current) < parse_index(end):
+        segments.append((current, end, frozenset(tags)))
+    return segments
+
+
+def _add_range(ranges, tag, start, end):
+    """태그별 구간 목록에 추가 (이전 구간과 이어지면 합침)"""
+    tag_ranges = ranges.setdefault(tag, [])
+    if tag_ranges and tag_ranges[-1] == start:
+        tag_ranges[-1] = end
+    else:
+        tag_ranges.extend((start, end))
+
+
+def plan_font_change(segments, attr, value):
+    """각 구간의 폰트 속성 하나를 바꾸는 데 필요한 태그 변경 계산
+
+    반환값: (제거할 {태그: [시작, 끝, ...]}, 추가할 {태그: [시작, 끝, ...]})
+    """
+    removals = {}
+    additions = {}
+    for start, end, tags in segments:
+        font_info = dict(DEFAULT_FONT)
+        old_tag = None
+        for tag in tags:
+            parsed = parse_font_tag(tag)
+            if parsed:
+                font_info = parsed
+                old_tag = tag
+                break
+
+        if attr == "size":
+            font_info["size"] = int(value)
+        else:
+            font_info[attr] = value
+
+        new_tag = font_tag_name(font_info["family"], font_info["size"], font_info["weight"], font_info["slant"])
+        if new_tag == old_tag:
+            continue
+        if old_tag:
+            _add_range(removals, old_tag, start, end)
+        _add_range(additions, new_tag, start, end)
+
+    return removals, additions
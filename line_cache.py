@@ -0,0 +1,75 @@
+"""
+줄 단위 캐시 모듈
+문서의 각 줄에 대응하는 값을 보관하고, 편집된 줄 범위만 무효화(None)하여
+다음 계산 때 바뀐 줄만 다시 구할 수 있게 함
+"""
+
+
+class LineCache:
+    """줄 번호(1부터 시작)로 접근하는 캐시
+
+    _lines가 None이면 전체가 무효인 상태 (처음 또는 reset 이후)
+    """
+
+    def __init__(self):
+        self._lines = None
+
+    @property
+    def valid(self):
+        """캐시가 초기화되어 있는지 여부"""
+        return self._lines is not None
+
+    def __len__(self):
+        return len(self._lines) if self._lines is not None else 0
+
+    def reset(self):
+        """전체 무효화"""
+        self._lines = None
+
+    def ensure(self, line_count):
+        """줄 수가 맞지 않으면(외부 변경 누락 등) 전체를 무효 줄로 다시 만듦"""
+        if self._lines is None or len(self._lines) != line_count:
+            self._lines = [None] * line_count
+
+    def splice(self, first_line, old_last, new_last):
+        """first_line~old_last 줄이 first_line~new_last 줄로 바뀌었음을 반영 (해당 줄은 무효)"""
+        if self._lines is None:
+            return
+
+        start = first_line - 1
+        if start < 0 or start >= len(self._lines) or old_last < first_line:
+            self._lines = None
+            return
+
+        end = min(old_last, len(self._lines))
+        self._lines[start:end] = [None] * (new_last - first_line + 1)
+
+    def dirty_runs(self):
+        """무효 줄의 연속 구간을 (첫 줄, 마지막 줄) 목록으로 반환"""
+        runs = []
+        run_start = None
+        for index, value in enumerate(self._lines or ()):
+            if value is None:
+                if run_start is None:
+                    run_start = index + 1
+            elif run_start is not None:
+                runs.append((run_start, index))
+                run_start = None
+        if run_start is not None:
+            runs.append((run_start, len(self._lines)))
+        return runs
+
+    def store(self, first_line, values):
+        """first_line부터 순서대로 값 저장"""
+        start = first_line - 1
+        self._lines[start:start + len(values)] = values
+
+    def get(self, line):
+        """줄 값 반환 (무효거나 범위 밖이면 None)"""
+        if self._lines is None or not 1 <= line <= len(self._lines):
+            return None
+        return self._lines[line - 1]
+
+    def values(self):
+        """모든 줄 값 (무효 줄은 None)"""
+        return list(self._lines or ())
@@ -0,0 +1,96 @@
+"""
+메모 차분 저장 모듈
+rich_content를 줄 단위로 나누어 마지막 저장 이후 바뀐 줄 구간만 연산(op)으로 만들고,
+저장된 연산을 스냅샷에 다시 적용하여 메모를 복원
+"""
+
+# 연산 형식: {"rev": 리비전, "line": 시작 줄(0부터), "remove": 지울 줄 수,
+#            "insert": [줄 세그먼트 목록, ...], "meta": {"title", "timestamp", "preview", "checklist"}}
+META_FIELDS = ("title", "timestamp", "preview", "checklist")
+
+
+def split_lines(rich_content):
+    """세그먼트 목록을 줄 단위 세그먼트 목록으로 분할 (줄바꿈으로 끝나는 텍스트가 줄의 끝)"""
+    lines = []
+    line = []
+    for segment in rich_content:
+        text = segment.get("text") if not segment.get("type") else None
+        if text is None:
+            line.append(segment)
+            continue
+
+        # 태그는 정렬해서 비교 (이전에 저장된 태그 순서와 무관하게 같은 줄은 같게)
+        tags = sorted(segment.get("tags", []))
+        if "\n" not in text:
+            if text:
+                line.append({"text": text, "tags": tags})
+            continue
+
+        pieces = text.split("\n")
+        for piece in pieces[:-1]:
+            line.append({"text": piece + "\n", "tags": list(tags)})
+            lines.append(line)
+            line = []
+        if pieces[-1]:
+            line.append({"text": pieces[-1], "tags": list(tags)})
+
+    lines.append(line)
+    return lines
+
+
+def join_lines(lines):
+    """줄 단위 세그먼트 목록을 하나의 세그먼트 목록으로 합침"""
+    return [segment for line in lines for segment in line]
+
+
+def plain_text(rich_content):
+    """세그먼트 목록의 텍스트만 이어 붙임 (에디터의 일반 텍스트와 동일)"""
+    return "".join(segment.get("text", "") for segment in rich_content if not segment.get("type"))
+
+
+def _same_line(a, b):
+    return a is b or a == b
+
+
+def diff_lines(old_lines, new_lines):
+    """두 줄 목록의 앞뒤 공통 부분을 제외한 변경 구간 (시작 줄, 지울 줄 수, 새 줄 목록)"""
+    limit = min(len(old_lines), len(new_lines))
+    start = 0
+    while start < limit and _same_line(old_lines[start], new_lines[start]):
+        start += 1
+
+    old_end, new_end = len(old_lines), len(new_lines)
+    while old_end > start and new_end > start and _same_line(old_lines[old_end - 1], new_lines[new_end - 1]):
+        old_end -= 1
+        new_end -= 1
+
+    return start, old_end - start, new_lines[start:new_end]
+
+
+def make_op(old_lines, new_lines, data):
+    """마지막 저장 상태에서 현재 상태로 가는 연산 생성"""
+    start, remove, insert = diff_lines(old_lines, new_lines)
+    return {
+        "line": start,
+        "remove": remove,
+        "insert": insert,
+        "meta": {field: data[field] for field in META_FIELDS if field in data},
+    }
+
+
+def replay(data, ops):
+    """스냅샷 데이터에 연산을 순서대로 적용 (이미 스냅샷에 포함된 리비전은 건너뜀)"""
+    ops = [op for op in ops if op.get("rev", 0) > data.get("revision", 0)]
+    if not ops:
+        return data
+
+    lines = split_lines(data.get("rich_content") or [])
+    for op in ops:
+        start = op["line"]
+        lines[start:start + op["remove"]] = op["insert"]
+        data.update(op.get("meta", {}))
+        data["revision"] = op["rev"]
+
+    data["rich_content"] = join_lines(lines)
+    data["content"] = plain_text(data["rich_content"]).strip()
+    return data
@@ -0,0 +1,72 @@
+"""
+메모 로드 계획 모듈
+rich_content 세그먼트를 에디터 삽입 단계 목록으로 변환
+(같은 태그의 연속 텍스트는 한 번에 삽입, 너무 긴 텍스트는 줄 경계에서 분할)
+"""
+
+from collections import namedtuple
+
+FIRST_SCREEN_CHARS = 4000  # 즉시 삽입할 첫 화면 분량 (문자 수)
+MAX_TEXT_STEP = 16000  # 삽입 한 번에 넣을 최대 텍스트 길이
+CHUNK_BUDGET_MS = 12  # 이후 청크 하나에 사용할 최대 시간 (밀리초)
+
+# steps: [("text", 텍스트, 태그 튜플) 또는 ("embed", 세그먼트), ...]
+# tags: 메모에 사용된 모든 태그 (로드 전에 한 번씩만 설정)
+# first_screen: 즉시 삽입할 앞쪽 단계 수
+LoadPlan = namedtuple("LoadPlan", "steps tags first_screen")
+
+
+def split_text(text, limit=MAX_TEXT_STEP):
+    """긴 텍스트를 가능하면 줄 경계에서 limit 이하 조각으로 분할"""
+    while len(text) > limit:
+        cut = text.rfind("\n", 0, limit) + 1
+        if cut <= 0:
+            cut = limit
+        yield text[:cut]
+        text = text[cut:]
+    if text:
+        yield text
+
+
+def build_load_plan(rich_content):
+    """rich_content를 삽입 단계 목록으로 변환"""
+    steps = []
+    tags = set()
+    pending = []  # 병합 중인 텍스트 조각
+    pending_tags = None  # 병합 중인 태그 튜플
+
+    def flush():
+        if pending:
+            for piece in split_text("".join(pending)):
+                steps.append(("text", piece, pending_tags))
+            pending.clear()
+
+    for segment in rich_content:
+        if segment.get("type"):
+            flush()
+            steps.append(("embed", segment))
+            continue
+
+        text = segment.get("text", "")
+        if not text:
+            continue
+        segment_tags = tuple(segment.get("tags", []))
+        # 태그 순서만 다른 세그먼트도 같은 서식이므로 병합
+        if pending and set(segment_tags) != set(pending_tags):
+            flush()
+        if not pending:
+            pending_tags = segment_tags
+            tags.update(segment_tags)
+        pending.append(text)
+    flush()
+
+    # 첫 화면 분량까지의 단계 수 계산
+    first_screen = 0
+    chars = 0
+    for step in steps:
+        if chars >= FIRST_SCREEN_CHARS:
+            break
+        chars += len(step[1]) if step[0] == "text" else 1
+        first_screen += 1
+
+    return LoadPlan(steps, tags, first_screen)
@@ -4,6 +4,7 @@ import sys
 import uuid
 import hashlib
 import logging
+import time
 from datetime import datetime
 import tkinter
 import tkinter.font as tkfont
@@ -14,7 +15,28 @@ import exporter  # 내보내기 모듈 임포트
 import dialogs  # 다이얼로그 모듈 임포트
 from paint_app import PaintFrame # 그림판 모듈 임포트
 from table_widget import TableWidget # 표 위젯 모듈 임포트
+import attachment_block  # 첨부 텍스트 블록 모듈 임포트
+from attachment_block import AttachmentBlock
 from ui_colors import UI_COLORS, PASTEL_COLORS, MEMO_LIST_COLORS # 색상 팔레트 임포트
+import sidebar_groups  # 사이드바 섹션 분류 모듈 임포트
+import ordering  # 고정 메모 순서 키 모듈 임포트
+from sidebar_rows import MemoRowState  # 사이드바 행 상태 모듈 임포트
+import text_utils  # 메모 텍스트 유틸리티 모듈 임포트
+from text_tracker import TextChangeTracker  # 텍스트 변경 추적 모듈 임포트
+import memo_loader  # 메모 로드 계획 모듈 임포트
+from tag_registry import TagRegistry  # 동적 태그 등록 모듈 임포트
+import prefetch  # 메모 미리 준비 모듈 임포트
+import memo_delta  # 메모 차분 저장 모듈 임포트
+from autosave import AdaptiveDebouncer  # 자동 저장 스케줄러 모듈 임포트
+import format_engine  # 서식 적용 엔진 모듈 임포트
+from editor_views import EditorView, EditorViewCache  # 에디터 뷰 캐시 모듈 임포트
+from document_model import DocumentModel  # 문서 모델 모듈 임포트
+from text_stats import TextStats  # 텍스트 통계 모듈 임포트
+import outline  # 메모 목차 모듈 임포트
+from undo_manager import UndoManager  # 실행 취소 관리 모듈 임포트
+from line_cache import LineCache  # 줄 단위 캐시 모듈 임포트
+import folding  # 줄 접기 모듈 임포트
+from syntax_highlight import SyntaxHighlighter, TAG_PREFIX as HIGHLIGHT_TAG_PREFIX  # 코드 블록 구문 강조 모듈 임포트
 
 # 로깅 설정
 logging.basicConfig(
@@ -23,29 +45,224 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 점진적 메모 로드 시 나머지 내용을 삽입할 위치 표시 (오른쪽 gravity)
+LOAD_MARK = "memo_load"
+# 큰 붙여넣기를 나눠 삽입할 위치 표시 (오른쪽 gravity)
+PASTE_MARK = "large_paste"
+
+# 이 글자 수 이상의 붙여넣기는 나눠서 삽입하거나 첨부 블록으로 저장
+LARGE_PASTE_CHARS = 100_000
+
+# 한글 IME 입력 중 keysym이 ??로 오는 단축키의 macOS keycode (실제 측정값)
+MAC_IME_SHORTCUT_KEYCODES = {
+    # 서식
+    184549474: 'b',  # Bold
+    570425449: 'i',  # Italic
+    536871029: 'u',  # Underline
+    # 편집
+    97: 'a',         # Select All (한글 모드에서 keycode가 작음)
+    134217827: 'c',  # Copy
+    150995062: 'v',  # Paste
+    117440632: 'x',  # Cut
+    100663418: 'z',  # Undo
+    # 기타
+    50331750: 'f',   # Find
+}
+
+# 목차 패널에 표시할 최대 항목 수
+OUTLINE_MAX_ROWS = 200
+
+# 키 입력 처리에서 무시할 문자 (특수 키, Backspace, Delete)
+IGNORED_KEY_CHARS = frozenset(("", "\x08", "\x7f"))
+# 수동 서식 모드를 해제하는 단어/문단 구분 문자
+FORMAT_BREAK_CHARS = frozenset(" \n\r\t")
+
+# 선택 영역·접기·IME 조합처럼 화면 상태만 나타내는 태그 (저장, 입력 서식, 실행 취소 기록에서 제외)
+TRANSIENT_TAGS = frozenset(("sel", folding.FOLD_TAG, "IMEmarkedtext"))
+
+
+def is_transient_tag(tag):
+    """화면 상태 태그 여부 (TRANSIENT_TAGS와 hl_로 시작하는 구문 강조 태그)"""
+    return tag in TRANSIENT_TAGS or tag.startswith(HIGHLIGHT_TAG_PREFIX)
+
+
 # --- 줄 번호 위젯 ---
 class LineNumbers(tkinter.Canvas):
+    """줄 번호 캔버스
+
+    줄별 화면 높이(자동 줄바꿈 포함)를 캐시하여 편집된 줄만 다시 측정하고,
+    텍스트 항목을 풀로 유지하여 바뀐 항목만 이동/변경함
+    첫 화면 줄·줄 높이·편집 세대가 그대로면 다시 그리지 않음
+    """
+
+    NUMBER_X = 40
+    MARKER_X = 49
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.text_widget = None
-
-    def attach(self, text_widget):
+        self.text_tracker = None
+        self.document = None
+        self.relative = False  # 커서 줄 기준 상대 줄 번호 표시
+        self.on_fold = None  # 접기 표시 클릭 시 호출 (줄 번호)
+        self._heights = LineCache()  # 줄별 화면 높이 (픽셀, 접힌 줄은 0)
+        self._width = None  # 높이를 잰 위젯 폭 (바뀌면 줄바꿈이 달라지므로 전체 무효화)
+        self._numbers = ([], [])  # (항목 ID 목록, 항목별 표시 중인 (텍스트, y))
+        self._markers = ([], [])
+        self._positions = []  # 마지막으로 그린 (줄 번호, y)
+        self._last_key = None
+        self.bind("<Button-1>", self._on_click)
+
+    def attach(self, text_widget, text_tracker=None, document=None):
+        if self.text_tracker is not None:
+            self.text_tracker.remove_listener(self._on_text_edit)
         self.text_widget = text_widget
+        self.text_tracker = text_tracker
+        self.document = document
+        self._heights.reset()
+        self._last_key = None
+        if text_tracker is not None:
+            text_tracker.add_listener(self._on_text_edit)
+
+    def invalidate(self):
+        """다음 redraw에서 반드시 다시 그리도록 표시 (줄 높이도 다시 측정)"""
+        self._heights.reset()
+        self._last_key = None
+
+    def _on_text_edit(self, edit):
+        """편집된 줄의 높이만 무효화 (서식 변경도 높이를 바꿀 수 있음)"""
+        if edit.op == "reset":
+            self._heights.reset()
+        else:
+            self._heights.splice(edit.first_line, edit.old_last, edit.new_last)
+
+    def _view_key(self):
+        """화면 상태 요약: 같으면 줄 번호 배치도 같음"""
+        widget = self.text_widget
+        height = widget.winfo_height()
+        first = widget.index("@0,0")
+        last = widget.index(f"@0,{height}")
+        return (
+            first, widget.dlineinfo(first), last, widget.dlineinfo(last),
+            widget.winfo_width(), height,
+            self.text_tracker.generation if self.text_tracker else None,
+            widget.index("insert").split(".")[0] if self.relative else None,
+        )
+
+    def _ypixels(self, start, end):
+        """start~end 사이의 화면 높이 (픽셀)"""
+        widget = self.text_widget
+        return int(widget.tk.call(widget._w, "count", "-ypixels", start, end) or 0)
+
+    def _line_height(self, line):
+        height = self._heights.get(line)
+        if height is None:
+            height = self._ypixels(f"{line}.0", f"{line + 1}.0")
+            self._heights.store(line, [height])
+        return height
 
     def redraw(self, *args):
         """줄 번호 다시 그리기"""
-        self.delete("all")
         if not self.text_widget:
+            self._positions = []
+            self._sync(self._numbers, [], self.NUMBER_X, ("Roboto Medium", 14))
+            self._sync(self._markers, [], self.MARKER_X, ("Roboto Medium", 10))
             return
 
-        i = self.text_widget.index("@0,0")
-        while True:
-            dline = self.text_widget.dlineinfo(i)
-            if dline is None: break
-            y = dline[1]
-            linenum = str(i).split(".")[0]
-            self.create_text(40, y, anchor="ne", text=linenum, fill="#7F7F7F", font=("Roboto Medium", 14))
-            i = self.text_widget.index(f"{i}+1line")
+        key = self._view_key()
+        if key == self._last_key:
+            return
+        self._last_key = key
+
+        widget = self.text_widget
+        width = key[4]
+        if width != self._width:
+            self._heights.reset()
+            self._width = width
+        last_line = int(widget.index("end-1c").split(".")[0])
+        self._heights.ensure(last_line)
+
+        positions = self._layout(key[0], key[1], last_line, key[5])
+        # 임베드 위젯 크기 변경 등 추적되지 않은 높이 변화 확인: 마지막 줄 위치가 다르면 다시 측정
+        if len(positions) > 1:
+            line, y = positions[-1]
+            dline = widget.dlineinfo(f"{line}.0")
+            if dline is not None and dline[1] != y:
+                self._heights.reset()
+                self._heights.ensure(last_line)
+                positions = self._layout(key[0], key[1], last_line, key[5])
+        self._positions = positions
+
+        cursor = int(widget.index("insert").split(".")[0]) if self.relative else None
+        numbers = []
+        markers = []
+        folded = self._folded_lines()
+        for line, y in positions:
+            label = line if cursor is None or line == cursor else abs(line - cursor)
+            numbers.append((str(label), y))
+            if line in folded:
+                markers.append(("▸", y))
+            elif self.document is not None and folding.is_foldable(self.document, line):
+                markers.append(("▾", y))
+        self._sync(self._numbers, numbers, self.NUMBER_X, ("Roboto Medium", 14))
+        self._sync(self._markers, markers, self.MARKER_X, ("Roboto Medium", 10))
+
+    def _layout(self, first, first_dline, last_line, height):
+        """화면에 보이는 줄의 (줄 번호, y) 목록 (캐시된 줄 높이로 누적 계산)"""
+        if first_dline is None:
+            return []
+
+        line = int(first.split(".")[0])
+        positions = [(line, first_dline[1])]
+        # 첫 줄은 화면 위로 잘린 부분을 제외한 나머지 높이
+        y = first_dline[1] + self._ypixels(first, f"{line + 1}.0")
+        line += 1
+        while line <= last_line and y < height:
+            line_height = self._line_height(line)
+            if line_height:  # 접혀서 숨은 줄은 번호 없음
+                positions.append((line, y))
+            y += line_height
+            line += 1
+        return positions
+
+    def _folded_lines(self):
+        """접힌 구간 바로 위 줄(접기 표시를 그릴 줄) 집합"""
+        ranges = self.text_widget.tag_ranges(folding.FOLD_TAG)
+        return {int(str(start).split(".")[0]) - 1 for start in ranges[::2]}
+
+    def _sync(self, pool, entries, x, font):
+        """(텍스트, y) 목록대로 풀의 항목 배치 (남는 항목은 숨김)"""
+        items, shown = pool
+        for slot, entry in enumerate(entries):
+            if slot == len(items):
+                items.append(self.create_text(x, 0, anchor="ne", fill="#7F7F7F", font=font))
+                shown.append(None)
+            previous = shown[slot]
+            if previous == entry:
+                continue
+
+            item = items[slot]
+            if previous is None:
+                self.itemconfigure(item, state="normal")
+            if previous is None or previous[0] != entry[0]:
+                self.itemconfigure(item, text=entry[0])
+            if previous is None or previous[1] != entry[1]:
+                self.coords(item, x, entry[1])
+            shown[slot] = entry
+
+        for slot in range(len(entries), len(items)):
+            if shown[slot] is not None:
+                self.itemconfigure(items[slot], state="hidden")
+                shown[slot] = None
+
+    def _on_click(self, event):
+        """접기 표시 영역 클릭: 해당 줄 접기/펼치기"""
+        if self.on_fold is None or event.x < self.NUMBER_X:
+            return
+        for line, y in reversed(self._positions):
+            if y <= event.y:
+                self.on_fold(line)
+                return
 
 # 설정
 ctk.set_appearance_mode("Dark")  # 모드: "System" (standard), "Dark", "Light"
@@ -84,15 +301,34 @@ class MemoApp(ctk.CTk):
         # 플랫폼 감지 (단축키에 사용)
         import platform
         self._platform = platform.system().lower()
+        self._ime_shortcuts = self._build_ime_shortcuts()  # 한글 IME 단축키 keycode 테이블
 
         # 데이터 초기화
         self.memos = {}  # {uuid: {title, content, timestamp, tags, pinned, locked, password}}
         self.current_memo_id = None
-        self.save_timer = None
-        self.ui_update_timer = None  # UI 업데이트 디바운싱용
+        # 자동 저장 및 UI 업데이트 디바운싱 (메모별 실제 실행 시간에 맞춰 지연 조절)
+        # IME 조합 중이거나 메모를 나눠 로드하는 중에는 저장을 미룸
+        self.save_scheduler = AdaptiveDebouncer(
+            self, self._process_save, min_delay=500, max_delay=3000, max_latency=5000,
+            key=lambda: self.current_memo_id,
+            should_defer=lambda: self._memo_load is not None or self._paste_job is not None or self._ime_composing()
+        )
+        self.ui_scheduler = AdaptiveDebouncer(
+            self, self._update_ui_elements, min_delay=100, max_delay=500, max_latency=1000,
+            cost_factor=5, key=lambda: self.current_memo_id,
+            should_defer=self._ime_composing
+        )
         self.paint_frames = [] # PaintFrame 객체 참조 유지용 리스트
         self.table_widgets = [] # TableWidget 객체 참조 유지용 리스트
-        self._content_cache = None  # 직렬화 캐시
+        self._content_cache = None  # 직렬화 캐시 (편집 세대 번호로 검증)
+        self._plain_text_cache = None  # 일반 텍스트 캐시 (편집 세대 번호로 검증)
+        self._memo_load = None  # 진행 중인 점진적 메모 로드 상태
+        self._paste_job = None  # 진행 중인 큰 붙여넣기 상태
+        self.title_policy = text_utils.DEFAULT_TITLE_POLICY  # 자동 제목 정책
+        self.prefetcher = prefetch.MemoPrefetcher()  # 다음에 열 메모 미리 준비
+        self._recent_memo_ids = []  # 최근 연 메모 ID (최근 순)
+        self._prefetch_timer = None
+        self._prefetch_queue = []  # 유휴 시간에 준비할 메모 ID
 
         # 데이터 매니저 초기화
         self.data_manager = DataManager(DATA_FILE, SETTINGS_FILE)
@@ -100,12 +336,19 @@ class MemoApp(ctk.CTk):
         self.memo_buttons = {}  # 메모 ID별 버튼 저장 (색상 업데이트용)
         self.search_mode = False  # 검색 모드 여부
         self.pin_filter_active = False  # 고정된 메모만 보기 필터 상태
+        self.sidebar_group_mode = "date"  # 사이드바 그룹 방식 ("date" 또는 "tag")
+        self.sidebar_expanded = {}  # 섹션 키별 펼침 상태 (사용자가 변경한 것만)
+        self._sidebar_sections = {}  # 섹션 키별 위젯 및 메모 목록
+        self._memo_section = {}  # 메모 ID별 표시 중인 섹션 키
+        self.selected_memo_ids = set()  # 사이드바 다중 선택된 메모 ID
+        self._selection_anchor = None  # Shift 범위 선택 기준 메모 ID
         self.load_memos()
 
         # 현재 입력 서식 상태 추적
         self.drag_data = {"id": None, "start_y": 0, "is_dragging": False, "was_dragging": False}  # 드래그 상태 데이터
-        self._configured_font_tags = set()  # 최적화: 이미 설정된 폰트 태그 캐싱
-        self.current_input_tags = set()  # 커서 위치에서 적용할 태그들
+        self._drop_indicator = None  # 드래그 중 삽입 위치 미리보기 막대
+        self._drop_target = None  # 미리보기 중인 삽입 위치 (앞에 놓일 메모 ID, None이면 맨 끝)
+        self.current_input_tags = format_engine.InputTags()  # 커서 위치에서 적용할 태그들
         self.manual_format_mode = False  # 사용자가 수동으로 서식을 설정했는지 여부
         self.always_on_top = False  # 창 고정 상태
 
@@ -171,7 +414,20 @@ class MemoApp(ctk.CTk):
             hover_color="#FFB74D",
             text_color="white"
         )
-        self.pin_filter_button.grid(row=0, column=1)
+        self.pin_filter_button.grid(row=0, column=1, padx=(0, 5))
+
+        # 그룹 방식 전환 버튼 (날짜별 ↔ 태그별)
+        self.group_mode_button = ctk.CTkButton(
+            self.new_memo_frame,
+            text="🗂",
+            width=35,
+            height=35,
+            command=self.toggle_group_mode,
+            fg_color=PASTEL_COLORS["secondary"],
+            hover_color="#90A4AE",
+            text_color="white"
+        )
+        self.group_mode_button.grid(row=0, column=2)
 
         # 기능 버튼 프레임 (잠금, 삭제만)
         self.action_frame = ctk.CTkFrame(self.sidebar_frame, fg_color="transparent")
@@ -423,7 +679,17 @@ class MemoApp(ctk.CTk):
         self.export_button = ctk.CTkButton(
             self.export_group, text="📥", width=30, height=30, fg_color=UI_COLORS["primary"], command=self.export_memo
         )
-        self.export_button.pack(side="left", padx=(0, 0))
+        self.export_button.pack(side="left", padx=(0, 5))
+
+        self.outline_button = ctk.CTkButton(
+            self.export_group, text="☰", width=30, height=30, fg_color="transparent", command=self.toggle_outline_panel
+        )
+        self.outline_button.pack(side="left", padx=(0, 5))
+
+        self.tasks_button = ctk.CTkButton(
+            self.export_group, text="📋", width=30, height=30, fg_color="transparent", command=self.show_open_tasks
+        )
+        self.tasks_button.pack(side="left", padx=(0, 0))
 
         # === 텍스트 에디터와 줄 번호 영역 ===
         self.editor_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
@@ -434,20 +700,19 @@ class MemoApp(ctk.CTk):
         # 줄 번호 캔버스
         self.linenumbers = LineNumbers(self.editor_frame, width=50, bg="#2b2b2b", highlightthickness=0)
         self.linenumbers.grid(row=0, column=0, sticky="ns")
+        self.linenumbers.on_fold = self.toggle_fold
+        self.linenumbers.bind("<Button-2>" if self._platform == "darwin" else "<Button-3>",
+                              self._show_gutter_context_menu)
 
-        self.textbox = ctk.CTkTextbox(
-            self.editor_frame,
-            font=("Roboto Medium", 16),
-            undo=True,
-            wrap="word",
-            border_width=0,
-            padx=5 # 텍스트와 줄 번호 사이 간격
-        )
-        self.textbox.grid(row=0, column=1, sticky="nsew")
+        # 목차 패널 (기본 숨김)
+        self.outline_panel = ctk.CTkScrollableFrame(self.editor_frame, width=200, fg_color="#2b2b2b")
+        self._outline_visible = False
+        self._outline_shown = None  # 패널에 표시 중인 항목 목록
 
-        # 줄 번호 위젯에 텍스트 위젯 연결 및 스크롤 동기화
-        self.linenumbers.attach(self.textbox._textbox)
-        self.textbox._textbox.configure(yscrollcommand=self._on_text_scroll)
+        # 에디터 뷰: 메모별 Text 위젯과 그에 딸린 상태 (최근 메모의 뷰는 숨긴 채 유지)
+        self.view_cache = EditorViewCache()
+        self._active_view = None
+        self._show_editor_view(self._create_editor_view())
 
         # === 상태 표시줄 (글자 수/줄 수) ===
         self.status_frame = ctk.CTkFrame(self.main_frame, height=25, fg_color="transparent")
@@ -500,42 +765,205 @@ class MemoApp(ctk.CTk):
             self.bind_all("<Control-u>", lambda _: self.toggle_underline())
             self.bind_all("<Control-f>", lambda _: self.show_find_dialog())
 
-        # ===== 일반 이벤트 바인딩 (단축키 다음에) =====
-        # 키보드 이벤트 바인딩 (자동 저장용 및 서식 적용)
-        self.textbox._textbox.bind("<KeyRelease>", self.on_text_change)
-        self.textbox._textbox.bind("<KeyPress>", self.on_key_press)
-
-        # 클릭 이벤트 통합 핸들러 (링크, 체크박스, 이미지)
-        self.textbox._textbox.bind("<Button-1>", self.handle_text_click)
+        # 에디터 이벤트 바인딩은 뷰를 만들 때 적용 (_bind_textbox_events)
 
-        # 커서 위치 변경 시 현재 서식 상태 업데이트
-        self.textbox._textbox.bind("<ButtonRelease-1>", self.update_current_format, add="+")
-        self.textbox._textbox.bind("<Up>", self.update_current_format, add="+")
-        self.textbox._textbox.bind("<Down>", self.update_current_format, add="+")
-        self.textbox._textbox.bind("<Left>", self.update_current_format, add="+")
-        self.textbox._textbox.bind("<Right>", self.update_current_format, add="+")
+        # 설정 로드 (사이드바 그룹 상태가 첫 렌더링에 반영되도록 먼저 로드)
+        self.load_settings()
 
         # 초기 UI 렌더링
         self.refresh_sidebar()
-        self.setup_tags() # 서식 태그 설정
-        
-        # 설정 로드 및 종료 이벤트 바인딩
-        self.load_settings()
+
+        # 종료 이벤트 바인딩
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
         
         self.create_new_memo() # 시작 시 새 메모 상태
 
-    def _on_text_scroll(self, *args):
+    def _on_text_scroll(self, textbox, *args):
         """텍스트박스 스크롤 시 호출되는 콜백"""
-        # CTkTextbox의 스크롤바를 업데이트하고, 줄번호 캔버스의 뷰를 이동
-        self.textbox._y_scrollbar.set(*args)
-        self.linenumbers.yview_moveto(args[0])
+        # CTkTextbox의 스크롤바를 업데이트하고, 표시 중인 뷰라면 줄번호 캔버스의 뷰를 이동
+        textbox._y_scrollbar.set(*args)
+        if textbox is self.textbox:
+            self.linenumbers.yview_moveto(args[0])
+            self.linenumbers.redraw()
+
+    def toggle_fold(self, line):
+        """line 아래의 들여쓰기 블록/제목 구간 접기 또는 펼치기"""
+        text_widget = self.textbox._textbox
+        start = f"{line + 1}.0"
+        folded = text_widget.tag_nextrange(folding.FOLD_TAG, start)
+        if folded and str(folded[0]) == start:
+            text_widget.tag_remove(folding.FOLD_TAG, *folded)
+        else:
+            end = folding.fold_end(self.document, line)
+            if end is None:
+                return
+            text_widget.tag_add(folding.FOLD_TAG, start, f"{end + 1}.0")
         self.linenumbers.redraw()
 
+    def _show_gutter_context_menu(self, event):
+        """줄 번호 영역 우클릭 메뉴 (상대 줄 번호, 모두 펼치기)"""
+        menu = tkinter.Menu(self, tearoff=0)
+        relative_var = tkinter.BooleanVar(value=self.linenumbers.relative)
+        menu.add_checkbutton(label="상대 줄 번호", variable=relative_var,
+                             command=lambda: self._set_relative_line_numbers(relative_var.get()))
+        menu.add_command(label="모두 펼치기", command=self.unfold_all)
+        try:
+            menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            menu.grab_release()
+
+    def _set_relative_line_numbers(self, enabled):
+        self.linenumbers.relative = enabled
+        self.linenumbers.invalidate()
+        self.linenumbers.redraw()
+        self.save_settings()
+
+    def unfold_all(self):
+        """접힌 줄 모두 펼치기"""
+        self.textbox._textbox.tag_remove(folding.FOLD_TAG, "1.0", "end")
+        self.linenumbers.redraw()
+
+    def _create_editor_view(self):
+        """새 에디터 뷰 생성 (Text 위젯, 변경 추적, 태그 등록, 이벤트 바인딩)"""
+        textbox = ctk.CTkTextbox(
+            self.editor_frame,
+            font=("Roboto Medium", 16),
+            undo=False,  # 실행 취소는 UndoManager가 담당 (서식, 임베드 객체 포함)
+            wrap="word",
+            border_width=0,
+            padx=5 # 텍스트와 줄 번호 사이 간격
+        )
+        text_widget = textbox._textbox
+
+        # 텍스트 변경 추적: 편집된 줄만 다시 직렬화하기 위한 줄별 세그먼트 캐시
+        text_tracker = TextChangeTracker(text_widget)
+        text_tracker.add_listener(self._on_text_edit)
+
+        # Python 쪽 문서 모델: 일반 텍스트, 글자/줄 수, 제목을 위젯에서 다시 읽지 않고 조회
+        document = DocumentModel(text_widget)
+        text_tracker.add_listener(document.apply)
+        # 상태 표시줄 통계는 문서 모델이 갱신된 뒤 바뀐 줄만 다시 셈
+        text_stats = TextStats(document)
+        text_tracker.add_listener(text_stats.apply)
+        # 목차 색인 (제목, 체크리스트, 임베드 객체): 편집된 줄만 다시 계산
+        outline_index = outline.OutlineIndex(text_widget, document, self._classify_embed)
+        text_tracker.add_listener(outline_index.apply)
+        # 실행 취소 기록 (서식 변경, 임베드 객체 포함, 뷰가 캐시에 남아 있는 동안 메모 전환 후에도 유지)
+        undo_manager = UndoManager(
+            text_widget, text_tracker, is_transient=is_transient_tag,
+            describe_window=self._describe_window, restore_window=self._restore_window
+        )
+
+        # 동적 태그(색상, 링크, 폰트 등)는 위젯당 한 번만 설정
+        tag_registry = TagRegistry(text_widget, on_link=self._setup_link_tag)
+        # 코드 블록 구문 강조: 편집된 줄부터 다시 분석 (강조 태그는 변경 추적·저장 대상 아님)
+        highlighter = SyntaxHighlighter(text_widget, document, tag_registry.ensure)
+        text_tracker.add_listener(highlighter.apply)
+
+        # 스크롤 동기화
+        text_widget.configure(yscrollcommand=lambda *args: self._on_text_scroll(textbox, *args))
+
+        self._bind_textbox_events(text_widget)
+        self.setup_tags(text_widget) # 서식 태그 설정
+        return EditorView(textbox, text_tracker, tag_registry, document, text_stats, outline_index, undo_manager,
+                          highlighter)
+
+    def _bind_textbox_events(self, text_widget):
+        """에디터 Text 위젯 이벤트 바인딩"""
+        # 키보드 이벤트 바인딩 (자동 저장용 및 서식 적용)
+        text_widget.bind("<KeyRelease>", self.on_text_change)
+        text_widget.bind("<KeyPress>", self.on_key_press)
+
+        # 붙여넣기: 큰 내용은 나눠서 삽입 (Ctrl+V 기본 바인딩과 paste_text 모두 <<Paste>>를 거침)
+        text_widget.bind("<<Paste>>", self._on_paste)
+
+        # 클릭 이벤트 통합 핸들러 (링크, 체크박스, 이미지)
+        text_widget.bind("<Button-1>", self.handle_text_click)
+
+        # 선택 영역이 바뀌면 상태 표시줄의 선택 글자 수 갱신
+        text_widget.bind("<<Selection>>", lambda _: self.update_status_bar(), add="+")
+
+        # 커서 위치 변경 시 현재 서식 상태 업데이트
+        text_widget.bind("<ButtonRelease-1>", self.update_current_format, add="+")
+        text_widget.bind("<Up>", self.update_current_format, add="+")
+        text_widget.bind("<Down>", self.update_current_format, add="+")
+        text_widget.bind("<Left>", self.update_current_format, add="+")
+        text_widget.bind("<Right>", self.update_current_format, add="+")
+
+    def _show_editor_view(self, view):
+        """뷰를 에디터 영역에 표시하고 뷰 상태를 현재 상태로 가져옴 (이전 뷰는 숨기고 상태 보관)"""
+        previous = self._active_view
+        if previous is not None and previous is not view:
+            for name in EditorView.STATE:
+                setattr(previous, name, getattr(self, name))
+            previous.textbox.grid_remove()
+
+        for name in EditorView.STATE:
+            setattr(self, name, getattr(view, name))
+        self._active_view = view
+
+        view.textbox.grid(row=0, column=1, sticky="nsew")
+        self.linenumbers.attach(view.textbox._textbox, view.text_tracker, view.document)
+        self.linenumbers.redraw()
+        self._refresh_outline()
+
+    def _switch_editor_view(self, memo_id):
+        """메모 전환 시 사용할 뷰 준비
+
+        캐시된 뷰가 있으면 그대로 표시하고 True 반환,
+        없으면 비어 있는 뷰(새 뷰 또는 정리한 현재 뷰)를 표시하고 False 반환
+        """
+        current = self._active_view
+        cached = self.view_cache.take(memo_id) if memo_id is not None else None
+        if cached is not None and cached.source is not self.memos[memo_id].get("rich_content"):
+            # 숨겨 둔 사이에 메모 내용이 다른 경로로 바뀌었으면 다시 로드
+            cached.destroy()
+            cached = None
+
+        # 현재 뷰는 저장된 메모를 완전히 표시 중일 때만 보관 (저장되지 않은 변경이 있으면 버림)
+        keep_current = (self.view_cache.enabled and current.memo_id is not None
+                        and current.memo_id in self.memos and current.source is not None
+                        and not self.is_modified)
+
+        if cached is None and not keep_current:
+            # 캐시를 쓰지 않는 경우: 현재 뷰를 비워서 재사용
+            self._cleanup_resources()
+            return False
+
+        view = cached if cached is not None else self._create_editor_view()
+        self._show_editor_view(view)
+
+        if keep_current:
+            size = current.estimate_bytes(len(self.memos[current.memo_id].get("content", "")))
+            for evicted in self.view_cache.put(current, size):
+                evicted.destroy()
+        else:
+            current.destroy()
+
+        return cached is not None
+
+    def _discard_editor_view(self, memo_id):
+        """삭제된 메모의 숨긴 뷰 제거"""
+        view = self.view_cache.take(memo_id)
+        if view is not None:
+            view.destroy()
+
     def load_memos(self):
         """JSON 파일에서 메모 불러오기"""
         self.memos = self.data_manager.load_memos()
 
+        # 미리보기/체크리스트 요약이 없는 이전 버전 메모는 한 번만 계산 (다음 저장 시 함께 기록됨)
+        # 잠긴 메모는 비밀번호 없이 내용이 보이지 않도록 미리보기와 체크리스트 항목을 두지 않음
+        for data in self.memos.values():
+            if data.get("locked", False):
+                data["preview"] = ""
+                data["checklist"] = text_utils.checklist_summary(())
+                continue
+            if "preview" not in data:
+                data["preview"] = text_utils.make_preview(data.get("content", ""))
+            if "checklist" not in data:
+                data["checklist"] = text_utils.checklist_summary(text_utils.checklist_items(data.get("content", "")))
+
     def save_memos(self):
         """메모를 JSON 파일에 저장"""
         self.data_manager.save_memos(self.memos)
@@ -563,7 +991,27 @@ class MemoApp(ctk.CTk):
                         self.always_on_top_button.configure(fg_color=PASTEL_COLORS["primary"])
                     else:
                         self.always_on_top_button.configure(fg_color="transparent")
-                        
+
+                # 사이드바 그룹 방식 및 섹션 펼침 상태 복원
+                if settings.get("sidebar_group_mode") in sidebar_groups.GROUP_MODES:
+                    self.sidebar_group_mode = settings["sidebar_group_mode"]
+                if isinstance(settings.get("sidebar_expanded"), dict):
+                    self.sidebar_expanded = settings["sidebar_expanded"]
+                self._update_group_mode_button()
+
+                # 에디터 뷰 캐시 크기 (0이면 메모 전환 시 항상 다시 로드)
+                if "editor_view_cache_size" in settings:
+                    self.view_cache.max_views = max(0, int(settings["editor_view_cache_size"]))
+                if "editor_view_cache_mb" in settings:
+                    self.view_cache.budget_mb = max(0, int(settings["editor_view_cache_mb"]))
+
+                # 상대 줄 번호 표시
+                self.linenumbers.relative = bool(settings.get("relative_line_numbers", False))
+
+                # 자동 제목 정책
+                if settings.get("title_policy") in text_utils.TITLE_POLICIES:
+                    self.title_policy = settings["title_policy"]
+
             except Exception as e:
                 print(f"Error loading settings: {e}")
 
@@ -572,7 +1020,13 @@ class MemoApp(ctk.CTk):
         settings = {
             "geometry": self.geometry(),
             "opacity": self.attributes("-alpha"),
-            "always_on_top": self.always_on_top
+            "always_on_top": self.always_on_top,
+            "sidebar_group_mode": self.sidebar_group_mode,
+            "sidebar_expanded": self.sidebar_expanded,
+            "editor_view_cache_size": self.view_cache.max_views,
+            "editor_view_cache_mb": self.view_cache.budget_mb,
+            "relative_line_numbers": self.linenumbers.relative,
+            "title_policy": self.title_policy
         }
         self.data_manager.save_settings(settings)
 
@@ -594,7 +1048,7 @@ class MemoApp(ctk.CTk):
                     path = segment.get("thumbnail_path")
                     if path:
                         used_files.add(os.path.abspath(path))
-                elif segment.get("type") == "paint":
+                elif segment.get("type") in ("paint", "attachment"):
                     path = segment.get("path")
                     if path:
                         used_files.add(os.path.abspath(path))
@@ -602,7 +1056,8 @@ class MemoApp(ctk.CTk):
         # 2. 디렉토리 스캔 및 삭제
         dirs_to_clean = [
             get_resource_dir("memo_images"),
-            get_resource_dir(os.path.join("memo_images", "thumbnails"))
+            get_resource_dir(os.path.join("memo_images", "thumbnails")),
+            get_resource_dir(attachment_block.ATTACHMENT_DIR)
         ]
 
         deleted_count = 0
@@ -631,13 +1086,18 @@ class MemoApp(ctk.CTk):
 
     def on_closing(self):
         """프로그램 종료 시 호출"""
+        # 디바운싱 중이거나 미뤄진 변경 사항 저장 (진행 중인 붙여넣기는 끝까지 삽입한 뒤)
+        # 이미지/미디어 참조를 정리하기 전에 저장해야 임베드 객체가 함께 직렬화됨
+        self._finish_paste()
+        self._flush_pending_save()
+
         # 리소스 정리
         self._cleanup_resources()
+        self.prefetcher.shutdown()
 
         # 저장 타이머 정리
-        if self.save_timer:
-            self.after_cancel(self.save_timer)
-            self.save_timer = None
+        self.save_scheduler.cancel()
+        self.ui_scheduler.cancel()
 
         # 종료 전 미사용 파일 정리
         self.cleanup_unused_files()
@@ -645,69 +1105,40 @@ class MemoApp(ctk.CTk):
         self.save_settings()
         self.destroy()
 
-    def setup_tags(self):
+    def setup_tags(self, text_widget):
         """텍스트 에디터의 서식 태그 설정"""
         # 기본 스타일 태그 (밑줄, 취소선은 폰트와 독립적)
-        self.textbox._textbox.tag_config("underline", underline=True)
-        self.textbox._textbox.tag_config("overstrike", overstrike=True)
+        text_widget.tag_config("underline", underline=True)
+        text_widget.tag_config("overstrike", overstrike=True)
 
         # 정렬 태그
-        self.textbox._textbox.tag_config("align_left", justify="left")
-        self.textbox._textbox.tag_config("align_center", justify="center")
-        self.textbox._textbox.tag_config("align_right", justify="right")
+        text_widget.tag_config("align_left", justify="left")
+        text_widget.tag_config("align_center", justify="center")
+        text_widget.tag_config("align_right", justify="right")
+
+        # 접힌 줄 숨김 (화면 상태이므로 저장하지 않음)
+        text_widget.tag_config(folding.FOLD_TAG, elide=True)
 
     def _get_font_tag(self, family, size, weight, slant):
         """폰트 속성 조합에 해당하는 태그 이름을 반환하고, 필요시 설정"""
-        tag = f"f|{family}|{size}|{weight}|{slant}"
-
-        # 최적화: 이미 설정된 태그라면 재설정하지 않음
-        if tag in self._configured_font_tags:
-            return tag
-
-        # 폰트 튜플 생성 (tkinter font style: "bold italic")
-        style_parts = []
-        if weight == "bold": style_parts.append("bold")
-        if slant == "italic": style_parts.append("italic")
-        style_str = " ".join(style_parts) if style_parts else ""
-
-        # 항상 태그를 재설정하여 폰트가 정확하게 적용되도록 함
-        self.textbox._textbox.tag_config(tag, font=(family, int(size), style_str))
-        self._configured_font_tags.add(tag)
+        tag = format_engine.font_tag_name(family, size, weight, slant)
+        self.tag_registry.ensure(tag)
         return tag
 
     def _parse_font_tag(self, tag):
         """태그 이름에서 폰트 속성 추출"""
-        if tag.startswith("f|"):
-            parts = tag.split("|")
-            if len(parts) == 5:
-                return {"family": parts[1], "size": int(parts[2]), "weight": parts[3], "slant": parts[4]}
-        return None
+        return format_engine.parse_font_tag(tag)
 
     def configure_tag_if_needed(self, tag_name):
-        """동적 태그(색상, 폰트 등)가 설정되어 있는지 확인하고 적용"""
-        # 색상 태그 처리 (예: color_#ff0000)
-        if tag_name.startswith("color_"):
-            color = tag_name.split("_")[1]
-            self.textbox._textbox.tag_config(tag_name, foreground=color)
-
-        # 하이라이트 태그 처리 (예: highlight_#ffff00)
-        elif tag_name.startswith("highlight_"):
-            color = tag_name.split("_")[1]
-            self.textbox._textbox.tag_config(tag_name, background=color)
-
-        # 링크 태그 처리 (예: link_https://example.com)
-        elif tag_name.startswith("link_"):
-            url = tag_name[5:]  # "link_" 제거
-            self._setup_link_tag(tag_name, url)
-
-        # 새로운 폰트 태그 처리 (f|Family|Size|Weight|Slant)
-        elif tag_name.startswith("f|"):
-            parts = tag_name.split("|")
-            if len(parts) == 5:
-                self._get_font_tag(parts[1], parts[2], parts[3], parts[4])
+        """동적 태그(색상, 폰트 등)가 설정되어 있는지 확인하고 적용 (위젯당 한 번만 설정)"""
+        self.tag_registry.ensure(tag_name)
 
     def update_current_format(self, event=None):
         """커서 위치의 서식을 현재 입력 서식으로 설정"""
+        # 상대 줄 번호는 커서 줄이 바뀌면 다시 그림
+        if self.linenumbers.relative:
+            self.linenumbers.redraw()
+
         # 수동 서식 모드인 경우 커서 이동으로 서식을 변경하지 않음
         if self.manual_format_mode:
             return
@@ -716,7 +1147,7 @@ class MemoApp(ctk.CTk):
             # 현재 커서 위치의 태그 가져오기
             cursor_pos = self.textbox._textbox.index("insert")
             tags = self.textbox._textbox.tag_names(cursor_pos)
-            self.current_input_tags = set(t for t in tags if t != "sel")
+            self.current_input_tags = format_engine.InputTags(t for t in tags if not is_transient_tag(t))
         except tkinter.TclError:
             # 텍스트 위젯이 아직 초기화되지 않았거나 잘못된 인덱스
             pass
@@ -724,91 +1155,63 @@ class MemoApp(ctk.CTk):
         # 서식 버튼 상태 업데이트
         self.update_format_buttons()
 
+    def _build_ime_shortcuts(self):
+        """한글 IME 단축키 처리 테이블 (keycode → 핸들러, 플랫폼별로 한 번만 생성)"""
+        if self._platform != "darwin":
+            return {}
+
+        actions = {
+            'b': lambda event: self.toggle_bold(),
+            'i': lambda event: self.toggle_italic(),
+            'u': lambda event: self.toggle_underline(),
+            'f': lambda event: self.show_find_dialog(),
+            'a': lambda event: self.select_all(),
+            'c': lambda event: self.copy_text(),
+            'v': lambda event: self.paste_text(),
+            'x': lambda event: self.cut_text(),
+            # Shift 키와 함께면 다시 실행
+            'z': lambda event: self.redo_action() if event.state & 0x1 else self.undo_action(),
+        }
+        return {keycode: actions[key] for keycode, key in MAC_IME_SHORTCUT_KEYCODES.items()}
+
     def on_key_press(self, event):
-        """키 입력을 가로채서 서식과 함께 삽입"""
+        """키 입력을 가로채서 서식과 함께 삽입 (모든 키 입력마다 호출되므로 할당 없이 처리)"""
         # 단축키 (Command/Control 조합)는 통과시킴
         # macOS: state & 0x8 (Command), Windows/Linux: state & 0x4 (Control)
-        is_shortcut = (event.state & 0x8) or (event.state & 0x4)  # Command 또는 Control 키
-
-        # 한글 IME 우회: keycode로 단축키 직접 처리 (keysym이 ??로 나올 때)
-        if is_shortcut and event.keysym == "??":
-            # macOS keycode 매핑 (실제 측정값)
-            keycode_map = {
-                # 서식
-                184549474: 'b',  # Bold
-                570425449: 'i',  # Italic
-                536871029: 'u',  # Underline
-                # 편집
-                97: 'a',         # Select All (한글 모드에서 keycode가 작음)
-                134217827: 'c',  # Copy
-                150995062: 'v',  # Paste
-                117440632: 'x',  # Cut
-                100663418: 'z',  # Undo
-                # 기타
-                50331750: 'f',   # Find
-            }
-
-            key = keycode_map.get(event.keycode)
-            if key:
-                logger.debug(f"Korean IME shortcut detected: keycode={event.keycode} -> {key}")
-
-                # 직접 함수 호출
-                if key == 'b':
-                    self.toggle_bold()
-                    return "break"
-                elif key == 'i':
-                    self.toggle_italic()
-                    return "break"
-                elif key == 'u':
-                    self.toggle_underline()
-                    return "break"
-                elif key == 'f':
-                    self.show_find_dialog()
-                    return "break"
-                elif key == 'a':
-                    self.select_all()
-                    return "break"
-                elif key == 'c':
-                    self.copy_text()
-                    return "break"
-                elif key == 'v':
-                    self.paste_text()
-                    return "break"
-                elif key == 'x':
-                    self.cut_text()
-                    return "break"
-                elif key == 'z':
-                    if event.state & 0x1:  # Shift 키
-                        self.redo_action()
-                    else:
-                        self.undo_action()
+        if event.state & 0xC:  # Command 또는 Control 키
+            # 한글 IME 우회: keycode로 단축키 직접 처리 (keysym이 ??로 나올 때)
+            if event.keysym == "??":
+                handler = self._ime_shortcuts.get(event.keycode)
+                if handler:
+                    logger.debug(f"Korean IME shortcut detected: keycode={event.keycode}")
+                    handler(event)
                     return "break"
 
-        # 단축키는 다른 핸들러가 처리하도록 통과
-        if is_shortcut:
+            # 단축키는 다른 핸들러가 처리하도록 통과
             logger.debug(f"Shortcut detected: keysym={event.keysym}, keycode={event.keycode}, state=0x{event.state:x}")
             return
 
+        char = event.char
         # 특수 키는 무시 (Backspace, Delete, 방향키 등)
-        if len(event.char) == 0 or event.char in ['\x08', '\x7f']:
+        if char in IGNORED_KEY_CHARS:
             return
 
         # Space, Enter, Tab을 입력하면 수동 서식 모드 해제 (단어/문단 구분)
-        if event.char in [' ', '\n', '\r', '\t']:
-            if self.manual_format_mode:
-                # 현재 문자에 서식을 적용한 후 모드 해제
-                def reset_mode():
-                    self.manual_format_mode = False
-                    self.update_format_buttons()
-                self.textbox.after(50, reset_mode)
+        if char in FORMAT_BREAK_CHARS and self.manual_format_mode:
+            # 현재 문자에 서식을 적용한 후 모드 해제
+            self.textbox.after(50, self._end_manual_format_mode)
 
         # 서식 태그가 있으면 기본 입력을 막고 직접 삽입
         if self.current_input_tags:
             # 현재 커서 위치에 문자를 태그와 함께 삽입
-            self.textbox._textbox.insert("insert", event.char, tuple(self.current_input_tags))
+            self.textbox._textbox.insert("insert", char, self.current_input_tags.as_tuple())
             # 기본 키 입력 동작을 막기 위해 "break" 반환
             return "break"
 
+    def _end_manual_format_mode(self):
+        """수동 서식 모드 해제"""
+        self.manual_format_mode = False
+        self.update_format_buttons()
 
     def _update_input_font_attribute(self, attr, value=None):
         """현재 입력 서식의 폰트 속성 업데이트 (선택 영역이 없을 때)"""
@@ -898,39 +1301,12 @@ class MemoApp(ctk.CTk):
             self._update_input_font_attribute(attr, value)
             return
 
-        # 구간별 서식 적용을 위한 내부 함수
-        def process_segment(start, end, tags):
-            # 현재 구간의 폰트 정보 파악
-            font_info = {"family": "Roboto Medium", "size": 16, "weight": "normal", "slant": "roman"}
-            old_font_tag = None
-            
-            for t in tags:
-                parsed = self._parse_font_tag(t)
-                if parsed:
-                    font_info = parsed
-                    old_font_tag = t
-                    break
-            
-            # 속성 변경
-            if attr == "weight": font_info["weight"] = target_value
-            elif attr == "slant": font_info["slant"] = target_value
-            elif attr == "family": font_info["family"] = value
-            elif attr == "size": font_info["size"] = int(value)
-            
-            # 새 태그 생성 및 적용
-            new_tag = self._get_font_tag(font_info["family"], font_info["size"], font_info["weight"], font_info["slant"])
-            
-            if old_font_tag and old_font_tag != new_tag:
-                self.textbox._textbox.tag_remove(old_font_tag, start, end)
-            if new_tag != old_font_tag:
-                self.textbox._textbox.tag_add(new_tag, start, end)
-
         # 1. 토글 동작을 위한 타겟 값 결정 (Bold/Italic)
         target_value = value
         if attr in ["weight", "slant"] and value is None:
             # 첫 글자의 상태를 확인하여 반대로 토글
             first_tags = self.textbox._textbox.tag_names("sel.first")
-            current_font = {"family": "Roboto Medium", "size": 16, "weight": "normal", "slant": "roman"}
+            current_font = dict(format_engine.DEFAULT_FONT)
             for tag in first_tags:
                 parsed = self._parse_font_tag(tag)
                 if parsed:
@@ -942,29 +1318,25 @@ class MemoApp(ctk.CTk):
             elif attr == "slant":
                 target_value = "roman" if current_font["slant"] == "italic" else "italic"
 
-        # 2. 선택 영역을 순회하며 각 구간별로 태그 업데이트
-        # dump를 사용하여 태그가 변경되는 구간(segment)을 파악
-        dump_data = self.textbox._textbox.dump(sel_start, sel_end, tag=True, text=True)
-        
-        current_index = sel_start
-        current_tags = set(self.textbox._textbox.tag_names(sel_start))
-        
-        for key, val, index in dump_data:
-            # 인덱스가 바뀌었으면 이전 구간 처리
-            if self.textbox._textbox.compare(index, "!=", current_index):
-                process_segment(current_index, index, current_tags)
-                current_index = index
-
-            # 태그 상태 업데이트
-            if key == "tagon": current_tags.add(val)
-            elif key == "tagoff": current_tags.discard(val)
-
-        # 루프 종료 후 마지막 구간 처리 (이 부분이 누락되어 있었음)
-        if self.textbox._textbox.compare(current_index, "<", sel_end):
-            process_segment(current_index, sel_end, current_tags)
+        # 2. 선택 영역의 dump 한 번으로 태그 구간을 계산하고, 바꿀 태그별로 구간을 모아 한 번에 적용
+        text_widget = self.textbox._textbox
+        dump_data = text_widget.dump(sel_start, sel_end, tag=True, text=True)
+        segments = format_engine.tag_segments(dump_data, sel_start, sel_end, text_widget.tag_names(sel_start))
+        removals, additions = format_engine.plan_font_change(segments, attr, target_value)
+        self._apply_tag_changes(removals, additions)
 
         self.on_text_change()
 
+    def _apply_tag_changes(self, removals, additions):
+        """태그별 여러 구간을 한 번의 tag remove/add 호출로 적용 (실행 취소 한 단계로 기록)"""
+        text_widget = self.textbox._textbox
+        with self.text_tracker.batch():
+            for tag, ranges in removals.items():
+                text_widget.tk.call(text_widget._w, "tag", "remove", tag, *ranges)
+            for tag, ranges in additions.items():
+                self.tag_registry.ensure(tag)
+                text_widget.tk.call(text_widget._w, "tag", "add", tag, *ranges)
+
     def update_format_buttons(self):
         """현재 서식 상태에 따라 버튼 색상 업데이트"""
         # 폰트 태그를 한 번만 파싱 (성능 최적화)
@@ -1053,20 +1425,19 @@ class MemoApp(ctk.CTk):
         self.on_text_change()
 
     def undo_action(self):
-        """실행 취소"""
-        try:
-            self.textbox._textbox.edit_undo()
-        except tkinter.TclError:
-            # 실행 취소할 작업이 없음
-            pass
+        """실행 취소 (텍스트, 서식, 임베드 객체)"""
+        # 나눠서 붙여넣는 중이면 먼저 끝까지 삽입하여 붙여넣기 전체를 한 번에 취소
+        self._finish_paste()
+        if self.undo_manager.undo():
+            self.on_text_change()
+            self.update_current_format()
 
     def redo_action(self):
         """다시 실행"""
-        try:
-            self.textbox._textbox.edit_redo()
-        except tkinter.TclError:
-            # 다시 실행할 작업이 없음
-            pass
+        self._finish_paste()
+        if self.undo_manager.redo():
+            self.on_text_change()
+            self.update_current_format()
 
     def select_all(self):
         """전체 선택"""
@@ -1148,6 +1519,166 @@ class MemoApp(ctk.CTk):
             logger.error(f"Paste failed: {e}")
         return "break"
 
+    def _on_paste(self, event=None):
+        """<<Paste>> 처리: 큰 내용은 나눠서 삽입하거나 첨부 블록으로 저장 (작은 내용은 Tk 기본 처리)"""
+        text_widget = self.textbox._textbox
+        try:
+            text = text_widget.clipboard_get()
+        except tkinter.TclError:
+            return None
+        if len(text) < LARGE_PASTE_CHARS:
+            return None
+        if self._paste_job is not None:
+            return "break"
+
+        import tkinter.messagebox as messagebox
+        lines = text.count("\n") + 1
+        choice = messagebox.askyesnocancel(
+            "큰 내용 붙여넣기",
+            f"붙여넣을 내용이 큽니다 ({lines:,}줄, {attachment_block.format_size(len(text))}).\n\n"
+            "예: 접힌 첨부 블록으로 넣기 (펼치기로 나중에 본문에 삽입)\n"
+            "아니오: 본문에 나눠서 삽입"
+        )
+        if choice is None:
+            return "break"
+
+        # 선택 영역은 붙여넣을 내용으로 교체
+        if text_widget.tag_ranges("sel"):
+            text_widget.delete("sel.first", "sel.last")
+
+        if choice:
+            self._insert_attachment(text)
+        else:
+            self._start_paste(text, "insert")
+        return "break"
+
+    def _start_paste(self, text, at):
+        """text를 at 위치에 시간 예산 단위로 나눠 삽입 시작 (전체가 실행 취소 한 단계)"""
+        text_widget = self.textbox._textbox
+        text_widget.mark_set(PASTE_MARK, at)
+        text_widget.mark_gravity(PASTE_MARK, "right")
+
+        # 나눠 삽입하는 동안 자동 저장은 미루고, 끝난 뒤 바뀐 줄만 차분 저장
+        self.text_tracker.begin_batch()
+        self._paste_job = {
+            "pieces": list(memo_loader.split_text(text)),
+            "position": 0,
+            "timer": None,
+        }
+        self._paste_next_chunk()
+
+    def _paste_next_chunk(self, finish=False):
+        """시간 예산 안에서 남은 붙여넣기 조각 삽입 (finish면 남은 조각을 모두 삽입)"""
+        job = self._paste_job
+        if job is None:
+            return
+
+        job["timer"] = None
+        text_widget = self.textbox._textbox
+        pieces = job["pieces"]
+        deadline = time.perf_counter() + memo_loader.CHUNK_BUDGET_MS / 1000
+
+        while job["position"] < len(pieces):
+            text_widget.insert(PASTE_MARK, pieces[job["position"]])
+            job["position"] += 1
+            if not finish and time.perf_counter() >= deadline:
+                break
+
+        if job["position"] < len(pieces):
+            percent = job["position"] * 100 // len(pieces)
+            self.status_label.configure(text=f"Pasting... {percent}%")
+            job["timer"] = self.after(1, self._paste_next_chunk)
+            return
+
+        # 붙여넣기 완료: 커서를 붙여넣은 내용 뒤로
+        text_widget.mark_set("insert", PASTE_MARK)
+        text_widget.see("insert")
+        self._end_paste()
+        self.on_text_change()
+
+    def _finish_paste(self):
+        """진행 중인 붙여넣기의 남은 조각을 즉시 삽입 (메모 전환, 실행 취소 전)"""
+        if self._paste_job is not None:
+            self._paste_next_chunk(finish=True)
+
+    def _cancel_paste(self):
+        """진행 중인 붙여넣기 중단 (메모 삭제 시)"""
+        job = self._paste_job
+        if job is None:
+            return
+        if job["timer"]:
+            self.after_cancel(job["timer"])
+        self._end_paste()
+
+    def _end_paste(self):
+        self._paste_job = None
+        self.textbox._textbox.mark_unset(PASTE_MARK)
+        self.text_tracker.end_batch()
+
+    def _insert_attachment(self, text, at="insert"):
+        """긴 텍스트를 첨부 파일로 저장하고 접힌 블록으로 삽입"""
+        try:
+            path = attachment_block.save_attachment(get_resource_dir(attachment_block.ATTACHMENT_DIR), text)
+        except OSError as e:
+            logger.error(f"Failed to save attachment: {e}")
+            import tkinter.messagebox as messagebox
+            messagebox.showerror("첨부 저장 실패", f"첨부 파일을 저장할 수 없습니다.\n{e}")
+            return
+
+        block = self._create_attachment_block(
+            path, text.count("\n") + 1, len(text), attachment_block.first_line(text)
+        )
+        self.textbox._textbox.window_create(at, window=block, padx=5, pady=5)
+        self.on_text_change()
+        # 첨부 파일이 미사용 파일 정리에서 지워지지 않도록 메모에 바로 기록
+        self._flush_pending_save()
+
+    def _has_attachment_block(self):
+        """에디터에 첨부 블록이 있는지 여부"""
+        text_widget = self.textbox._textbox
+        for name in text_widget.window_names():
+            try:
+                if isinstance(text_widget.nametowidget(name), AttachmentBlock):
+                    return True
+            except KeyError:
+                continue
+        return False
+
+    def _create_attachment_block(self, path, lines, chars, summary=""):
+        return AttachmentBlock(
+            self.textbox._textbox, path, lines, chars, summary,
+            on_expand=self.expand_attachment, on_copy=self.copy_attachment
+        )
+
+    def expand_attachment(self, block):
+        """첨부 블록을 원래 텍스트로 바꿔 본문에 나눠서 삽입"""
+        if self._paste_job is not None:
+            return
+        try:
+            text = attachment_block.read_attachment(block.path)
+        except OSError as e:
+            logger.error(f"Failed to read attachment: {e}")
+            import tkinter.messagebox as messagebox
+            messagebox.showerror("첨부 열기 실패", f"첨부 파일을 읽을 수 없습니다.\n{e}")
+            return
+
+        text_widget = self.textbox._textbox
+        # 블록 삭제와 텍스트 삽입을 실행 취소 한 단계로 묶음
+        with self.text_tracker.batch():
+            index = text_widget.index(str(block))
+            text_widget.delete(index)
+            self._start_paste(text, index)
+
+    def copy_attachment(self, block):
+        """첨부 블록의 텍스트를 클립보드로 복사"""
+        try:
+            text = attachment_block.read_attachment(block.path)
+        except OSError as e:
+            logger.error(f"Failed to read attachment: {e}")
+            return
+        self.clipboard_clear()
+        self.clipboard_append(text)
+
     def show_find_dialog(self):
         """찾기/바꾸기 다이얼로그 표시"""
         dialog = ctk.CTkToplevel(self)
@@ -1253,9 +1784,8 @@ class MemoApp(ctk.CTk):
         current_line = self.textbox._textbox.index("insert linestart")
         self.textbox._textbox.insert(current_line, "• ")
 
-    def _setup_link_tag(self, tag_name, url):
-        """링크 태그 설정 (스타일만 설정, 클릭은 통합 핸들러에서 처리)"""
-        self.textbox._textbox.tag_config(tag_name, foreground="blue", underline=True)
+    def _setup_link_tag(self, tag_name):
+        """링크 태그 이벤트 설정 (스타일은 태그 등록 시 설정, 클릭은 통합 핸들러에서 처리)"""
         # 마우스 커서 변경만 처리
         self.textbox._textbox.tag_bind(tag_name, "<Enter>", lambda _: self.textbox._textbox.config(cursor="hand2"))
         self.textbox._textbox.tag_bind(tag_name, "<Leave>", lambda _: self.textbox._textbox.config(cursor=""))
@@ -1267,7 +1797,7 @@ class MemoApp(ctk.CTk):
 
         if url:
             tag_name = f"link_{url}"
-            self._setup_link_tag(tag_name, url)
+            self.configure_tag_if_needed(tag_name)
 
             try:
                 # 선택된 텍스트가 있으면 링크로 변환
@@ -1437,6 +1967,10 @@ class MemoApp(ctk.CTk):
                 self.memos[self.current_memo_id]["locked"] = False
                 self.memos[self.current_memo_id]["password"] = ""
                 self.memos[self.current_memo_id]["password_hash"] = ""
+                self.memos[self.current_memo_id]["preview"] = text_utils.make_preview(
+                    self.memos[self.current_memo_id].get("content", ""))
+                self.memos[self.current_memo_id]["checklist"] = text_utils.checklist_summary(
+                    text_utils.checklist_items(self.memos[self.current_memo_id].get("content", "")))
                 self.save_memos()
                 self.refresh_sidebar()
             else:
@@ -1454,6 +1988,9 @@ class MemoApp(ctk.CTk):
                 self.memos[self.current_memo_id]["password_hash"] = password_hash
                 # 하위 호환성을 위해 password 필드는 빈 문자열로 설정
                 self.memos[self.current_memo_id]["password"] = ""
+                # 저장된 미리보기와 체크리스트 항목도 지워 사이드바와 파일에 내용이 남지 않게 함
+                self.memos[self.current_memo_id]["preview"] = ""
+                self.memos[self.current_memo_id]["checklist"] = text_utils.checklist_summary(())
                 self.save_memos()
                 self.refresh_sidebar()
 
@@ -1957,6 +2494,23 @@ class MemoApp(ctk.CTk):
             import tkinter.messagebox as messagebox
             messagebox.showerror("오류", f"올바른 형식으로 입력하세요 (예: 3x4)\n{str(e)}")
 
+    def toggle_checklist(self, index):
+        """체크박스 한 글자를 제자리에서 교체 (☐ ↔ ☑)
+
+        서식 태그를 유지한 한 글자 replace이므로 한 줄만 바뀐 차분 저장이 되고,
+        글자 수·단어 수는 그대로라 상태 표시줄/줄 번호 갱신 없이 목차만 갱신
+        """
+        text_widget = self.textbox._textbox
+        new_char = "☑" if text_widget.get(index) == "☐" else "☐"
+        tags = [tag for tag in text_widget.tag_names(index) if not is_transient_tag(tag)]
+        text_widget.replace(index, f"{index}+1c", new_char, tags)
+
+        if not self.is_modified:
+            self.is_modified = True
+            self.update_memo_button_color()
+        self.save_scheduler.trigger()
+        self._refresh_outline()
+
     def handle_text_click(self, event):
         """텍스트 클릭 통합 핸들러 - 링크, 체크박스, 이미지 처리"""
         try:
@@ -1965,15 +2519,8 @@ class MemoApp(ctk.CTk):
             char = self.textbox._textbox.get(index)
 
             # 1. 체크박스 토글
-            if char == "☐":
-                self.textbox._textbox.delete(index)
-                self.textbox._textbox.insert(index, "☑")
-                self.on_text_change()
-                return "break"
-            elif char == "☑":
-                self.textbox._textbox.delete(index)
-                self.textbox._textbox.insert(index, "☐")
-                self.on_text_change()
+            if char in text_utils.CHECKLIST_GLYPHS:
+                self.toggle_checklist(index)
                 return "break"
 
             # 2. 링크 클릭 - 클릭 위치의 태그 확인
@@ -2017,7 +2564,7 @@ class MemoApp(ctk.CTk):
         )
 
         if file_path:
-            content = self.textbox.get("1.0", "end-1c")
+            content = self.get_plain_text()
             title = self.memos[self.current_memo_id].get("title", "Untitled")
 
             exporter.export_file(file_path, title, content)
@@ -2032,7 +2579,7 @@ class MemoApp(ctk.CTk):
             try:
                 # 선택 영역의 태그 가져오기
                 tags = self.textbox._textbox.tag_names("sel.first")
-                self.copied_format = set(t for t in tags if t != "sel" and not t.startswith("link_"))
+                self.copied_format = set(t for t in tags if not is_transient_tag(t) and not t.startswith("link_"))
                 self.format_painter_mode = True
                 self.format_painter_button.configure(fg_color=UI_COLORS["success"])  # 활성화 표시
                 # 마우스 클릭 이벤트 바인딩
@@ -2095,93 +2642,340 @@ class MemoApp(ctk.CTk):
             self.always_on_top_button.configure(fg_color="transparent")
 
     def update_status_bar(self):
-        """글자 수 및 줄 수 업데이트"""
+        """글자 수, 줄 수, 단어 수, 한글 음절 수, 읽기 시간, 선택 글자 수 업데이트"""
+        # 메모를 나눠 로드하는 중에는 진행률 표시 유지
+        if self._memo_load is not None:
+            self._show_load_progress()
+            return
+
         try:
-            content = self.textbox.get("1.0", "end-1c")
-            char_count = len(content)
-            # 논리적 줄 수 계산 (마지막 줄바꿈 문자 제외 위치 기준)
-            line_count = int(self.textbox._textbox.index("end-1c").split('.')[0])
-            self.status_label.configure(text=f"Lines: {line_count}  Chars: {char_count}")
+            char_count = self.document.char_count()
+            # 논리적 줄 수 (마지막 줄바꿈 문자 제외)
+            line_count = self.document.line_count()
+            stats = self.text_stats
+            minutes = stats.reading_minutes()
+            reading = f"~{round(minutes)} min" if minutes >= 1 else "< 1 min"
+            status = (f"Lines: {line_count}  Chars: {char_count}  Words: {stats.words}  "
+                      f"Hangul: {stats.hangul}  Read: {reading}")
+
+            # 선택 영역 글자 수
+            text_widget = self.textbox._textbox
+            if text_widget.tag_ranges("sel"):
+                selected = text_widget.count("sel.first", "sel.last", "chars")
+                status += f"  Sel: {selected[0] if isinstance(selected, tuple) else selected}"
+            self.status_label.configure(text=status)
         except Exception:
             pass
 
+    def get_plain_text(self):
+        """에디터의 일반 텍스트 반환 (마지막 편집 이후 다시 읽지 않음)"""
+        generation = self.text_tracker.generation
+        if self._plain_text_cache is None or self._plain_text_cache[0] != generation:
+            self._plain_text_cache = (generation, self.document.plain_text())
+        return self._plain_text_cache[1]
+
     def get_serialized_content(self, use_cache=True):
         """텍스트와 태그 정보를 포함하여 직렬화 (이미지, 미디어, PaintFrame 정보 포함)"""
-        # 캐싱: 텍스트가 변경되지 않았으면 캐시 사용
-        if use_cache and self._content_cache is not None:
-            current_text = self.textbox.get("1.0", "end-1c")
-            if self._content_cache.get('text') == current_text:
-                return self._content_cache['data']
-
-        content = []
-        current_tags = set()
+        return self._serialize_content(use_cache)[1]
+
+    def _serialize_content(self, use_cache=True):
+        """줄별 직렬화 결과와 합친 세그먼트 목록 반환
+
+        바뀌지 않은 줄은 이전 호출과 같은 리스트 객체이므로 차분 저장에서 빠르게 비교 가능
+        """
+        # 캐싱: 마지막 직렬화 이후 편집 세대 번호가 같으면 캐시 사용
+        # 표/그림판은 텍스트 위젯 밖에서 바뀔 수 있으므로 임베드가 있으면 줄 캐시에서 다시 조립
+        generation = self.text_tracker.generation
+        cache = self._content_cache
+        if use_cache and cache is not None and cache['generation'] == generation:
+            if not cache['has_windows']:
+                return cache['lines'], cache['data']
+
+        lines = []
+        has_windows = False
+        for line_items in self._serialize_lines():
+            if not any(item.get("type") == "_embed" for item in line_items):
+                lines.append(line_items)
+                continue
+
+            resolved = []
+            for item in line_items:
+                if item.get("type") == "_embed":
+                    # 임베드 객체는 현재 상태(크기, 표 데이터 등)로 매번 변환
+                    has_windows = has_windows or item["kind"] == "window"
+                    segment = self._serialize_embed(item["kind"], item["name"])
+                    if segment:
+                        resolved.append(segment)
+                else:
+                    resolved.append(item)
+            lines.append(resolved)
+
+        content = memo_delta.join_lines(lines)
+
+        # 캐시 업데이트
+        if use_cache:
+            self._content_cache = {'generation': generation, 'has_windows': has_windows,
+                                   'lines': lines, 'data': content}
+
+        return lines, content
+
+    def _on_text_edit(self, edit):
+        """텍스트 변경 추적 이벤트: 변경된 줄의 직렬화 캐시 무효화"""
+        if edit.op == "reset":
+            self._segment_cache.reset()
+        else:
+            self._segment_cache.splice(edit.first_line, edit.old_last, edit.new_last)
+
+    def _serialize_lines(self):
+        """줄별 직렬화 세그먼트 목록 반환 (편집된 줄 구간만 다시 dump)"""
+        last_line = int(self.textbox._textbox.index("end-1c").split('.')[0])
+        cache = self._segment_cache
+        cache.ensure(last_line)
+
+        for first, last in cache.dirty_runs():
+            lines = self._serialize_range(first, last, last_line)
+            if len(lines) != last - first + 1:
+                # 추적되지 않은 변경으로 줄 구성이 어긋난 경우 전체 재직렬화
+                logger.warning("Line cache out of sync, re-serializing whole document")
+                cache.reset()
+                cache.ensure(last_line)
+                cache.store(1, self._serialize_range(1, last_line, last_line))
+                break
+            cache.store(first, lines)
+
+        return cache.values()
+
+    def _serialize_range(self, first, last, last_line):
+        """first~last 줄을 dump하여 줄별 세그먼트 리스트로 변환
+
+        텍스트는 {"text", "tags"}, 이미지/위젯은 임베드 표시({"type": "_embed"})로 저장
+        """
+        text_widget = self.textbox._textbox
+        start = f"{first}.0"
+        end = f"{last + 1}.0" if last < last_line else "end-1c"
+
+        # 범위 시작 위치에 이미 적용된 태그부터 시작
+        current_tags = {tag for tag in text_widget.tag_names(start) if not is_transient_tag(tag)}
+
+        lines = []
+        line = []
         # dump: 텍스트 위젯의 내용을 (key, value, index) 튜플 리스트로 반환
-        dump_data = self.textbox._textbox.dump("1.0", "end-1c", text=True, tag=True, image=True, window=True)
+        dump_data = text_widget.dump(start, end, text=True, tag=True, image=True, window=True)
 
         for key, value, index in dump_data:
-            if key == "tagon" and value != "sel":
+            if key == "tagon" and not is_transient_tag(value):
                 current_tags.add(value)
-            elif key == "tagoff" and value != "sel":
+            elif key == "tagoff" and not is_transient_tag(value):
                 current_tags.discard(value)
             elif key == "text":
-                content.append({"text": value, "tags": list(current_tags)})
-            elif key == "window":
-                # PaintFrame 및 TableWidget 위젯 확인 및 저장
-                try:
-                    widget = self.textbox._textbox.nametowidget(value)
-                    if isinstance(widget, PaintFrame):
-                        # PaintFrame의 프로젝트 파일 경로 저장
-                        if hasattr(widget, 'auto_save_path') and widget.auto_save_path:
-                            content.append({
-                                "type": "paint",
-                                "path": widget.auto_save_path,
-                                "width": widget.canvas_width,
-                                "height": widget.canvas_height
-                            })
-                    elif isinstance(widget, TableWidget):
-                        # TableWidget 데이터 저장
-                        table_data = widget.get_table_data()
-                        content.append({
-                            "type": "table",
-                            "data": table_data
-                        })
-                except Exception as e:
-                    logger.error(f"Error processing widget: {e}")
-            elif key == "image":
-                # 이미지/미디어 정보 저장
-                image_name = value
-
-                # 미디어 태그 확인
-                media_tag = f"media_{image_name}"
-                if hasattr(self, 'medias') and media_tag in self.medias:
-                    media_data = self.medias[media_tag]
-                    content.append({
-                        "type": "media",
-                        "platform": media_data['platform'],
-                        "url": media_data['url'],
-                        "thumbnail_path": media_data['thumbnail_path'],
-                        "display_width": media_data['display_width'],
-                        "display_height": media_data['display_height']
-                    })
-                    continue
+                # 태그는 정렬해서 저장 (집합 순회 순서는 실행마다 달라 같은 줄도 다르게 비교됨)
+                tags = sorted(current_tags)
+                pieces = value.split("\n")
+                for piece in pieces[:-1]:
+                    line.append({"text": piece + "\n", "tags": list(tags)})
+                    lines.append(line)
+                    line = []
+                if pieces[-1]:
+                    line.append({"text": pieces[-1], "tags": list(tags)})
+            elif key in ("image", "window"):
+                line.append({"type": "_embed", "kind": key, "name": value})
+
+        # 문서 마지막 줄은 줄바꿈 없이 끝나므로 남은 세그먼트가 한 줄을 이룸
+        if last >= last_line:
+            lines.append(line)
+
+        return lines
+
+    def _serialize_embed(self, kind, name):
+        """임베드된 이미지/미디어/그림판/표를 저장용 세그먼트로 변환 (해당 없으면 None)"""
+        if kind == "window":
+            # PaintFrame 및 TableWidget 위젯 확인 및 저장
+            try:
+                widget = self.textbox._textbox.nametowidget(name)
+                if isinstance(widget, PaintFrame):
+                    # PaintFrame의 프로젝트 파일 경로 저장
+                    if hasattr(widget, 'auto_save_path') and widget.auto_save_path:
+                        return {
+                            "type": "paint",
+                            "path": widget.auto_save_path,
+                            "width": widget.canvas_width,
+                            "height": widget.canvas_height
+                        }
+                elif isinstance(widget, TableWidget):
+                    # TableWidget 데이터 저장
+                    return {
+                        "type": "table",
+                        "data": widget.get_table_data()
+                    }
+                elif isinstance(widget, AttachmentBlock):
+                    # 첨부 블록은 파일 경로와 요약만 저장
+                    return widget.get_data()
+            except Exception as e:
+                logger.error(f"Error processing widget: {e}")
+            return None
+
+        # 미디어 태그 확인
+        media_tag = f"media_{name}"
+        if hasattr(self, 'medias') and media_tag in self.medias:
+            media_data = self.medias[media_tag]
+            return {
+                "type": "media",
+                "platform": media_data['platform'],
+                "url": media_data['url'],
+                "thumbnail_path": media_data['thumbnail_path'],
+                "display_width": media_data['display_width'],
+                "display_height": media_data['display_height']
+            }
 
-                # 이미지 태그 확인
-                image_tag = f"img_{image_name}"
-                if hasattr(self, 'images') and image_tag in self.images:
-                    img_data = self.images[image_tag]
-                    content.append({
-                        "type": "image",
-                        "path": img_data['path'],
-                        "display_width": img_data['display_width'],
-                        "display_height": img_data['display_height']
-                    })
+        # 이미지 태그 확인
+        image_tag = f"img_{name}"
+        if hasattr(self, 'images') and image_tag in self.images:
+            img_data = self.images[image_tag]
+            return {
+                "type": "image",
+                "path": img_data['path'],
+                "display_width": img_data['display_width'],
+                "display_height": img_data['display_height']
+            }
+        return None
 
-        # 캐시 업데이트
-        if use_cache:
-            current_text = self.textbox.get("1.0", "end-1c")
-            self._content_cache = {'text': current_text, 'data': content}
+    def _classify_embed(self, kind, name):
+        """목차용 임베드 분류: (항목 종류, 이름) 또는 None"""
+        if kind == "window":
+            try:
+                widget = self.textbox._textbox.nametowidget(name)
+            except (KeyError, tkinter.TclError):
+                return None
+            if isinstance(widget, PaintFrame):
+                return ("paint", "그림판")
+            if isinstance(widget, TableWidget):
+                return ("table", "표")
+            if isinstance(widget, AttachmentBlock):
+                return ("attachment", f"붙여넣은 텍스트 {widget.lines:,}줄")
+            return None
+
+        media_data = self.medias.get(f"media_{name}")
+        if media_data:
+            return ("media", media_data.get('platform') or "미디어")
+        image_data = self.images.get(f"img_{name}")
+        if image_data:
+            return ("image", os.path.basename(image_data.get('path') or "") or "이미지")
+        return None
+
+    def toggle_outline_panel(self):
+        """목차 패널 표시/숨김"""
+        self._outline_visible = not self._outline_visible
+        if self._outline_visible:
+            self.outline_panel.grid(row=0, column=2, sticky="ns", padx=(5, 0))
+            self.outline_button.configure(fg_color=PASTEL_COLORS["primary"])
+            self._outline_shown = None
+            self._refresh_outline()
+        else:
+            self.outline_panel.grid_remove()
+            self.outline_button.configure(fg_color="transparent")
+
+    def _refresh_outline(self):
+        """목차 패널 갱신 (패널이 보일 때만, 항목이 바뀐 경우에만 다시 그림)"""
+        if not self._outline_visible:
+            return
+
+        entries = self.outline.entries()
+        if entries == self._outline_shown:
+            return
+        self._outline_shown = entries
+
+        for child in self.outline_panel.winfo_children():
+            child.destroy()
+
+        done, total = outline.checklist_progress(entries)
+        header = "목차" if not total else f"목차  ☑ {done}/{total}"
+        ctk.CTkLabel(self.outline_panel, text=header, font=("Roboto Medium", 13, "bold"),
+                     anchor="w").pack(fill="x", padx=5, pady=(5, 5))
+
+        icons = {"table": "⊞", "paint": "🎨", "image": "🖼", "media": "📹", "attachment": "📎"}
+        for entry in entries[:OUTLINE_MAX_ROWS]:
+            if entry.kind == "heading":
+                text = "  " * (entry.level - 1) + entry.label
+            elif entry.kind == "checklist":
+                text = f"{'☑' if entry.done else '☐'} {entry.label}"
+            else:
+                text = f"{icons.get(entry.kind, '')} {entry.label}"
+            ctk.CTkButton(
+                self.outline_panel, text=text, anchor="w", height=24, fg_color="transparent",
+                font=("Roboto Medium", 12, "bold" if entry.kind == "heading" else "normal"),
+                command=lambda line=entry.line: self.jump_to_line(line)
+            ).pack(fill="x", padx=2)
+
+        if len(entries) > OUTLINE_MAX_ROWS:
+            ctk.CTkLabel(self.outline_panel, text=f"... {len(entries) - OUTLINE_MAX_ROWS}개 더",
+                         text_color="gray").pack(fill="x", padx=5)
+
+    def jump_to_line(self, line):
+        """에디터 커서를 해당 줄로 이동"""
+        text_widget = self.textbox._textbox
+        text_widget.mark_set("insert", f"{line}.0")
+        text_widget.see(f"{line}.0")
+        text_widget.focus_set()
+        self.update_current_format()
+
+    def show_open_tasks(self):
+        """모든 메모의 미완료 체크리스트 항목 모아보기 (메모 메타데이터의 요약만 사용)"""
+        # 현재 메모의 저장 대기 중인 변경을 먼저 반영
+        self._flush_pending_save()
+
+        dialog = ctk.CTkToplevel(self)
+        dialog.title("할 일 모아보기")
+        dialog.geometry("400x500")
+        dialog.transient(self)
+
+        frame = ctk.CTkScrollableFrame(dialog)
+        frame.pack(fill="both", expand=True, padx=10, pady=10)
+
+        memos = sorted(
+            ((memo_id, data) for memo_id, data in self.memos.items()
+             if not data.get("locked", False) and data.get("checklist", {}).get("open")),
+            key=lambda item: item[1].get("timestamp", ""), reverse=True
+        )
+        if not memos:
+            ctk.CTkLabel(frame, text="미완료 항목이 없습니다", text_color="gray").pack(pady=20)
+            return
+
+        for memo_id, data in memos:
+            checklist = data["checklist"]
+            ctk.CTkLabel(
+                frame, text=f"{data.get('title', 'New Memo')}  ☑ {checklist['done']}/{checklist['total']}",
+                font=("Roboto Medium", 13, "bold"), anchor="w"
+            ).pack(fill="x", padx=5, pady=(8, 2))
+
+            remaining = checklist["total"] - checklist["done"]
+            for label in checklist["open"]:
+                ctk.CTkButton(
+                    frame, text=f"☐ {label}", anchor="w", height=24, fg_color="transparent",
+                    command=lambda m=memo_id, l=label: self._open_task(dialog, m, l)
+                ).pack(fill="x", padx=2)
+            if remaining > len(checklist["open"]):
+                ctk.CTkLabel(frame, text=f"... {remaining - len(checklist['open'])}개 더",
+                             text_color="gray").pack(fill="x", padx=5)
+
+    def _open_task(self, dialog, memo_id, label):
+        """할 일 항목의 메모를 열고 해당 줄로 이동"""
+        dialog.destroy()
+        if memo_id != self.current_memo_id:
+            self.load_memo_content(memo_id)
+        self._jump_to_task(memo_id, label)
+
+    def _jump_to_task(self, memo_id, label):
+        """미완료 체크리스트 항목 줄로 이동 (점진적 로드 중이면 로드가 끝난 뒤 이동)"""
+        if self.current_memo_id != memo_id:
+            return
+        if self._memo_load is not None:
+            self.after(100, lambda: self._jump_to_task(memo_id, label))
+            return
 
-        return content
+        for entry in self.outline.entries():
+            if entry.kind == "checklist" and not entry.done and entry.label == label:
+                self.jump_to_line(entry.line)
+                return
 
     def _cleanup_resources(self):
         """메모리 누수 방지를 위한 리소스 정리"""
@@ -2212,17 +3006,23 @@ class MemoApp(ctk.CTk):
 
     def create_new_memo(self):
         """화면을 비우고 새 메모 모드로 전환"""
+        # 저장 대기 중인 변경 사항을 먼저 저장
+        self._flush_pending_save()
+
         # 이전 메모 버튼을 파스텔 녹색으로 변경
-        if self.current_memo_id and self.current_memo_id in self.memo_buttons:
-            self.memo_buttons[self.current_memo_id].configure(fg_color="#C8E6C9")
+        self._set_row_selected(self.current_memo_id, False)
 
-        # 리소스 정리
-        self._cleanup_resources()
+        # 진행 중인 메모 로드 취소 후 빈 뷰로 전환 (이전 메모 뷰는 캐시에 보관하거나 정리)
+        self._cancel_memo_load()
+        self._switch_editor_view(None)
 
         self.current_memo_id = None
         self.is_modified = False  # 새 메모는 수정되지 않은 상태
         self.textbox.delete("1.0", "end")
-        self.current_input_tags = set()  # 서식 초기화
+        self.undo_manager.clear()  # 이전 메모 내용의 실행 취소 기록 제거
+        self._active_view.memo_id = None
+        self._active_view.source = None
+        self.current_input_tags = format_engine.InputTags()  # 서식 초기화
         self.manual_format_mode = False  # 수동 서식 모드 해제
 
         # 이미지/미디어 참조 초기화
@@ -2255,12 +3055,12 @@ class MemoApp(ctk.CTk):
     def delete_memo(self):
         """현재 메모 삭제"""
         if self.current_memo_id is not None and self.current_memo_id in self.memos:
-            # 저장 타이머가 있다면 취소 (삭제된 메모가 다시 저장되는 것 방지)
-            if self.save_timer:
-                self.after_cancel(self.save_timer)
-                self.save_timer = None
+            # 붙여넣기와 저장 타이머가 있다면 취소 (삭제된 메모가 다시 저장되는 것 방지)
+            self._cancel_paste()
+            self.save_scheduler.cancel()
 
             del self.memos[self.current_memo_id]
+            self.prefetcher.discard(self.current_memo_id)
             self.save_memos()
             self.create_new_memo()
             self.refresh_sidebar()
@@ -2289,161 +3089,321 @@ class MemoApp(ctk.CTk):
                     messagebox.showerror("오류", "비밀번호가 일치하지 않습니다.")
                     return
 
+            # 저장 대기 중인 변경 사항을 먼저 저장 (이전 메모 뷰를 보관하기 전에)
+            self._flush_pending_save()
+
             # 이전 메모 버튼을 파스텔 녹색으로 변경
-            if self.current_memo_id and self.current_memo_id in self.memo_buttons:
-                self.memo_buttons[self.current_memo_id].configure(fg_color="#C8E6C9")
+            self._set_row_selected(self.current_memo_id, False)
 
-            # 리소스 정리 (메모리 누수 방지)
-            self._cleanup_resources()
+            # 진행 중인 메모 로드 취소
+            self._cancel_memo_load()
+
+            # 최근 연 메모 목록 갱신 (이전 메모가 가장 앞)
+            if self.current_memo_id is not None:
+                if self.current_memo_id in self._recent_memo_ids:
+                    self._recent_memo_ids.remove(self.current_memo_id)
+                self._recent_memo_ids.insert(0, self.current_memo_id)
+                del self._recent_memo_ids[prefetch.ADJACENT_COUNT * 2:]
+
+            # 숨겨 둔 뷰가 있으면 그대로 표시, 없으면 빈 뷰에 로드 (리소스 정리 포함)
+            restored = self._switch_editor_view(memo_id)
 
             self.current_memo_id = memo_id
             self.is_modified = False  # 새로 로드하면 수정되지 않은 상태
-            content = self.memos[memo_id]["content"]
-            rich_content = self.memos[memo_id].get("rich_content", None)
 
-            self.textbox.delete("1.0", "end")
+            if not restored:
+                content = self.memos[memo_id]["content"]
+                rich_content = self.memos[memo_id].get("rich_content", None)
 
-            # 이미지/미디어 참조 초기화
-            if not hasattr(self, 'images'):
-                self.images = {}
-            if not hasattr(self, 'medias'):
-                self.medias = {}
-            if not hasattr(self, 'paint_frames'):
-                self.paint_frames = []
-            if not hasattr(self, 'table_widgets'):
-                self.table_widgets = []
-
-            if rich_content:
-                # 서식 정보가 있는 경우 복원
-                for segment in rich_content:
-                    # 미디어 데이터 처리
-                    if segment.get("type") == "media":
-                        platform = segment.get("platform")
-                        url = segment.get("url")
-                        thumbnail_path = segment.get("thumbnail_path")
-                        display_width = segment.get("display_width")
-                        display_height = segment.get("display_height")
-                        if thumbnail_path and os.path.exists(thumbnail_path):
-                            self.load_media_from_path(thumbnail_path, platform, url, display_width, display_height)
-                        continue
-
-                    # 이미지 데이터 처리
-                    if segment.get("type") == "image":
-                        image_path = segment.get("path")
-                        display_width = segment.get("display_width")
-                        display_height = segment.get("display_height")
-                        if image_path and os.path.exists(image_path):
-                            self.load_image_from_path(image_path, display_width, display_height)
-                        continue
-
-                    # PaintFrame 데이터 처리
-                    if segment.get("type") == "paint":
-                        paint_path = segment.get("path")
-                        width = segment.get("width", 600)
-                        height = segment.get("height", 400)
-                        if paint_path and os.path.exists(paint_path):
-                            self.load_paint_from_path(paint_path, width, height)
-                        continue
-
-                    # TableWidget 데이터 처리
-                    if segment.get("type") == "table":
-                        table_data = segment.get("data")
-                        if table_data:
-                            self.load_table_from_data(table_data)
-                        continue
-
-                    # 일반 텍스트 처리
-                    text = segment.get("text", "")
-                    tags = segment.get("tags", [])
-
-                    for tag in tags:
-                        self.configure_tag_if_needed(tag) # 동적 태그 설정 복구
-                    self.textbox._textbox.insert("end", text, tuple(tags))
-            else:
-                # 구버전 데이터 호환 (단순 텍스트)
-                self.textbox.insert("1.0", content)
+                # 로드 중에는 줄 단위 변경 추적을 멈추고 끝난 뒤 캐시 전체 무효화
+                with self.text_tracker.suspend():
+                    self.textbox.delete("1.0", "end")
+                    if rich_content:
+                        # 서식 정보가 있는 경우 복원 (첫 화면만 즉시, 나머지는 청크 단위로)
+                        self._start_memo_load(memo_id, rich_content)
+                    else:
+                        # 구버전 데이터 호환 (단순 텍스트)
+                        self.textbox.insert("1.0", content)
+
+                self._active_view.memo_id = memo_id
+                self._active_view.source = rich_content
 
             # 새로 선택한 메모 버튼을 보라색으로 변경
             self.update_memo_button_color()
             self.update_status_bar()
 
-            # 줄 번호 갱신
+            # 줄 번호, 목차 및 구문 강조 갱신
             self.linenumbers.redraw()
+            self._refresh_outline()
+            self._refresh_highlight()
 
-    def load_paint_from_path(self, paint_path, width, height):
-        """파일 경로로부터 PaintFrame 로드 및 표시"""
-        try:
-            # PaintFrame 생성
-            paint_frame = PaintFrame(self.textbox._textbox, width=width, height=height, use_overlay_toolbar=False)
+            # 유휴 시간에 다음에 열 가능성이 높은 메모 준비
+            self._schedule_prefetch()
 
-            # 자동 저장 경로 설정
-            paint_frame.auto_save_path = paint_path
+    def _start_memo_load(self, memo_id, rich_content):
+        """메모 내용을 첫 화면 분량만 즉시 삽입하고 나머지는 after()로 나눠 삽입"""
+        # 미리 준비된 로드 계획이 있으면 재사용
+        plan = self.prefetcher.plan_for(memo_id, rich_content)
 
-            # 프로젝트 파일 로드
-            if os.path.exists(paint_path):
-                paint_frame.load_project_from_path(paint_path)
+        # 동적 태그는 세그먼트마다가 아니라 삽입 전에 한 번에 등록
+        self.tag_registry.ensure_all(plan.tags)
 
-            # 편집 완료 상태로 설정 (툴바와 레이어 패널 숨김)
-            paint_frame.finish_editing()
+        for step in plan.steps[:plan.first_screen]:
+            self._insert_load_step(step, "end")
 
-            # 텍스트 위젯에 삽입
-            self.textbox._textbox.insert("end", "\n")
-            self.textbox._textbox.window_create("end", window=paint_frame, padx=5, pady=5)
-            self.textbox._textbox.insert("end", "\n")
+        if plan.first_screen >= len(plan.steps):
+            return
+
+        # 사용자가 로드 중에 편집해도 나머지 내용이 항상 문서 끝 쪽에 이어지도록 마크 사용
+        self.textbox._textbox.mark_set(LOAD_MARK, "end-1c")
+        self.textbox._textbox.mark_gravity(LOAD_MARK, "right")
+        self._memo_load = {
+            "memo_id": memo_id,
+            "plan": plan,
+            "position": plan.first_screen,
+            "timer": self.after(1, self._load_next_chunk),
+        }
+        self._show_load_progress()
+
+    def _schedule_prefetch(self, delay=300):
+        """인접 메모 및 최근 메모 미리 준비 예약"""
+        if self._prefetch_timer:
+            self.after_cancel(self._prefetch_timer)
+        self._prefetch_queue = prefetch.prefetch_candidates(
+            self.current_memo_id, self._sidebar_order(), self._recent_memo_ids
+        )
+        self._prefetch_timer = self.after(delay, self._run_prefetch)
+
+    def _run_prefetch(self):
+        """유휴 시간에 메모 하나씩 로드 계획 준비 (잠긴 메모는 제외)"""
+        self._prefetch_timer = None
+
+        # 메모 로드 중에는 로드가 끝날 때까지 대기
+        if self._memo_load is not None:
+            self._prefetch_timer = self.after(100, self._run_prefetch)
+            return
+
+        while self._prefetch_queue:
+            memo_id = self._prefetch_queue.pop(0)
+            data = self.memos.get(memo_id)
+            if not data or data.get("locked", False) or not data.get("rich_content"):
+                continue
+            if self.prefetcher.is_prepared(memo_id, data["rich_content"]):
+                continue
+
+            self.prefetcher.prepare(memo_id, data["rich_content"])
+            if self._prefetch_queue:
+                # 한 번에 하나씩만 준비하여 입력 반응성 유지
+                self._prefetch_timer = self.after(50, lambda: self.after_idle(self._run_prefetch))
+            return
+
+    def _load_next_chunk(self, finish=False):
+        """시간 예산 안에서 남은 로드 단계를 삽입 (finish면 남은 단계를 모두 삽입)"""
+        load = self._memo_load
+        if load is None:
+            return
+
+        load["timer"] = None
+        steps = load["plan"].steps
+        deadline = time.perf_counter() + memo_loader.CHUNK_BUDGET_MS / 1000
+
+        with self.text_tracker.suspend():
+            while load["position"] < len(steps):
+                self._insert_load_step(steps[load["position"]], LOAD_MARK)
+                load["position"] += 1
+                if not finish and time.perf_counter() >= deadline:
+                    break
+
+        if load["position"] < len(steps):
+            self._show_load_progress()
+            load["timer"] = self.after(1, self._load_next_chunk)
+            return
 
-            # PaintFrame 객체가 가비지 컬렉션되지 않도록 참조 저장
-            self.paint_frames.append(paint_frame)
+        # 로드 완료
+        self._memo_load = None
+        self.textbox._textbox.mark_unset(LOAD_MARK)
+        self.update_status_bar()
+        self.linenumbers.redraw()
+        self._refresh_outline()
+        self._refresh_highlight()
+
+    def _finish_memo_load(self):
+        """진행 중인 점진적 로드의 남은 단계를 즉시 삽입 (로드 중 편집한 내용을 저장하기 전)"""
+        load = self._memo_load
+        if load is None:
+            return
+        if load["timer"]:
+            self.after_cancel(load["timer"])
+        self._load_next_chunk(finish=True)
+
+    def _cancel_memo_load(self):
+        """진행 중인 점진적 로드 취소 (다른 메모로 전환 시)"""
+        load = self._memo_load
+        if load is None:
+            return
+
+        self._memo_load = None
+        self._active_view.source = None  # 일부만 로드된 뷰는 캐시에 보관하지 않음
+        if load["timer"]:
+            self.after_cancel(load["timer"])
+        self.textbox._textbox.mark_unset(LOAD_MARK)
+
+    def _show_load_progress(self):
+        """상태 표시줄에 로드 진행률 표시"""
+        load = self._memo_load
+        percent = load["position"] * 100 // len(load["plan"].steps)
+        self.status_label.configure(text=f"Loading... {percent}%")
+
+    def _insert_load_step(self, step, at):
+        """로드 단계 하나를 at 위치에 삽입"""
+        if step[0] == "text":
+            self.textbox._textbox.insert(at, step[1], step[2])
+            return
+
+        segment = step[1]
+        # 미디어 데이터 처리
+        if segment.get("type") == "media":
+            platform = segment.get("platform")
+            url = segment.get("url")
+            thumbnail_path = segment.get("thumbnail_path")
+            display_width = segment.get("display_width")
+            display_height = segment.get("display_height")
+            if thumbnail_path and os.path.exists(thumbnail_path):
+                self.load_media_from_path(thumbnail_path, platform, url, display_width, display_height, at=at)
+
+        # 이미지 데이터 처리
+        elif segment.get("type") == "image":
+            image_path = segment.get("path")
+            display_width = segment.get("display_width")
+            display_height = segment.get("display_height")
+            if image_path and os.path.exists(image_path):
+                self.load_image_from_path(image_path, display_width, display_height, at=at)
+
+        # PaintFrame 데이터 처리
+        elif segment.get("type") == "paint":
+            paint_path = segment.get("path")
+            width = segment.get("width", 600)
+            height = segment.get("height", 400)
+            if paint_path and os.path.exists(paint_path):
+                self.load_paint_from_path(paint_path, width, height, at=at)
+
+        # TableWidget 데이터 처리
+        elif segment.get("type") == "table":
+            table_data = segment.get("data")
+            if table_data:
+                self.load_table_from_data(table_data, at=at)
+
+        # 첨부 블록 처리
+        elif segment.get("type") == "attachment":
+            attachment_path = segment.get("path")
+            if attachment_path and os.path.exists(attachment_path):
+                block = self._create_attachment_block(
+                    attachment_path, segment.get("lines", 0), segment.get("chars", 0), segment.get("summary", "")
+                )
+                self.textbox._textbox.window_create(at, window=block, padx=5, pady=5)
+
+    def _create_paint_frame(self, paint_path, width, height):
+        """프로젝트 파일로부터 편집 완료 상태의 PaintFrame 생성 (삽입은 호출하는 쪽에서)"""
+        # PaintFrame 생성
+        paint_frame = PaintFrame(self.textbox._textbox, width=width, height=height, use_overlay_toolbar=False)
+
+        # 자동 저장 경로 설정
+        paint_frame.auto_save_path = paint_path
+
+        # 프로젝트 파일 로드
+        if os.path.exists(paint_path):
+            paint_frame.load_project_from_path(paint_path)
+
+        # 편집 완료 상태로 설정 (툴바와 레이어 패널 숨김)
+        paint_frame.finish_editing()
+
+        # PaintFrame 객체가 가비지 컬렉션되지 않도록 참조 저장
+        self.paint_frames.append(paint_frame)
+        return paint_frame
+
+    def _create_table_widget(self, table_data):
+        """표 데이터로부터 TableWidget 생성 (삽입은 호출하는 쪽에서)"""
+        table_widget = TableWidget(
+            self.textbox._textbox, rows=table_data.get("rows", 3), cols=table_data.get("cols", 3)
+        )
+
+        # 표 데이터 복원
+        table_widget.set_table_data(table_data)
+
+        # TableWidget 객체가 가비지 컬렉션되지 않도록 참조 저장
+        self.table_widgets.append(table_widget)
+        return table_widget
+
+    def load_paint_from_path(self, paint_path, width, height, at="end"):
+        """파일 경로로부터 PaintFrame 로드 및 at 위치에 표시"""
+        try:
+            paint_frame = self._create_paint_frame(paint_path, width, height)
+
+            # 텍스트 위젯에 삽입
+            self.textbox._textbox.insert(at, "\n")
+            self.textbox._textbox.window_create(at, window=paint_frame, padx=5, pady=5)
+            self.textbox._textbox.insert(at, "\n")
 
             logger.info(f"PaintFrame loaded from: {paint_path}")
 
         except Exception as e:
             logger.error(f"Failed to load paint frame: {e}", exc_info=True)
 
-    def load_table_from_data(self, table_data):
-        """표 데이터로부터 TableWidget 로드 및 표시"""
+    def load_table_from_data(self, table_data, at="end"):
+        """표 데이터로부터 TableWidget 로드 및 at 위치에 표시"""
         try:
-            # TableWidget 생성
-            rows = table_data.get("rows", 3)
-            cols = table_data.get("cols", 3)
-            table_widget = TableWidget(self.textbox._textbox, rows=rows, cols=cols)
-
-            # 표 데이터 복원
-            table_widget.set_table_data(table_data)
+            table_widget = self._create_table_widget(table_data)
 
             # 텍스트 위젯에 삽입
-            self.textbox._textbox.insert("end", "\n")
-            self.textbox._textbox.window_create("end", window=table_widget, padx=5, pady=5)
-            self.textbox._textbox.insert("end", "\n")
-
-            # TableWidget 객체가 가비지 컬렉션되지 않도록 참조 저장
-            self.table_widgets.append(table_widget)
+            self.textbox._textbox.insert(at, "\n")
+            self.textbox._textbox.window_create(at, window=table_widget, padx=5, pady=5)
+            self.textbox._textbox.insert(at, "\n")
 
-            logger.info(f"TableWidget loaded: {rows}x{cols}")
+            logger.info(f"TableWidget loaded: {table_widget.rows}x{table_widget.cols}")
 
         except Exception as e:
             logger.error(f"Failed to load table widget: {e}", exc_info=True)
 
-    def load_image_from_path(self, image_path, display_width=None, display_height=None):
-        """파일 경로로부터 이미지 로드 및 표시"""
-        try:
-            from PIL import Image, ImageTk
+    def _describe_window(self, name):
+        """실행 취소용: 지워질 임베드 위젯을 다시 만들 수 있는 저장용 세그먼트 (없으면 None)"""
+        return self._serialize_embed("window", name)
 
-            # 이미지 로드
-            img = Image.open(image_path)
-            original_width, original_height = img.width, img.height
+    def _restore_window(self, segment, index):
+        """실행 취소용: 저장용 세그먼트로 임베드 위젯을 다시 만들어 index에 삽입 (실패하면 False)
 
-            # 저장된 표시 크기가 있으면 사용, 없으면 기본 크기 조절
-            if display_width and display_height:
-                img = img.resize((display_width, display_height), Image.Resampling.LANCZOS)
+        Tk는 지워진 임베드 위젯을 파괴하므로 같은 위젯을 다시 넣을 수 없음
+        """
+        kind = segment.get("type")
+        try:
+            if kind == "table":
+                widget = self._create_table_widget(segment["data"])
+            elif kind == "paint":
+                widget = self._create_paint_frame(segment["path"], segment["width"], segment["height"])
+            elif kind == "attachment":
+                # 미사용 파일 정리로 첨부 파일이 이미 지워졌으면 되살릴 수 없음
+                if not os.path.exists(segment["path"]):
+                    return False
+                widget = self._create_attachment_block(
+                    segment["path"], segment["lines"], segment["chars"], segment["summary"]
+                )
             else:
-                # 최대 너비 제한
-                max_width = 600
-                if img.width > max_width:
-                    ratio = max_width / img.width
-                    new_size = (max_width, int(img.height * ratio))
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
-                display_width = img.width
-                display_height = img.height
+                return False
+        except Exception as e:
+            logger.error(f"Failed to restore embedded widget: {e}", exc_info=True)
+            return False
+        self.textbox._textbox.window_create(index, window=widget, padx=5, pady=5)
+        return True
+
+    def load_image_from_path(self, image_path, display_width=None, display_height=None, at="end"):
+        """파일 경로로부터 이미지 로드 및 at 위치에 표시"""
+        try:
+            from PIL import ImageTk
+
+            # 미리 디코딩된 이미지가 있으면 사용, 없으면 로드 후 표시 크기로 조절
+            decoded = self.prefetcher.take_image(image_path, display_width, display_height)
+            if decoded is None:
+                decoded = prefetch.decode_image(image_path, display_width, display_height)
+            img, original_width, original_height, display_width, display_height = decoded
 
             # PhotoImage로 변환
             photo = ImageTk.PhotoImage(img)
@@ -2452,10 +3412,10 @@ class MemoApp(ctk.CTk):
             filename = os.path.basename(image_path)
 
             # 이미지 삽입
-            self.textbox._textbox.insert("end", "\n")
-            image_index = self.textbox._textbox.index("insert")
+            self.textbox._textbox.insert(at, "\n")
+            image_index = self.textbox._textbox.index("end-1c" if at == "end" else at)
             self.textbox._textbox.image_create(image_index, image=photo, name=filename)
-            self.textbox._textbox.insert("end", "\n")
+            self.textbox._textbox.insert(at, "\n")
 
             # 이미지 태그 및 메타데이터
             image_tag = f"img_{filename}"
@@ -2479,16 +3439,18 @@ class MemoApp(ctk.CTk):
             # 이미지 로드 실패 시 마커만 표시
             logger.warning(f"Failed to load image from {image_path}: {e}")
             filename = os.path.basename(image_path) if image_path else "알 수 없음"
-            self.textbox._textbox.insert("end", f"[이미지 로드 실패: {filename}]\n")
+            self.textbox._textbox.insert(at, f"[이미지 로드 실패: {filename}]\n")
 
-    def load_media_from_path(self, thumbnail_path, platform, url, display_width, display_height):
-        """저장된 미디어 썸네일 복원"""
+    def load_media_from_path(self, thumbnail_path, platform, url, display_width, display_height, at="end"):
+        """저장된 미디어 썸네일을 at 위치에 복원"""
         try:
-            from PIL import Image, ImageTk
+            from PIL import ImageTk
 
-            # 썸네일 로드
-            img = Image.open(thumbnail_path)
-            img = img.resize((display_width, display_height), Image.Resampling.LANCZOS)
+            # 썸네일 로드 (미리 디코딩된 썸네일이 있으면 사용)
+            decoded = self.prefetcher.take_image(thumbnail_path, display_width, display_height)
+            if decoded is None:
+                decoded = prefetch.decode_image(thumbnail_path, display_width, display_height)
+            img = decoded[0]
 
             # PhotoImage로 변환
             photo = ImageTk.PhotoImage(img)
@@ -2506,10 +3468,10 @@ class MemoApp(ctk.CTk):
             unique_name = f"media_{platform}_{int(time.time() * 1000)}"
 
             # 미디어 위젯 삽입
-            self.textbox._textbox.insert("end", "\n")
-            media_index = self.textbox._textbox.index("insert")
+            self.textbox._textbox.insert(at, "\n")
+            media_index = self.textbox._textbox.index("end-1c" if at == "end" else at)
             self.textbox._textbox.image_create(media_index, image=photo, name=unique_name)
-            self.textbox._textbox.insert("end", "\n")
+            self.textbox._textbox.insert(at, "\n")
 
             # 미디어 태그 및 메타데이터
             media_tag = f"media_{unique_name}"
@@ -2543,7 +3505,7 @@ class MemoApp(ctk.CTk):
             logger.warning(f"Failed to restore media from {thumbnail_path}: {e}")
             platform_display = platform.upper() if platform else "알 수 없음"
             url_display = url if url else "링크 없음"
-            self.textbox._textbox.insert("end", f"[{platform_display} 미디어: {url_display}]\n")
+            self.textbox._textbox.insert(at, f"[{platform_display} 미디어: {url_display}]\n")
 
     def on_media_single_click(self, _event, media_info):
         """미디어 싱글클릭 처리 (더블클릭과 구분)"""
@@ -2731,48 +3693,60 @@ class MemoApp(ctk.CTk):
 
     def on_text_change(self, event=None):
         """텍스트 변경 시 호출: 자동 저장 및 사이드바 갱신"""
-        # 캐시 무효화
-        self._content_cache = None
-
-        # UI 업데이트 디바운싱 (100ms)
-        if self.ui_update_timer:
-            self.after_cancel(self.ui_update_timer)
-        self.ui_update_timer = self.after(100, self._update_ui_elements)
+        # UI 업데이트 디바운싱 (기본 100ms, 갱신 비용에 따라 최대 500ms)
+        self.ui_scheduler.trigger()
 
         # 수정 상태로 변경 (즉시)
         if not self.is_modified:
             self.is_modified = True
             self.update_memo_button_color()
 
-        # 저장 디바운싱 (500ms)
-        if self.save_timer:
-            self.after_cancel(self.save_timer)
-        self.save_timer = self.after(500, self._process_save)
+        # 저장 디바운싱 (기본 500ms, 저장 비용에 따라 최대 3초, 계속 입력해도 5초마다 저장)
+        self.save_scheduler.trigger()
+
+    def _ime_composing(self):
+        """IME 조합 중인지 여부 (Tk가 조합 중인 글자에 IMEmarkedtext 태그를 붙임)"""
+        try:
+            return bool(self.textbox._textbox.tag_ranges("IMEmarkedtext"))
+        except tkinter.TclError:
+            return False
 
     def _update_ui_elements(self):
         """UI 요소 업데이트 (디바운싱됨)"""
-        self.ui_update_timer = None
         self.update_status_bar()
         self.linenumbers.redraw()
+        self._refresh_outline()
+        self._refresh_highlight()
+
+    def _refresh_highlight(self):
+        """코드 블록 구문 강조 갱신 (나눠서 로드하는 중에는 로드가 끝난 뒤 한 번에)"""
+        if self._memo_load is None:
+            self.highlighter.highlight()
 
     def _process_save(self):
-        """실제 저장 로직 수행"""
-        self.save_timer = None
-        content = self.textbox.get("1.0", "end").strip()
+        """실제 저장 로직 수행 (로드 중·IME 조합 중에는 스케줄러가 호출을 미룸)"""
+        content = self.get_plain_text().strip()
 
         # 내용이 없으면 저장하지 않음 (새 메모 상태 유지)
-        if not content:
+        # 첨부 블록만 있는 메모는 저장해야 첨부 파일이 미사용 파일 정리에서 지워지지 않음
+        if not content and not self._has_attachment_block():
             return
 
-        # 서식 포함 데이터 직렬화
-        rich_content = self.get_serialized_content()
+        # 서식 포함 데이터 직렬화 (줄 단위 결과는 차분 저장에 사용)
+        lines, rich_content = self._serialize_content()
 
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        # 제목 생성 (첫 줄 혹은 앞 20자)
-        title = content.split('\n')[0][:20]
-        if len(content.split('\n')[0]) > 20:
-            title += "..."
+        # 사이드바 미리보기 (저장 시 한 번만 계산하여 메모 메타데이터에 캐시, 잠긴 메모는 비움)
+        locked = self.current_memo_id in self.memos and self.memos[self.current_memo_id].get("locked", False)
+        preview = "" if locked else text_utils.make_preview(content)
+
+        # 체크리스트 요약 (문서 모델의 본문에서 계산, 할 일 모아보기는 메모를 열지 않고 이 값만 사용)
+        # 잠긴 메모는 미리보기와 같은 이유로 항목 이름을 남기지 않음
+        checklist = text_utils.checklist_summary(() if locked else text_utils.checklist_items(content))
+
+        # 제목 생성 (설정한 정책에 따라 앞쪽 줄만 읽어 계산, 최대 20자)
+        title = text_utils.derive_title(self.document.iter_lines(), self.title_policy)
         if not title:
             title = "New Memo"
 
@@ -2788,13 +3762,23 @@ class MemoApp(ctk.CTk):
                 "content": content,
                 "rich_content": rich_content,
                 "timestamp": timestamp,
+                "preview": preview,
+                "checklist": checklist,
             }
             title_changed = True  # 새 메모는 항상 사이드바 재생성 필요
+            baseline = None
         else:
+            # 차분 저장 기준: 마지막으로 저장한 줄 목록
+            baseline = self._saved_lines(self.current_memo_id)
+            # 이전 내용으로 만든 로드 계획은 더 쓰이지 않으므로 미리 준비 캐시에서 제거
+            self.prefetcher.discard(self.current_memo_id)
+
             # 기존 메모 업데이트
             self.memos[self.current_memo_id]["content"] = content
             self.memos[self.current_memo_id]["rich_content"] = rich_content
             self.memos[self.current_memo_id]["timestamp"] = timestamp
+            self.memos[self.current_memo_id]["preview"] = preview
+            self.memos[self.current_memo_id]["checklist"] = checklist
 
             # 수동으로 설정한 제목이 아닌 경우에만 자동 생성 제목으로 업데이트
             if not self.memos[self.current_memo_id].get("custom_title", False):
@@ -2802,20 +3786,57 @@ class MemoApp(ctk.CTk):
                     self.memos[self.current_memo_id]["title"] = title
                     title_changed = True
 
-        # 최적화: 제목이 변경된 경우에만 사이드바 재생성
+        # 새 메모는 전체 파일로, 기존 메모는 마지막 저장 이후 바뀐 줄만 op 로그에 기록
+        # (op 로그 기록에 실패하면 전체 파일로 저장)
+        memo_data = self.memos[self.current_memo_id]
+        if baseline is None:
+            saved = self.data_manager.save_memo(self.current_memo_id, memo_data)
+        else:
+            op = memo_delta.make_op(baseline, lines, memo_data)
+            saved = (self.data_manager.save_memo_delta(self.current_memo_id, op, memo_data)
+                     or self.data_manager.save_memo(self.current_memo_id, memo_data))
+
+        # 에디터 뷰가 표시 중인 메모와 내용 기록 (뷰 캐시 유효성 확인 및 다음 차분 기준)
+        # 저장에 실패하면 기록된 기준을 알 수 없으므로 다음 저장은 전체 파일로
+        self._active_view.memo_id = self.current_memo_id
+        self._active_view.source = rich_content
+        self._active_view.saved_lines = (self.current_memo_id, lines if saved else None)
+
+        # 최적화: 제목이나 소속 섹션이 변경된 경우에만 사이드바 재생성
         # 타임스탬프는 변경되지만 정렬 순서에는 영향 없음 (같은 메모 수정)
-        if title_changed or self.current_memo_id not in self.memo_buttons:
+        expected_section = sidebar_groups.section_key(self.memos[self.current_memo_id], self.sidebar_group_mode)
+        if title_changed or self._memo_section.get(self.current_memo_id) != expected_section:
             self.refresh_sidebar()
         else:
             # 현재 메모의 버튼만 업데이트 (성능 최적화)
             self._update_memo_button_text(self.current_memo_id)
 
-        self.save_memos()
-
         # 저장 완료 상태로 변경
         self.is_modified = False
         self.update_memo_button_color()
 
+    def _saved_lines(self, memo_id):
+        """메모의 마지막 저장 내용을 줄 단위로 반환 (현재 뷰가 저장한 결과가 있으면 재사용)
+
+        마지막 저장에 실패했으면 None (차분 기준이 없으므로 전체 파일로 저장)
+        """
+        saved = self._active_view.saved_lines
+        if saved is not None and saved[0] == memo_id and self._active_view.source is self.memos[memo_id].get("rich_content"):
+            return saved[1]
+        return memo_delta.split_lines(self.memos[memo_id].get("rich_content") or [])
+
+    def _flush_pending_save(self):
+        """예약된 자동 저장을 즉시 실행 (메모 전환 전)"""
+        # 나눠서 붙여넣는 중이면 남은 내용까지 삽입한 뒤 저장
+        self._finish_paste()
+        if not self.save_scheduler.pending:
+            return
+
+        self.save_scheduler.cancel()
+        # 로드가 끝나지 않은 메모는 일부만 저장되지 않도록 남은 내용까지 삽입한 뒤 저장
+        self._finish_memo_load()
+        self._process_save()
+
     def _on_memo_click(self, memo_id):
         """메모 버튼 클릭 핸들러 (드래그 후 클릭 방지)"""
         if self.drag_data["was_dragging"]:
@@ -2824,10 +3845,26 @@ class MemoApp(ctk.CTk):
         self.load_memo_content(memo_id)
 
     def _on_memo_click_frame(self, event, memo_id):
-        """메모 프레임 클릭 핸들러 (이벤트 바인딩용)"""
+        """메모 프레임 클릭 핸들러 (이벤트 바인딩용)
+
+        Ctrl/Command 클릭: 선택 토글, Shift 클릭: 범위 선택, 일반 클릭: 메모 열기
+        """
         if self.drag_data["was_dragging"]:
             self.drag_data["was_dragging"] = False
             return
+
+        is_toggle = (event.state & 0x8) if self._platform == "darwin" else (event.state & 0x4)
+        is_range = event.state & 0x1
+
+        if is_range and self._selection_anchor:
+            self._select_memo_range(self._selection_anchor, memo_id)
+            return
+        if is_toggle or is_range:
+            self._toggle_memo_selection(memo_id)
+            return
+
+        self.clear_memo_selection()
+        self._selection_anchor = memo_id  # 열어 둔 메모에서 Shift 클릭으로 범위 선택
         self.load_memo_content(memo_id)
 
     def _on_drag_start(self, event, memo_id):
@@ -2838,7 +3875,7 @@ class MemoApp(ctk.CTk):
         self.drag_data["was_dragging"] = False
 
     def _on_drag_motion(self, event):
-        """드래그 중 이동"""
+        """드래그 중 이동 (삽입 위치 미리보기만 표시, 저장소는 건드리지 않음)"""
         if not self.drag_data["id"]:
             return
 
@@ -2848,53 +3885,92 @@ class MemoApp(ctk.CTk):
             self.configure(cursor="fleur")  # 커서 변경 (이동 모양)
             
             # 드래그 중 시각적 피드백 (색상 변경 - 파스텔 오렌지)
-            if self.drag_data["id"] in self.memo_buttons:
-                self.memo_buttons[self.drag_data["id"]].configure(fg_color="#FFCC80")
+            row_state = self._row_state(self.drag_data["id"])
+            if row_state is not None:
+                row_state.set(dragging=True)
+
+        if self.drag_data["is_dragging"]:
+            found, before_id = self._find_drop_target(event.y_root)
+            if found:
+                self._show_drop_indicator(before_id)
 
     def _on_drag_stop(self, event):
         """드래그 종료 및 재정렬"""
         self.configure(cursor="")  # 커서 복구
-        
+        self._clear_drop_indicator()
+
         if self.drag_data["is_dragging"]:
             self.drag_data["was_dragging"] = True  # 클릭 이벤트 방지 플래그 설정
             self.drag_data["is_dragging"] = False
-            
+
             source_id = self.drag_data["id"]
-            drop_y = event.y_root
 
-            # 현재 화면에 표시된 즐겨찾기 버튼들의 위치 파악
-            pinned_buttons = []
-            for m_id, btn in self.memo_buttons.items():
-                if self.memos[m_id].get("pinned", False):
-                    pinned_buttons.append((m_id, btn))
-            
-            # Y좌표 순으로 정렬 (화면상 순서)
-            pinned_buttons.sort(key=lambda x: x[1].winfo_rooty())
-
-            # 드롭된 위치의 인덱스 찾기
-            target_index = -1
-            for i, (m_id, btn) in enumerate(pinned_buttons):
-                btn_y = btn.winfo_rooty()
-                btn_h = btn.winfo_height()
-                # 버튼 영역 안에 들어오면 해당 위치로 이동
-                if btn_y <= drop_y <= btn_y + btn_h:
-                    target_index = i
-                    break
-            
-            # 맨 아래로 드래그한 경우 처리 (마지막 버튼보다 아래에 놓았을 때)
-            if target_index == -1 and pinned_buttons:
-                last_btn = pinned_buttons[-1][1]
-                if drop_y > last_btn.winfo_rooty() + last_btn.winfo_height():
-                    target_index = len(pinned_buttons)
-
-            if target_index != -1:
-                self._reorder_pinned_memos(source_id, target_index)
-            else:
-                # 순서 변경이 없어도 색상 복구를 위해 갱신
-                self.refresh_sidebar()
+            # 드래그 색상 복구
+            row_state = self._row_state(source_id)
+            if row_state is not None:
+                row_state.set(dragging=False)
+
+            found, before_id = self._find_drop_target(event.y_root)
+            if found and before_id != source_id:
+                self._reorder_pinned_memos(source_id, before_id)
 
         self.drag_data["id"] = None
 
+    def _pinned_rows_on_screen(self):
+        """화면에 렌더링된 고정 메모 행들을 화면상 순서(Y좌표)로 반환"""
+        pinned_rows = []
+        for m_id, btn in self.memo_buttons.items():
+            if self.memos.get(m_id, {}).get("pinned", False):
+                pinned_rows.append((m_id, btn))
+        pinned_rows.sort(key=lambda x: x[1].winfo_rooty())
+        return pinned_rows
+
+    def _find_drop_target(self, drop_y):
+        """드롭 위치에서 삽입 지점 계산
+
+        반환값: (찾음 여부, 앞에 놓일 메모 ID 또는 맨 끝이면 None)
+        행의 위쪽 절반이면 그 행 앞, 아래쪽 절반이면 그 행 뒤에 삽입
+        """
+        pinned_rows = self._pinned_rows_on_screen()
+        if not pinned_rows:
+            return False, None
+
+        for m_id, btn in pinned_rows:
+            if drop_y < btn.winfo_rooty() + btn.winfo_height() / 2:
+                return True, m_id
+        return True, None
+
+    def _show_drop_indicator(self, before_id):
+        """드래그 중 삽입 위치에 미리보기 막대 표시 (위치가 바뀔 때만 재배치)"""
+        section = self._sidebar_sections.get("pinned")
+        if not section:
+            return
+
+        if self._drop_indicator is not None and self._drop_target == before_id:
+            return
+
+        if self._drop_indicator is None:
+            self._drop_indicator = ctk.CTkFrame(section["body"], height=3, fg_color=PASTEL_COLORS["accent"], corner_radius=0)
+
+        self._drop_indicator.pack_forget()
+        if before_id is not None and before_id in self.memo_buttons:
+            self._drop_indicator.pack(fill="x", before=self.memo_buttons[before_id])
+        elif section["more_button"] is not None:
+            self._drop_indicator.pack(fill="x", before=section["more_button"])
+        else:
+            self._drop_indicator.pack(fill="x")
+        self._drop_target = before_id
+
+    def _clear_drop_indicator(self):
+        """삽입 위치 미리보기 막대 제거"""
+        if self._drop_indicator is not None:
+            try:
+                self._drop_indicator.destroy()
+            except:
+                pass
+        self._drop_indicator = None
+        self._drop_target = None
+
     def _bind_scroll_events(self, widget):
         """위젯과 그 하위 위젯들에 스크롤 이벤트를 재귀적으로 바인딩"""
         # 이벤트 바인딩 (기존 바인딩 유지하면서 추가)
@@ -2954,15 +4030,17 @@ class MemoApp(ctk.CTk):
             logger.debug(f"Scroll error: {e}")
 
     def refresh_sidebar(self, filtered_memos=None):
-        """사이드바의 메모 목록 버튼들을 다시 그림"""
-        # 기존 버튼 제거 (CTkScrollableFrame의 내부 구조를 파괴하지 않도록 수정)
-        if hasattr(self, 'memo_buttons'):
-            for btn in self.memo_buttons.values():
-                try:
-                    btn.destroy()
-                except:
-                    pass
+        """사이드바의 메모 목록을 섹션별로 다시 그림 (펼쳐진 섹션만 렌더링)"""
+        # 기존 섹션 제거 (CTkScrollableFrame의 내부 구조를 파괴하지 않도록 섹션 프레임만 제거)
+        for section in self._sidebar_sections.values():
+            try:
+                section["frame"].destroy()
+            except:
+                pass
+        self._sidebar_sections = {}
+        self._memo_section = {}
         self.memo_buttons = {}  # 버튼 딕셔너리 초기화
+        self.selected_memo_ids &= set(self.memos)  # 삭제된 메모는 선택에서 제외
 
         # 검색 모드인 경우 필터링된 메모 사용
         memos_to_display = filtered_memos if filtered_memos is not None else self.memos
@@ -2990,122 +4068,255 @@ class MemoApp(ctk.CTk):
         # 고정된 메모 먼저, 그 다음 일반 메모
         sorted_memos = pinned_memos + normal_memos
 
-        for m_id, data in sorted_memos:
-            title = data.get('title', 'No Title')
-            timestamp = data.get('timestamp', '')
-            tags = data.get('tags', [])
-            is_pinned = data.get('pinned', False)
-            is_locked = data.get('locked', False)
-
-            # 현재 선택된 메모인지 확인
-            is_current = (m_id == self.current_memo_id)
-
-            # 색상 결정 (파스텔 톤): 현재 선택 > 저장됨
-            if is_current:
-                if self.is_modified:
-                    fg_color = MEMO_LIST_COLORS["unsaved_bg"]
-                    title_color = MEMO_LIST_COLORS["unsaved_title"]
-                    info_color = MEMO_LIST_COLORS["unsaved_info"]
-                    hover_color = MEMO_LIST_COLORS["unsaved_hover"]
-                else:
-                    fg_color = MEMO_LIST_COLORS["selected_bg"]
-                    title_color = MEMO_LIST_COLORS["selected_title"]
-                    info_color = MEMO_LIST_COLORS["selected_info"]
-                    hover_color = MEMO_LIST_COLORS["selected_hover"]
-            else:
-                fg_color = MEMO_LIST_COLORS["saved_bg"]
-                title_color = MEMO_LIST_COLORS["saved_title"]
-                info_color = MEMO_LIST_COLORS["saved_info"]
-                hover_color = MEMO_LIST_COLORS["saved_hover"]
-
-            # 메모 아이템 프레임 생성
-            item_frame = ctk.CTkFrame(
-                self.scrollable_frame,
-                fg_color=fg_color,
-                border_width=1,
-                border_color="#3E454F",
-                corner_radius=6
-            )
-            item_frame.pack(fill="x", pady=2)
-
-            # 제목 라벨 (굵게, 좌측 정렬)
-            title_text = title
-            if is_pinned: title_text = "⭐ " + title_text
-            if is_locked: title_text = "🔒 " + title_text
-
-            title_label = ctk.CTkLabel(
-                item_frame,
-                text=title_text,
-                font=("Roboto Medium", 14, "bold"),
-                anchor="w",
-                justify="left",
-                text_color=title_color
-            )
-            title_label.pack(fill="x", padx=10, pady=(5, 0))
-
-            # 정보 라벨 (태그, 시간 - 일반 폰트, 좌측 정렬)
-            info_text = ""
-            if tags:
-                info_text += " ".join([f"#{tag}" for tag in tags]) + "\n"
-            info_text += timestamp
-
-            info_label = ctk.CTkLabel(
-                item_frame,
-                text=info_text,
-                font=("Roboto Medium", 12),
-                text_color=info_color,
-                anchor="w",
-                justify="left"
+        # 섹션별로 분류 (검색 결과는 모든 섹션을 펼쳐서 표시)
+        sections = sidebar_groups.group_memos(sorted_memos, self.sidebar_group_mode)
+        for key, label, items in sections:
+            self._build_sidebar_section(key, label, items, force_expand=filtered_memos is not None)
+
+    def _is_section_expanded(self, key):
+        """섹션 펼침 여부 (사용자 설정 > 기본값)"""
+        return self.sidebar_expanded.get(key, sidebar_groups.is_expanded_by_default(key))
+
+    def _section_header_text(self, section):
+        """섹션 헤더 텍스트 (펼침 표시 + 라벨 + 메모 수)"""
+        arrow = "▼" if section["expanded"] else "▶"
+        return f"{arrow} {section['label']} ({len(section['items'])})"
+
+    def _build_sidebar_section(self, key, label, items, force_expand=False):
+        """섹션 헤더와 본문 프레임 생성 (본문 행은 펼쳐진 경우에만 렌더링)"""
+        frame = ctk.CTkFrame(self.scrollable_frame, fg_color="transparent")
+        frame.pack(fill="x")
+
+        section = {
+            "frame": frame,
+            "label": label,
+            "items": items,
+            "expanded": force_expand or self._is_section_expanded(key),
+            "rows": {},  # 렌더링된 메모 ID별 행 프레임
+            "rendered": 0,  # 렌더링된 메모 수
+            "more_button": None,
+        }
+
+        header = ctk.CTkButton(
+            frame,
+            text="",
+            height=24,
+            anchor="w",
+            fg_color="transparent",
+            hover_color="#3E454F",
+            text_color="gray",
+            font=("Roboto Medium", 12, "bold"),
+            command=lambda k=key: self._toggle_sidebar_section(k)
+        )
+        header.pack(fill="x", pady=(4, 0))
+        section["header"] = header
+        header.configure(text=self._section_header_text(section))
+
+        body = ctk.CTkFrame(frame, fg_color="transparent")
+        section["body"] = body
+
+        self._sidebar_sections[key] = section
+        for m_id, _ in items:
+            self._memo_section[m_id] = key
+
+        if section["expanded"]:
+            body.pack(fill="x")
+            self._render_section_page(key)
+
+    def _render_section_page(self, key):
+        """섹션의 다음 페이지 메모 행들을 렌더링"""
+        section = self._sidebar_sections.get(key)
+        if not section:
+            return
+
+        # 기존 "더 보기" 버튼 제거 (새 행들 뒤에 다시 배치)
+        if section["more_button"] is not None:
+            section["more_button"].destroy()
+            section["more_button"] = None
+
+        start = section["rendered"]
+        end = min(start + sidebar_groups.SECTION_PAGE_SIZE, len(section["items"]))
+        for m_id, data in section["items"][start:end]:
+            section["rows"][m_id] = self._create_memo_row(section["body"], m_id, data)
+        section["rendered"] = end
+
+        remaining = len(section["items"]) - end
+        if remaining > 0:
+            more_button = ctk.CTkButton(
+                section["body"],
+                text=f"Show more ({remaining})",
+                height=24,
+                fg_color="transparent",
+                hover_color="#3E454F",
+                text_color="gray",
+                command=lambda k=key: self._render_section_page(k)
             )
-            info_label.pack(fill="x", padx=10, pady=(0, 5))
+            more_button.pack(fill="x", pady=2)
+            section["more_button"] = more_button
 
-            # 호버 효과를 위한 데이터 저장
-            item_frame._original_color = fg_color
-            item_frame._hover_color = hover_color
+    def _toggle_sidebar_section(self, key):
+        """섹션 펼치기/접기 (접을 때 행을 제거하고, 펼칠 때 다시 로드)"""
+        section = self._sidebar_sections.get(key)
+        if not section:
+            return
 
-            # 버튼 저장
-            self.memo_buttons[m_id] = item_frame
+        section["expanded"] = not section["expanded"]
+        self.sidebar_expanded[key] = section["expanded"]
 
-            # 이벤트 바인딩 대상 위젯들
-            widgets = [item_frame, title_label, info_label]
+        if section["expanded"]:
+            section["body"].pack(fill="x")
+            self._render_section_page(key)
+        else:
+            for m_id, row in section["rows"].items():
+                self.memo_buttons.pop(m_id, None)
+                row.destroy()
+            section["rows"] = {}
+            section["rendered"] = 0
+            if section["more_button"] is not None:
+                section["more_button"].destroy()
+                section["more_button"] = None
+            section["body"].pack_forget()
+
+        section["header"].configure(text=self._section_header_text(section))
+
+    def toggle_group_mode(self):
+        """사이드바 그룹 방식 전환 (날짜별 ↔ 태그별)"""
+        self.sidebar_group_mode = "tag" if self.sidebar_group_mode == "date" else "date"
+        self._update_group_mode_button()
+        self.refresh_sidebar()
 
-            # 호버 효과
-            def on_enter(_, frame=item_frame):
-                frame.configure(fg_color=frame._hover_color)
+    def _update_group_mode_button(self):
+        """그룹 방식 버튼 색상 업데이트 (태그별 그룹일 때 활성화 표시)"""
+        if self.sidebar_group_mode == "tag":
+            self.group_mode_button.configure(fg_color="#90A4AE")
+        else:
+            self.group_mode_button.configure(fg_color=PASTEL_COLORS["secondary"])
 
-            def on_leave(_, frame=item_frame):
-                frame.configure(fg_color=frame._original_color)
+    def _create_memo_row(self, parent, m_id, data):
+        """메모 한 개의 사이드바 행 생성 및 이벤트 바인딩"""
+        title = data.get('title', 'No Title')
+        timestamp = data.get('timestamp', '')
+        tags = data.get('tags', [])
+        is_pinned = data.get('pinned', False)
+        is_locked = data.get('locked', False)
 
-            for w in widgets:
-                w.bind("<Enter>", on_enter)
-                w.bind("<Leave>", on_leave)
+        # 행 상태 결정 (파스텔 톤): 현재 선택(수정 중/저장됨) > 저장됨
+        is_current = (m_id == self.current_memo_id)
+        row_state = MemoRowState(
+            selected=is_current,
+            unsaved=is_current and self.is_modified,
+            multi_selected=m_id in self.selected_memo_ids
+        )
+        visual = row_state.visual()
+
+        # 메모 아이템 프레임 생성
+        item_frame = ctk.CTkFrame(
+            parent,
+            fg_color=visual[("frame", "fg_color")],
+            border_width=visual[("frame", "border_width")],
+            border_color=visual[("frame", "border_color")],
+            corner_radius=6
+        )
+        item_frame.pack(fill="x", pady=2)
+
+        # 제목 라벨 (굵게, 좌측 정렬)
+        title_text = title
+        if is_pinned: title_text = "⭐ " + title_text
+        if is_locked: title_text = "🔒 " + title_text
+
+        title_label = ctk.CTkLabel(
+            item_frame,
+            text=title_text,
+            font=("Roboto Medium", 14, "bold"),
+            anchor="w",
+            justify="left",
+            text_color=visual[("title", "text_color")]
+        )
+        title_label.pack(fill="x", padx=10, pady=(5, 0))
+
+        # 미리보기 라벨 (저장 시 계산된 스니펫, 비어 있거나 잠긴 메모면 배치하지 않음)
+        preview = '' if data.get('locked', False) else data.get('preview', '')
+        preview_label = ctk.CTkLabel(
+            item_frame,
+            text=preview,
+            font=("Roboto Medium", 11),
+            text_color=visual[("preview", "text_color")],
+            anchor="w",
+            justify="left"
+        )
+        if preview:
+            preview_label.pack(fill="x", padx=10)
+
+        # 정보 라벨 (태그, 시간 - 일반 폰트, 좌측 정렬)
+        info_text = ""
+        if tags:
+            info_text += " ".join([f"#{tag}" for tag in tags]) + "\n"
+        info_text += timestamp
+
+        info_label = ctk.CTkLabel(
+            item_frame,
+            text=info_text,
+            font=("Roboto Medium", 12),
+            text_color=visual[("info", "text_color")],
+            anchor="w",
+            justify="left"
+        )
+        info_label.pack(fill="x", padx=10, pady=(0, 5))
+
+        # 상태 머신 연결 (이후 색상 변경은 상태 전이 시에만 적용)
+        row_state.attach(item_frame, title_label, info_label, preview_label)
+        item_frame._row_state = row_state
+
+        # 버튼 저장
+        self.memo_buttons[m_id] = item_frame
+
+        # 이벤트 바인딩 대상 위젯들
+        widgets = [item_frame, title_label, preview_label, info_label]
+
+        # 호버 효과 (행 내부의 자식 위젯 사이 이동은 상태 변화로 보지 않음)
+        def on_enter(_, state=row_state):
+            if not state.hover:
+                state.set(hover=True)
+
+        def on_leave(e, frame=item_frame, state=row_state):
+            inside = frame.winfo_containing(e.x_root, e.y_root)
+            if inside is not None and (str(inside) == str(frame) or str(inside).startswith(str(frame) + ".")):
+                return
+            if state.hover:
+                state.set(hover=False)
 
-            # 스크롤 포커스 처리
-            if hasattr(self.scrollable_frame, '_parent_canvas'):
-                scroll_canvas = self.scrollable_frame._parent_canvas
-                for w in widgets:
-                    w.bind("<Enter>", lambda _: scroll_canvas.focus_set(), add="+")
+        for w in widgets:
+            w.bind("<Enter>", on_enter)
+            w.bind("<Leave>", on_leave)
 
-            # 더블 클릭 이름 변경
+        # 스크롤 포커스 처리
+        if hasattr(self.scrollable_frame, '_parent_canvas'):
+            scroll_canvas = self.scrollable_frame._parent_canvas
             for w in widgets:
-                w.bind("<Double-Button-1>", lambda e, i=m_id: self.rename_memo(i))
+                w.bind("<Enter>", lambda _: scroll_canvas.focus_set(), add="+")
+
+        # 더블 클릭 이름 변경
+        for w in widgets:
+            w.bind("<Double-Button-1>", lambda e, i=m_id: self.rename_memo(i))
 
-            # 우클릭 메뉴 (고정/해제)
+        # 우클릭 메뉴 (고정/해제)
+        for w in widgets:
+            w.bind("<Button-2>" if self._platform == "darwin" else "<Button-3>",
+                   lambda e, i=m_id: self._show_memo_context_menu(e, i))
+
+        # 클릭 및 드래그 이벤트
+        if is_pinned:
             for w in widgets:
-                w.bind("<Button-2>" if self._platform == "darwin" else "<Button-3>",
-                       lambda e, i=m_id: self._show_memo_context_menu(e, i))
-
-            # 클릭 및 드래그 이벤트
-            if is_pinned:
-                for w in widgets:
-                    w.bind("<Button-1>", lambda e, i=m_id: self._on_drag_start(e, i))
-                    w.bind("<B1-Motion>", self._on_drag_motion)
-                    w.bind("<ButtonRelease-1>", self._on_drag_stop)
-                    # 드래그 종료 후 클릭 처리를 위해 추가 바인딩
-                    w.bind("<ButtonRelease-1>", lambda e, i=m_id: self._on_memo_click_frame(e, i), add="+")
-            else:
-                for w in widgets:
-                    w.bind("<ButtonRelease-1>", lambda e, i=m_id: self._on_memo_click_frame(e, i))
+                w.bind("<Button-1>", lambda e, i=m_id: self._on_drag_start(e, i))
+                w.bind("<B1-Motion>", self._on_drag_motion)
+                w.bind("<ButtonRelease-1>", self._on_drag_stop)
+                # 드래그 종료 후 클릭 처리를 위해 추가 바인딩
+                w.bind("<ButtonRelease-1>", lambda e, i=m_id: self._on_memo_click_frame(e, i), add="+")
+        else:
+            for w in widgets:
+                w.bind("<ButtonRelease-1>", lambda e, i=m_id: self._on_memo_click_frame(e, i))
+
+        return item_frame
 
     def _show_memo_context_menu(self, event, memo_id):
         """메모 항목 우클릭 메뉴 표시"""
@@ -3113,6 +4324,15 @@ class MemoApp(ctk.CTk):
 
         menu = tk.Menu(self, tearoff=0)
 
+        # 다중 선택된 메모를 우클릭한 경우 일괄 작업 메뉴 표시
+        if memo_id in self.selected_memo_ids and len(self.selected_memo_ids) > 1:
+            self._fill_bulk_context_menu(menu)
+            try:
+                menu.tk_popup(event.x_root, event.y_root)
+            finally:
+                menu.grab_release()
+            return
+
         is_pinned = self.memos[memo_id].get("pinned", False)
 
         if is_pinned:
@@ -3125,6 +4345,205 @@ class MemoApp(ctk.CTk):
         finally:
             menu.grab_release()
 
+    # === 다중 선택 및 일괄 작업 ===
+
+    def _sidebar_order(self):
+        """사이드바에 표시 중인 메모 ID 목록 (화면 순서, 접힌 섹션 포함)"""
+        return [m_id for section in self._sidebar_sections.values() for m_id, _ in section["items"]]
+
+    def _toggle_memo_selection(self, memo_id):
+        """메모 하나의 선택 상태 토글"""
+        if memo_id in self.selected_memo_ids:
+            self.selected_memo_ids.discard(memo_id)
+        else:
+            self.selected_memo_ids.add(memo_id)
+        self._selection_anchor = memo_id
+        self._update_selection_visuals([memo_id])
+
+    def _select_memo_range(self, anchor_id, memo_id):
+        """기준 메모부터 클릭한 메모까지 범위 선택 (화면 순서 기준)"""
+        order = self._sidebar_order()
+        if anchor_id not in order or memo_id not in order:
+            self._toggle_memo_selection(memo_id)
+            return
+
+        start, end = sorted((order.index(anchor_id), order.index(memo_id)))
+        changed = set(self.selected_memo_ids)
+        self.selected_memo_ids = set(order[start:end + 1])
+        changed ^= self.selected_memo_ids
+        self._update_selection_visuals(changed)
+
+    def clear_memo_selection(self):
+        """다중 선택 해제"""
+        if not self.selected_memo_ids:
+            return
+        changed = self.selected_memo_ids
+        self.selected_memo_ids = set()
+        self._selection_anchor = None
+        self._update_selection_visuals(changed)
+
+    def _update_selection_visuals(self, memo_ids):
+        """선택 상태가 바뀐 메모 행의 테두리만 갱신"""
+        for m_id in memo_ids:
+            row_state = self._row_state(m_id)
+            if row_state is not None:
+                row_state.set(multi_selected=m_id in self.selected_memo_ids)
+
+    def _fill_bulk_context_menu(self, menu):
+        """다중 선택 일괄 작업 메뉴 항목 구성"""
+        count = len(self.selected_memo_ids)
+        menu.add_command(label=f"⭐ 고정 ({count}개)", command=lambda: self._bulk_set_pinned(True))
+        menu.add_command(label=f"⭐ 고정 해제 ({count}개)", command=lambda: self._bulk_set_pinned(False))
+        menu.add_separator()
+        menu.add_command(label="# 태그 추가...", command=self._bulk_add_tag)
+        menu.add_command(label="# 태그 제거...", command=self._bulk_remove_tag)
+        menu.add_command(label="🗂 그룹(태그)으로 이동...", command=self._bulk_move_to_group)
+        menu.add_separator()
+        menu.add_command(label=f"📥 내보내기 ({count}개)...", command=self._bulk_export)
+        menu.add_command(label=f"🗑 삭제 ({count}개)", command=self._bulk_delete)
+        menu.add_separator()
+        menu.add_command(label="선택 해제", command=self.clear_memo_selection)
+
+    def _apply_bulk_change(self, mutate):
+        """선택된 메모들에 변경 함수를 적용하고 한 번에 저장 및 사이드바 갱신
+
+        mutate(data)가 True를 반환한 메모만 저장 대상이 됨
+        """
+        updated = {}
+        for m_id in self.selected_memo_ids:
+            if m_id in self.memos and mutate(self.memos[m_id]):
+                updated[m_id] = self.memos[m_id]
+
+        if updated:
+            self.data_manager.save_memo_batch(updated)
+            self.refresh_sidebar()
+
+    def _bulk_set_pinned(self, pinned):
+        """선택된 메모 일괄 고정/해제"""
+        def mutate(data):
+            if data.get("pinned", False) == pinned:
+                return False
+            data["pinned"] = pinned
+            return True
+        self._apply_bulk_change(mutate)
+
+    def _ask_bulk_tag(self, title):
+        """일괄 태그 작업용 태그 이름 입력"""
+        tag = dialogs.show_custom_input_dialog(self, title, "태그 이름을 입력하세요:")
+        return tag.strip().lstrip("#") if tag else ""
+
+    def _bulk_add_tag(self):
+        """선택된 메모에 태그 일괄 추가"""
+        tag = self._ask_bulk_tag("태그 추가")
+        if not tag:
+            return
+
+        def mutate(data):
+            tags = data.setdefault("tags", [])
+            if tag in tags:
+                return False
+            tags.append(tag)
+            return True
+        self._apply_bulk_change(mutate)
+
+    def _bulk_remove_tag(self):
+        """선택된 메모에서 태그 일괄 제거"""
+        tag = self._ask_bulk_tag("태그 제거")
+        if not tag:
+            return
+
+        def mutate(data):
+            tags = data.get("tags", [])
+            if tag not in tags:
+                return False
+            tags.remove(tag)
+            return True
+        self._apply_bulk_change(mutate)
+
+    def _bulk_move_to_group(self):
+        """선택된 메모를 태그 그룹으로 이동 (해당 태그를 첫 번째 태그로 지정)"""
+        tag = self._ask_bulk_tag("그룹으로 이동")
+        if not tag:
+            return
+
+        def mutate(data):
+            tags = data.setdefault("tags", [])
+            if tags and tags[0] == tag:
+                return False
+            if tag in tags:
+                tags.remove(tag)
+            tags.insert(0, tag)
+            return True
+        self._apply_bulk_change(mutate)
+
+    def _bulk_export(self):
+        """선택된 메모들을 폴더에 텍스트 파일로 일괄 내보내기 (잠긴 메모 제외)"""
+        from tkinter import filedialog
+        import re
+        import tkinter.messagebox as messagebox
+
+        directory = filedialog.askdirectory(title="내보낼 폴더 선택")
+        if not directory:
+            return
+
+        exported = 0
+        used_names = set()
+        for m_id in self._sidebar_order():
+            if m_id not in self.selected_memo_ids or m_id not in self.memos:
+                continue
+            data = self.memos[m_id]
+            if data.get("locked", False):
+                continue
+
+            title = data.get("title", "Untitled")
+            base_name = re.sub(r'[\\/:*?"<>|]', "_", title).strip() or "Untitled"
+            file_name = f"{base_name}.txt"
+            suffix = 1
+            while file_name in used_names or os.path.exists(os.path.join(directory, file_name)):
+                suffix += 1
+                file_name = f"{base_name} ({suffix}).txt"
+            used_names.add(file_name)
+
+            exporter.export_file(os.path.join(directory, file_name), title, data.get("content", ""))
+            exported += 1
+
+        messagebox.showinfo("완료", f"{exported}개의 메모를 내보냈습니다: {directory}")
+
+    def _bulk_delete(self):
+        """선택된 메모 일괄 삭제 (잠긴 메모 제외)"""
+        import tkinter.messagebox as messagebox
+
+        targets = [m_id for m_id in self.selected_memo_ids
+                   if m_id in self.memos and not self.memos[m_id].get("locked", False)]
+        if not targets:
+            return
+
+        skipped = len(self.selected_memo_ids) - len(targets)
+        message = f"선택한 메모 {len(targets)}개를 삭제하시겠습니까?"
+        if skipped:
+            message += f"\n(잠긴 메모 {skipped}개는 제외됩니다)"
+        if not messagebox.askyesno("삭제 확인", message):
+            return
+
+        # 현재 메모가 포함되면 저장 타이머 취소 (삭제된 메모가 다시 저장되는 것 방지)
+        current_deleted = self.current_memo_id in targets
+        if current_deleted:
+            self.save_scheduler.cancel()
+
+        for m_id in targets:
+            del self.memos[m_id]
+            self._discard_editor_view(m_id)
+            self.prefetcher.discard(m_id)
+        self.data_manager.save_memo_batch({}, targets)
+
+        self.selected_memo_ids = set()
+        self._selection_anchor = None
+        if current_deleted:
+            self.create_new_memo()
+        self.refresh_sidebar()
+        # 메모 삭제 후 미사용 파일 즉시 정리
+        self.cleanup_unused_files()
+
     def _toggle_memo_pin(self, memo_id):
         """특정 메모의 고정 상태 토글"""
         if memo_id not in self.memos:
@@ -3135,28 +4554,74 @@ class MemoApp(ctk.CTk):
         self.save_memos()
         self.refresh_sidebar()
 
-    def _reorder_pinned_memos(self, source_id, target_index):
-        """즐겨찾기 메모 순서 재정렬 및 저장"""
-        # 현재 정렬된 즐겨찾기 목록 가져오기
+    def _sorted_pinned_ids(self):
+        """현재 정렬 기준(pinned_index, 타임스탬프)에 따른 고정 메모 ID 목록"""
         pinned_memos = [m_id for m_id, data in self.memos.items() if data.get("pinned", False)]
-        # 기존 정렬 로직과 동일하게 정렬하여 기준점 확보
         pinned_memos.sort(key=lambda m_id: self.memos[m_id].get('timestamp', ''), reverse=True)
         pinned_memos.sort(key=lambda m_id: self.memos[m_id].get('pinned_index', float('inf')))
+        return pinned_memos
 
-        # 소스 ID 제거 후 타겟 위치에 삽입
-        if source_id in pinned_memos:
-            pinned_memos.remove(source_id)
-            if target_index >= len(pinned_memos):
-                pinned_memos.append(source_id)
-            else:
-                pinned_memos.insert(target_index, source_id)
+    def _reorder_pinned_memos(self, source_id, before_id):
+        """즐겨찾기 메모를 before_id 앞(None이면 맨 끝)으로 이동
+
+        이동한 메모의 순서 키만 이웃 키 사이 값으로 바꾸고 그 메모 파일만 저장
+        (간격이 부족하거나 키가 없는 메모가 이웃이면 전체 키 재배치)
+        """
+        old_order = self._sorted_pinned_ids()
+        if source_id not in old_order:
+            return
 
-        # 인덱스 재할당
-        for i, m_id in enumerate(pinned_memos):
-            self.memos[m_id]["pinned_index"] = i
+        new_order = [m_id for m_id in old_order if m_id != source_id]
+        pos = new_order.index(before_id) if before_id in new_order else len(new_order)
+        new_order.insert(pos, source_id)
 
-        self.save_memos()
-        self.refresh_sidebar()
+        # 위치가 그대로면 아무것도 하지 않음
+        if new_order == old_order:
+            return
+
+        prev_id = new_order[pos - 1] if pos > 0 else None
+        next_id = new_order[pos + 1] if pos + 1 < len(new_order) else None
+        prev_key = self.memos[prev_id].get("pinned_index") if prev_id else None
+        next_key = self.memos[next_id].get("pinned_index") if next_id else None
+
+        new_key = None
+        if not (prev_id and prev_key is None) and not (next_id and next_key is None):
+            new_key = ordering.key_between(prev_key, next_key)
+
+        if new_key is not None:
+            self.memos[source_id]["pinned_index"] = new_key
+            self.data_manager.save_memo(source_id, self.memos[source_id])
+        else:
+            # 드물게 발생: 전체 키 재배치 후 바뀐 메모만 저장
+            for m_id, key in ordering.rebalance(new_order).items():
+                if self.memos[m_id].get("pinned_index") != key:
+                    self.memos[m_id]["pinned_index"] = key
+                    self.data_manager.save_memo(m_id, self.memos[m_id])
+
+        self._move_pinned_row(source_id, new_order)
+
+    def _move_pinned_row(self, source_id, new_order):
+        """사이드바에서 이동한 메모 행 하나만 새 위치로 재배치"""
+        section = self._sidebar_sections.get("pinned")
+        if not section or source_id not in section["rows"]:
+            self.refresh_sidebar()
+            return
+
+        # 섹션의 메모 목록 순서 갱신
+        positions = {m_id: i for i, m_id in enumerate(new_order)}
+        section["items"].sort(key=lambda item: positions.get(item[0], len(positions)))
+
+        # 새 순서에서 뒤에 오는 첫 번째 렌더링된 행 앞에 배치
+        frame = section["rows"][source_id]
+        frame.pack_forget()
+        for m_id in new_order[new_order.index(source_id) + 1:]:
+            if m_id in section["rows"]:
+                frame.pack(fill="x", pady=2, before=section["rows"][m_id])
+                return
+        if section["more_button"] is not None:
+            frame.pack(fill="x", pady=2, before=section["more_button"])
+        else:
+            frame.pack(fill="x", pady=2)
 
     def _update_memo_button_text(self, memo_id):
         """특정 메모 버튼의 텍스트만 업데이트 (성능 최적화)"""
@@ -3183,20 +4648,35 @@ class MemoApp(ctk.CTk):
             info_text += " ".join([f"#{tag}" for tag in tags]) + "\n"
         info_text += timestamp
 
-        # 라벨 업데이트 (순서: 제목, 정보)
-        children = frame.winfo_children()
-        if len(children) >= 2:
-            children[0].configure(text=title_text)
-            children[1].configure(text=info_text)
+        # 라벨 업데이트 (제목, 정보)
+        row_state = frame._row_state
+        row_state.title_label.configure(text=title_text)
+        row_state.info_label.configure(text=info_text)
+
+        # 미리보기 라벨 업데이트 (내용이 바뀐 경우에만, 비어 있거나 잠긴 메모면 숨김)
+        preview = '' if data.get('locked', False) else data.get('preview', '')
+        preview_label = row_state.preview_label
+        if preview_label.cget("text") != preview:
+            preview_label.configure(text=preview)
+            if preview and not preview_label.winfo_manager():
+                preview_label.pack(fill="x", padx=10, before=row_state.info_label)
+            elif not preview:
+                preview_label.pack_forget()
 
     def update_memo_button_color(self):
-        """현재 메모의 버튼 색상을 상태에 따라 업데이트"""
-        if self.current_memo_id and self.current_memo_id in self.memo_buttons:
-            btn = self.memo_buttons[self.current_memo_id]
-            if self.is_modified:
-                btn.configure(fg_color="#FFCDD2")  # 파스텔 레드 (저장되지 않음)
-            else:
-                btn.configure(fg_color="#E1BEE7")  # 파스텔 퍼플 (현재 선택됨)
+        """현재 메모의 버튼 색상을 상태에 따라 업데이트 (상태가 바뀐 경우에만 재그리기)"""
+        self._set_row_selected(self.current_memo_id, True)
+
+    def _row_state(self, memo_id):
+        """렌더링된 메모 행의 상태 머신 반환 (없으면 None)"""
+        frame = self.memo_buttons.get(memo_id) if memo_id else None
+        return getattr(frame, "_row_state", None)
+
+    def _set_row_selected(self, memo_id, selected):
+        """메모 행의 선택/수정 상태 전이 (선택 해제 시 저장됨 색상으로 복귀)"""
+        row_state = self._row_state(memo_id)
+        if row_state is not None:
+            row_state.set(selected=selected, unsaved=selected and self.is_modified)
 
 if __name__ == "__main__":
     app = MemoApp()
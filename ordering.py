@@ -0,0 +1,29 @@
+"""
+고정 메모 순서 키 모듈
+드래그 앤 드롭 재정렬 시 이동한 메모의 키만 바꾸도록 분수형 순서 키 계산
+"""
+
+# 두 키 사이 간격이 이보다 좁아지면 전체 키를 다시 배치
+MIN_GAP = 1e-9
+
+
+def key_between(before, after):
+    """두 이웃 키 사이에 들어갈 새 키 반환
+
+    before/after가 None이면 해당 방향에 이웃이 없다는 뜻
+    간격이 너무 좁아 새 키를 만들 수 없으면 None 반환 (rebalance 필요)
+    """
+    if before is None and after is None:
+        return 0.0
+    if before is None:
+        return after - 1.0
+    if after is None:
+        return before + 1.0
+    if after - before < MIN_GAP:
+        return None
+    return (before + after) / 2
+
+
+def rebalance(ordered_ids):
+    """정렬된 메모 ID 목록에 균일한 간격의 키를 다시 부여"""
+    return {m_id: float(i) for i, m_id in enumerate(ordered_ids)}
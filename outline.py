@@ -0,0 +1,90 @@
+"""
+메모 목차 모듈
+제목(큰 글꼴 또는 '# 제목' 줄), 체크리스트 항목, 표, 그림판, 이미지/미디어의 위치를
+줄 단위로 색인하고, 편집된 줄만 다시 계산하여 긴 메모의 목차를 유지
+"""
+
+from collections import namedtuple
+
+import format_engine
+from document_model import EMBED_PLACEHOLDER
+from line_cache import LineCache
+from text_utils import CHECKLIST_GLYPHS, heading_level, short_label
+
+# 글꼴 크기가 이 값 이상인 줄은 제목으로 취급 (기본 글꼴 16)
+HEADING_MIN_SIZE = 20
+
+# kind: heading, checklist, table, paint, image, media, attachment
+# level: 제목 수준 (1이 가장 큼, 나머지 항목은 0), done: 체크리스트 완료 여부
+OutlineEntry = namedtuple("OutlineEntry", "line kind label level done")
+
+
+def font_heading_level(tags):
+    """태그 중 가장 큰 폰트 태그 크기로 제목 수준 계산 (제목이 아니면 0)"""
+    size = 0
+    for tag in tags:
+        parsed = format_engine.parse_font_tag(tag)
+        if parsed:
+            size = max(size, parsed["size"])
+    if size < HEADING_MIN_SIZE:
+        return 0
+    return 1 if size >= 28 else 2 if size >= 24 else 3
+
+
+class OutlineIndex:
+    """줄별 목차 항목 색인
+
+    변경 추적기에 DocumentModel.apply 다음에 등록해야 함 (줄 내용을 모델에서 읽음)
+    classify_embed(kind, name)는 임베드를 (항목 종류, 이름) 또는 None으로 변환
+    """
+
+    def __init__(self, text_widget, document, classify_embed):
+        self.widget = text_widget
+        self.document = document
+        self.classify_embed = classify_embed
+        self._lines = LineCache()  # 줄별 항목 튜플 (항목이 없으면 빈 튜플)
+
+    def apply(self, edit):
+        """변경 이벤트 반영: 바뀐 줄만 무효화 (서식 변경도 제목 여부를 바꿀 수 있음)"""
+        if edit.op == "reset":
+            self._lines.reset()
+        else:
+            self._lines.splice(edit.first_line, edit.old_last, edit.new_last)
+
+    def _line_entries(self, number):
+        text = self.document.raw_line(number)
+        entries = []
+
+        stripped = text.replace(EMBED_PLACEHOLDER, "").strip()
+        if stripped:
+            level = heading_level(stripped)
+            if level:
+                entries.append(OutlineEntry(number, "heading", short_label(stripped.lstrip("#")), level, False))
+            elif stripped[0] in CHECKLIST_GLYPHS:
+                entries.append(OutlineEntry(number, "checklist", short_label(stripped), 0, stripped[0] == "☑"))
+            else:
+                level = font_heading_level(self.widget.tag_names(f"{number}.{len(text) - len(text.lstrip())}"))
+                if level:
+                    entries.append(OutlineEntry(number, "heading", short_label(stripped), level, False))
+
+        if EMBED_PLACEHOLDER in text:
+            for key, name, _ in self.widget.dump(f"{number}.0", f"{number}.end", image=True, window=True):
+                classified = self.classify_embed(key, name)
+                if classified:
+                    entries.append(OutlineEntry(number, classified[0], classified[1], 0, False))
+        return tuple(entries)
+
+    def entries(self):
+        """모든 목차 항목 (줄 순서, 바뀐 줄만 다시 계산)"""
+        line_count = self.document.line_count()
+        cache = self._lines
+        cache.ensure(line_count)
+        for first, last in cache.dirty_runs():
+            cache.store(first, [self._line_entries(number) for number in range(first, last + 1)])
+        return [entry for line_entries in cache.values() for entry in line_entries]
+
+
+def checklist_progress(entries):
+    """체크리스트 (완료 수, 전체 수)"""
+    items = [entry for entry in entries if entry.kind == "checklist"]
+    return sum(1 for entry in items if entry.done), len(items)
@@ -0,0 +1,167 @@
+"""
+메모 미리 준비 모듈
+다음에 열 가능성이 높은 메모(사이드바 인접 메모, 최근 연 메모)의 로드 계획을 유휴 시간에 만들고,
+이미지는 백그라운드 스레드에서 미리 디코딩/리사이즈하여 메모 전환을 빠르게 함
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import memo_loader
+from tag_registry import tag_options
+
+logger = logging.getLogger(__name__)
+
+PLAN_CACHE_SIZE = 8  # 보관할 로드 계획 수
+IMAGE_CACHE_SIZE = 32  # 보관할 디코딩된 이미지 수
+ADJACENT_COUNT = 2  # 현재 메모 앞뒤로 준비할 사이드바 메모 수
+MAX_IMAGE_WIDTH = 600  # 표시 크기가 없는 이미지의 최대 너비
+
+
+def decode_image(path, display_width=None, display_height=None, max_width=MAX_IMAGE_WIDTH):
+    """이미지를 열어 표시 크기로 리사이즈 (Tk를 사용하지 않으므로 백그라운드 스레드에서 호출 가능)
+
+    반환값: (PIL 이미지, 원본 너비, 원본 높이, 표시 너비, 표시 높이)
+    """
+    from PIL import Image
+
+    img = Image.open(path)
+    original_width, original_height = img.width, img.height
+
+    # 저장된 표시 크기가 있으면 사용, 없으면 최대 너비 제한
+    if display_width and display_height:
+        img = img.resize((display_width, display_height), Image.Resampling.LANCZOS)
+    elif img.width > max_width:
+        ratio = max_width / img.width
+        img = img.resize((max_width, int(img.height * ratio)), Image.Resampling.LANCZOS)
+    else:
+        img.load()
+
+    return img, original_width, original_height, img.width, img.height
+
+
+class MemoPrefetcher:
+    """로드 계획 및 디코딩된 이미지 LRU 캐시"""
+
+    def __init__(self):
+        self._plans = OrderedDict()  # memo_id → (원본 rich_content, LoadPlan)
+        self._prepared = {}  # memo_id → 미리 준비한 이미지 키 집합 (이미지를 꺼내 쓰면 준비 상태 해제)
+        self._images = OrderedDict()  # (경로, 너비, 높이) → decode_image 결과
+        self._pending_images = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+
+    def plan_for(self, memo_id, rich_content):
+        """메모의 로드 계획 반환 (rich_content가 그대로면 캐시 사용, 아니면 새로 생성)"""
+        cached = self._plans.get(memo_id)
+        if cached is not None and cached[0] is rich_content:
+            self._plans.move_to_end(memo_id)
+            return cached[1]
+
+        plan = memo_loader.build_load_plan(rich_content)
+        self._plans[memo_id] = (rich_content, plan)
+        self._plans.move_to_end(memo_id)
+        while len(self._plans) > PLAN_CACHE_SIZE:
+            evicted, _ = self._plans.popitem(last=False)
+            self._prepared.pop(evicted, None)
+        return plan
+
+    def is_prepared(self, memo_id, rich_content):
+        """메모의 로드 계획과 이미지가 최신 상태로 준비되어 있는지 여부"""
+        cached = self._plans.get(memo_id)
+        return cached is not None and cached[0] is rich_content and memo_id in self._prepared
+
+    def prepare(self, memo_id, rich_content):
+        """로드 계획 생성, 태그 해석 및 이미지 디코딩 예약"""
+        plan = self.plan_for(memo_id, rich_content)
+        for tag in plan.tags:
+            tag_options(tag)
+
+        keys = set()
+        for step in plan.steps:
+            if step[0] != "embed":
+                continue
+            segment = step[1]
+            if segment.get("type") == "image":
+                keys.add(self.request_image(segment.get("path"), segment.get("display_width"),
+                                            segment.get("display_height")))
+            elif segment.get("type") == "media":
+                keys.add(self.request_image(segment.get("thumbnail_path"), segment.get("display_width"),
+                                            segment.get("display_height")))
+        keys.discard(None)
+        self._prepared[memo_id] = keys
+
+    def discard(self, memo_id):
+        """삭제되거나 편집된 메모의 캐시 제거"""
+        self._plans.pop(memo_id, None)
+        self._prepared.pop(memo_id, None)
+
+    def request_image(self, path, display_width, display_height):
+        """이미지를 백그라운드에서 디코딩하도록 예약하고 캐시 키 반환 (경로가 없으면 None)"""
+        if not path:
+            return None
+
+        key = (path, display_width, display_height)
+        with self._lock:
+            if key in self._images or key in self._pending_images:
+                return key
+            self._pending_images.add(key)
+        self._executor.submit(self._decode, key)
+        return key
+
+    def _decode(self, key):
+        """백그라운드 스레드: 이미지 디코딩 후 캐시에 저장"""
+        try:
+            result = decode_image(*key)
+        except Exception as e:
+            logger.debug(f"Image prefetch failed for {key[0]}: {e}")
+            result = None
+
+        with self._lock:
+            self._pending_images.discard(key)
+            if result is not None:
+                self._images[key] = result
+                while len(self._images) > IMAGE_CACHE_SIZE:
+                    self._images.popitem(last=False)
+
+    def take_image(self, path, display_width, display_height):
+        """미리 디코딩된 이미지 반환 (없으면 None)
+
+        꺼낸 이미지는 캐시에서 빠지므로 그 이미지를 쓰는 메모는 다시 준비하도록 준비 상태 해제
+        """
+        key = (path, display_width, display_height)
+        with self._lock:
+            result = self._images.pop(key, None)
+        if result is not None:
+            for memo_id in [m for m, keys in self._prepared.items() if key in keys]:
+                del self._prepared[memo_id]
+        return result
+
+    def shutdown(self):
+        """백그라운드 스레드 종료"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def prefetch_candidates(current_id, sidebar_order, recent_ids):
+    """미리 준비할 메모 ID 목록 (사이드바 인접 메모 → 최근 연 메모 순)"""
+    candidates = []
+    if current_id in sidebar_order:
+        position = sidebar_order.index(current_id)
+        for offset in range(1, ADJACENT_COUNT + 1):
+            for index in (position + offset, position - offset):
+                if 0 <= index < len(sidebar_order):
+                    candidates.append(sidebar_order[index])
+    else:
+        candidates.extend(sidebar_order[:ADJACENT_COUNT])
+
+    candidates.extend(recent_ids)
+
+    seen = {current_id}
+    result = []
+    for memo_id in candidates:
+        if memo_id not in seen:
+            seen.add(memo_id)
+            result.append(memo_id)
+    return result
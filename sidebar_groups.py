@@ -0,0 +1,81 @@
+"""
+사이드바 그룹 모듈
+메모 목록을 접을 수 있는 섹션(고정, 오늘, 이번 주, 월별 또는 태그별)으로 분류
+"""
+
+from datetime import datetime, timedelta
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 그룹 방식: 날짜별 / 태그별
+GROUP_MODES = ("date", "tag")
+
+# 한 번에 렌더링할 섹션 내 메모 수 (나머지는 "Show more"로 로드)
+SECTION_PAGE_SIZE = 50
+
+# 기본적으로 펼쳐진 섹션 (나머지 섹션은 접힌 상태로 시작)
+DEFAULT_EXPANDED = {"pinned", "today", "week"}
+
+
+def _parse_timestamp(timestamp):
+    """타임스탬프 문자열을 datetime으로 변환 (실패 시 None)"""
+    try:
+        return datetime.strptime(timestamp, TIMESTAMP_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+def section_for(data, mode="date", now=None):
+    """메모가 속할 섹션의 (키, 라벨) 반환"""
+    if data.get("pinned", False):
+        return "pinned", "Pinned"
+
+    if mode == "tag":
+        tags = data.get("tags", [])
+        if tags:
+            # 메모는 첫 번째 태그의 섹션에만 표시
+            return f"tag:{tags[0]}", f"#{tags[0]}"
+        return "untagged", "No Tag"
+
+    stamp = _parse_timestamp(data.get("timestamp", ""))
+    if stamp is None:
+        return "older", "Older"
+
+    now = now or datetime.now()
+    today = now.date()
+    if stamp.date() == today:
+        return "today", "Today"
+
+    week_start = today - timedelta(days=today.weekday())
+    if week_start <= stamp.date() < today:
+        return "week", "This Week"
+
+    month = stamp.strftime("%Y-%m")
+    return f"month:{month}", month
+
+
+def section_key(data, mode="date", now=None):
+    """메모가 속할 섹션 키 반환"""
+    return section_for(data, mode, now)[0]
+
+
+def group_memos(sorted_memos, mode="date", now=None):
+    """정렬된 (memo_id, data) 목록을 섹션 목록으로 분류
+
+    섹션 순서는 입력 순서에서 처음 등장한 순서를 따름 (고정 → 최신순)
+    반환값: [(키, 라벨, [(memo_id, data), ...]), ...]
+    """
+    now = now or datetime.now()
+    sections = {}
+    for m_id, data in sorted_memos:
+        key, label = section_for(data, mode, now)
+        if key not in sections:
+            sections[key] = (label, [])
+        sections[key][1].append((m_id, data))
+
+    return [(key, label, items) for key, (label, items) in sections.items()]
+
+
+def is_expanded_by_default(key):
+    """사용자가 상태를 바꾸지 않은 섹션의 기본 펼침 여부"""
+    return key in DEFAULT_EXPANDED
@@ -0,0 +1,87 @@
+"""
+사이드바 메모 행 상태 모듈
+행의 시각 상태(일반/호버/선택/수정 중/드래그/다중 선택)를 추적하여
+실제로 값이 바뀔 때만 위젯 configure를 호출 (불필요한 CustomTkinter 재그리기 방지)
+"""
+
+from ui_colors import MEMO_LIST_COLORS, PASTEL_COLORS
+
+BORDER_COLOR = "#3E454F"
+MULTI_SELECT_BORDER_COLOR = PASTEL_COLORS["primary"]
+DRAG_COLOR = PASTEL_COLORS["accent"]
+
+
+class MemoRowState:
+    """메모 행 하나의 상태 머신
+
+    상태 플래그를 바꾼 뒤 apply()를 호출하면 현재 적용된 값과 비교해
+    달라진 속성만 위젯에 반영함
+    """
+
+    def __init__(self, selected=False, unsaved=False, multi_selected=False):
+        self.selected = selected  # 현재 에디터에 열린 메모
+        self.unsaved = unsaved  # 수정 후 아직 저장되지 않음 (selected일 때만 의미 있음)
+        self.multi_selected = multi_selected  # 사이드바 다중 선택
+        self.hover = False
+        self.dragging = False
+
+        self.frame = None
+        self.title_label = None
+        self.info_label = None
+        self.preview_label = None
+        self._applied = {}  # (위젯 역할, 속성) → 마지막으로 적용한 값
+
+    def _palette(self):
+        """상태에 해당하는 MEMO_LIST_COLORS 키 접두사"""
+        if self.selected:
+            return "unsaved" if self.unsaved else "selected"
+        return "saved"
+
+    def visual(self):
+        """현재 상태에 해당하는 시각 속성 계산"""
+        palette = self._palette()
+        if self.dragging:
+            fg_color = DRAG_COLOR
+        elif self.hover:
+            fg_color = MEMO_LIST_COLORS[f"{palette}_hover"]
+        else:
+            fg_color = MEMO_LIST_COLORS[f"{palette}_bg"]
+
+        return {
+            ("frame", "fg_color"): fg_color,
+            ("frame", "border_width"): 2 if self.multi_selected else 1,
+            ("frame", "border_color"): MULTI_SELECT_BORDER_COLOR if self.multi_selected else BORDER_COLOR,
+            ("title", "text_color"): MEMO_LIST_COLORS[f"{palette}_title"],
+            ("info", "text_color"): MEMO_LIST_COLORS[f"{palette}_info"],
+            ("preview", "text_color"): MEMO_LIST_COLORS[f"{palette}_info"],
+        }
+
+    def attach(self, frame, title_label, info_label, preview_label):
+        """위젯 연결 (위젯은 visual() 값으로 생성되었다고 가정)"""
+        self.frame = frame
+        self.title_label = title_label
+        self.info_label = info_label
+        self.preview_label = preview_label
+        self._applied = self.visual()
+
+    def set(self, **flags):
+        """상태 플래그 변경 후 바뀐 속성만 적용"""
+        for name, value in flags.items():
+            setattr(self, name, value)
+        self.apply()
+
+    def apply(self):
+        """현재 적용된 값과 다른 속성만 위젯에 configure"""
+        if self.frame is None:
+            return
+
+        widgets = {"frame": self.frame, "title": self.title_label, "info": self.info_label,
+                   "preview": self.preview_label}
+        pending = {}
+        for (role, attr), value in self.visual().items():
+            if self._applied.get((role, attr)) != value:
+                pending.setdefault(role, {})[attr] = value
+                self._applied[(role, attr)] = value
+
+        for role, options in pending.items():
+            widgets[role].configure(**options)
@@ -0,0 +1,321 @@
+"""
+코드 블록 구문 강조 모듈
+``` 펜스로 감싼 코드 블록(shell, Python, JSON, YAML)을 줄 단위로 분석하여 색상 태그를 붙임
+편집된 줄부터 다시 분석하고, 줄 끝 상태가 이전과 같아지는 곳에서 멈춤
+강조 태그(hl_ 접두사)는 화면 표시용이므로 저장·변경 추적·실행 취소에서 제외됨
+"""
+
+import builtins
+import keyword
+import re
+
+from line_cache import LineCache
+
+TAG_PREFIX = "hl_"
+
+# 토큰 종류별 글자색 (태그 수는 이 목록으로 고정)
+COLORS = {
+    "keyword": "#C792EA",
+    "builtin": "#82AAFF",
+    "string": "#C3E88D",
+    "comment": "#7F8C98",
+    "number": "#F78C6C",
+    "key": "#FFCB6B",
+    "variable": "#89DDFF",
+    "fence": "#7F8C98",
+}
+
+# 펜스 언어 이름 → 분석기 이름 (목록에 없는 언어는 강조 없이 코드 블록으로만 취급)
+LANGUAGES = {
+    "sh": "shell", "bash": "shell", "shell": "shell", "zsh": "shell", "console": "shell",
+    "py": "python", "python": "python", "python3": "python",
+    "json": "json",
+    "yaml": "yaml", "yml": "yaml",
+}
+
+FENCE = "```"
+_FENCE_OPEN = re.compile(r"\s*```\s*([\w+#.-]*)")
+_FENCE_CLOSE = re.compile(r"\s*```\s*$")
+
+
+def tag_options(tag_name):
+    """강조 태그의 tag_config 옵션 (강조 태그가 아니면 None)"""
+    color = COLORS.get(tag_name[len(TAG_PREFIX):]) if tag_name.startswith(TAG_PREFIX) else None
+    return {"foreground": color} if color else None
+
+
+# --- Python ---
+
+_PY_KEYWORDS = frozenset(keyword.kwlist)
+_PY_BUILTINS = frozenset(name for name in dir(builtins) if not name.startswith("_")) | {"self", "cls"}
+_PY_TOKEN = re.compile(r"""
+    (?P<comment>\#.*)
+  | (?P<triple>[rRbBuUfF]{0,2}(?:\"\"\"|'''))
+  | (?P<string>[rRbBuUfF]{0,2}(?:"(?:\\.|[^"\\])*"?|'(?:\\.|[^'\\])*'?))
+  | (?P<decorator>@[\w.]+)
+  | (?P<number>(?<![\w.])(?:0[xXoObB][\da-fA-F_]+|(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d+)?[jJ]?))
+  | (?P<name>[A-Za-z_]\w*)
+""", re.VERBOSE)
+
+
+def _lex_python(text, inner):
+    """inner: 닫히지 않은 삼중 따옴표 문자열의 따옴표 (없으면 None)"""
+    tokens = []
+    pos = 0
+    if inner:
+        end = text.find(inner)
+        if end == -1:
+            return [("string", 0, len(text))] if text else [], inner
+        pos = end + 3
+        tokens.append(("string", 0, pos))
+
+    length = len(text)
+    while pos < length:
+        match = _PY_TOKEN.search(text, pos)
+        if not match:
+            break
+        kind = match.lastgroup
+        start, pos = match.span()
+        if kind == "triple":
+            quote = match.group()[-3:]
+            end = text.find(quote, pos)
+            if end == -1:
+                tokens.append(("string", start, length))
+                return tokens, quote
+            pos = end + 3
+            tokens.append(("string", start, pos))
+        elif kind == "name":
+            word = match.group()
+            if word in _PY_KEYWORDS:
+                tokens.append(("keyword", start, pos))
+            elif word in _PY_BUILTINS:
+                tokens.append(("builtin", start, pos))
+        elif kind == "decorator":
+            tokens.append(("builtin", start, pos))
+        else:
+            tokens.append((kind, start, pos))
+    return tokens, None
+
+
+# --- shell ---
+
+_SH_KEYWORDS = frozenset((
+    "if", "then", "else", "elif", "fi", "for", "while", "until", "do", "done", "case", "esac",
+    "in", "function", "select", "time", "return", "export", "local", "readonly", "sudo",
+))
+# 다음 단어도 명령 위치인 키워드
+_SH_PREFIX_KEYWORDS = frozenset(("if", "then", "else", "elif", "do", "while", "until", "time", "sudo", "!"))
+_SH_TOKEN = re.compile(r"""
+    (?P<comment>(?<![^\s;|&(])\#.*)
+  | (?P<string>"(?:\\.|[^"\\])*"?|'[^']*'?)
+  | (?P<variable>\$(?:\{[^}]*\}?|\w+|[@*\#?$!-]))
+  | (?P<operator>\|\||&&|[|;&(){}]|\$\()
+  | (?P<word>[^\s"'$|;&(){}\#]+(?:\#[^\s"'$|;&(){}]*)*)
+""", re.VERBOSE)
+_SH_ASSIGNMENT = re.compile(r"[A-Za-z_]\w*=")
+_SH_NUMBER = re.compile(r"-?\d+(?:\.\d+)?$")
+
+
+def _lex_shell(text, inner):
+    """inner: 앞 줄이 \\로 이어지면 "cont" (다음 줄 첫 단어는 명령 위치가 아님)"""
+    tokens = []
+    command = inner != "cont"
+    for match in _SH_TOKEN.finditer(text):
+        kind = match.lastgroup
+        start, end = match.span()
+        if kind == "operator":
+            command = True
+            continue
+        if kind != "word":
+            tokens.append((kind, start, end))
+            continue
+
+        word = match.group()
+        if command:
+            if word in _SH_KEYWORDS:
+                tokens.append(("keyword", start, end))
+                command = word in _SH_PREFIX_KEYWORDS
+            elif _SH_ASSIGNMENT.match(word):
+                # VAR=value 명령 앞 환경 변수 지정
+                tokens.append(("variable", start, start + word.index("=")))
+            else:
+                tokens.append(("builtin", start, end))
+                command = False
+        elif word.startswith("-") and not _SH_NUMBER.match(word):
+            tokens.append(("key", start, start + (word.find("=") if "=" in word else len(word))))
+        elif _SH_NUMBER.match(word):
+            tokens.append(("number", start, end))
+        elif word in ("in", "do", "then"):
+            tokens.append(("keyword", start, end))
+    return tokens, "cont" if text.rstrip().endswith("\\") else None
+
+
+# --- JSON ---
+
+_JSON_TOKEN = re.compile(r"""
+    (?P<string>"(?:\\.|[^"\\])*"?)(?P<colon>\s*:)?
+  | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<keyword>\b(?:true|false|null)\b)
+""", re.VERBOSE)
+
+
+def _lex_json(text, inner):
+    tokens = []
+    for match in _JSON_TOKEN.finditer(text):
+        if match.group("string") is not None:
+            start, end = match.span("string")
+            tokens.append(("key" if match.group("colon") else "string", start, end))
+        else:
+            tokens.append((match.lastgroup, *match.span()))
+    return tokens, None
+
+
+# --- YAML ---
+
+_YAML_KEY = re.compile(r"""(\s*(?:-\s+)*)("(?:\\.|[^"\\])*"|'[^']*'|[^\s\#"'\[\]{},:-][^\#:]*?|-[^\s\#:][^\#:]*?)\s*:(?=\s|$)""")
+_YAML_BLOCK_SCALAR = re.compile(r"\s*[|>][-+0-9]*\s*(?:\#.*)?$")
+_YAML_TOKEN = re.compile(r"""
+    (?P<comment>(?<!\S)\#.*)
+  | (?P<string>"(?:\\.|[^"\\])*"?|'(?:[^']|'')*'?)
+  | (?P<variable>(?<!\S)[&*][^\s,\[\]{}]+)
+  | (?P<number>(?<![\w.-])-?\d+(?:\.\d+)?(?![\w.-]))
+  | (?P<keyword>(?<![\w-])(?:true|false|yes|no|null|on|off|True|False|Yes|No|Null|~)(?![\w-])|^---|^\.\.\.)
+""", re.VERBOSE)
+
+
+def _indent(text):
+    return len(text) - len(text.lstrip())
+
+
+def _lex_yaml(text, inner):
+    """inner: 블록 스칼라(| 또는 >)를 연 키의 들여쓰기 (블록 밖이면 None)"""
+    if inner is not None:
+        if not text.strip():
+            return [], inner
+        if _indent(text) > inner:
+            return [("string", _indent(text), len(text))], inner
+
+    tokens = []
+    pos = 0
+    match = _YAML_KEY.match(text)
+    if match:
+        tokens.append(("key", *match.span(2)))
+        pos = match.end()
+        if _YAML_BLOCK_SCALAR.match(text, pos):
+            return tokens, _indent(text)
+
+    for match in _YAML_TOKEN.finditer(text, pos):
+        tokens.append((match.lastgroup, *match.span()))
+    return tokens, None
+
+
+_LEXERS = {"python": _lex_python, "shell": _lex_shell, "json": _lex_json, "yaml": _lex_yaml}
+
+
+def lex_line(text, state):
+    """한 줄 분석: ((종류, 시작 열, 끝 열) 튜플, 줄 끝 상태)
+
+    state: 코드 블록 밖이면 None, 안이면 (분석기 이름, 분석기 내부 상태)
+    """
+    if state is None:
+        if FENCE not in text:
+            return (), None
+        match = _FENCE_OPEN.match(text)
+        if not match:
+            return (), None
+        return (("fence", 0, len(text)),), (LANGUAGES.get(match.group(1).lower(), ""), None)
+
+    if FENCE in text and _FENCE_CLOSE.match(text):
+        return (("fence", 0, len(text)),), None
+
+    lang, inner = state
+    lexer = _LEXERS.get(lang)
+    if lexer is None:
+        return (), state
+    tokens, inner = lexer(text, inner)
+    return tuple(tokens), (lang, inner)
+
+
+# 코드 블록이 없는 줄의 캐시 값 (공유)
+_PLAIN = (None, None, ())
+
+
+class SyntaxHighlighter:
+    """코드 블록 강조 상태 (줄별 (시작 상태, 끝 상태, 토큰) 캐시)
+
+    변경 추적기에 DocumentModel.apply 다음에 등록하고, 유휴 시간에 highlight()를 호출
+    ensure_tag(tag)는 강조 태그를 위젯에 설정 (TagRegistry.ensure)
+    """
+
+    def __init__(self, text_widget, document, ensure_tag):
+        self.widget = text_widget
+        self.document = document
+        self.ensure_tag = ensure_tag
+        self._lines = LineCache()
+        self._used = set()  # 위젯에 붙인 적이 있는 강조 태그
+
+    def apply(self, edit):
+        """변경 이벤트 반영: 바뀐 줄만 무효화 (서식 변경은 분석 결과와 무관)"""
+        if edit.op in ("tag_add", "tag_remove"):
+            return
+        if edit.op == "reset":
+            self._lines.reset()
+        else:
+            self._lines.splice(edit.first_line, edit.old_last, edit.new_last)
+
+    def highlight(self):
+        """무효 줄을 다시 분석하여 강조 태그 갱신 (끝 상태가 바뀌면 다음 줄로 이어서 분석)"""
+        document = self.document
+        line_count = document.line_count()
+        cache = self._lines
+
+        if not cache.valid or len(cache) != line_count:
+            cache.reset()
+            cache.ensure(line_count)
+            self._clear("1.0", "end")
+            # 코드 블록이 없는 메모는 줄별 분석 없이 끝냄
+            if FENCE not in document.plain_text():
+                cache.store(1, [_PLAIN] * line_count)
+                return
+
+        done = 0
+        for first, last in cache.dirty_runs():
+            if last <= done:
+                continue
+            line = max(first, done + 1)
+            # 편집으로 이웃 글자의 강조 태그를 물려받았을 수 있으므로 무효 줄은 먼저 지움 (줄바꿈 포함)
+            self._clear(f"{line}.0", f"{last + 1}.0")
+
+            previous = cache.get(line - 1) if line > 1 else None
+            state = previous[1] if previous else None
+            while line <= line_count:
+                entry = cache.get(line)
+                if line > last and entry is not None and entry[0] == state:
+                    break
+
+                tokens, end_state = lex_line(document.raw_line(line), state)
+                if entry is None or entry[2] != tokens:
+                    # 뒤쪽 무효 구간까지 이어서 분석하거나 이전 강조가 있던 줄은 그 줄만 지움
+                    if (entry is None and line > last) or (entry is not None and entry[2]):
+                        self._clear(f"{line}.0", f"{line + 1}.0")
+                    self._tag_line(line, tokens)
+                cache.store(line, [(state, end_state, tokens) if state or end_state or tokens else _PLAIN])
+                state = end_state
+                done = line
+                line += 1
+
+    def _clear(self, start, end):
+        for tag in self._used:
+            self.widget.tag_remove(tag, start, end)
+
+    def _tag_line(self, line, tokens):
+        ranges = {}
+        for kind, start, end in tokens:
+            if start < end:
+                ranges.setdefault(kind, []).extend((f"{line}.{start}", f"{line}.{end}"))
+        for kind, indices in ranges.items():
+            tag = TAG_PREFIX + kind
+            if tag not in self._used:
+                self.ensure_tag(tag)
+                self._used.add(tag)
+            self.widget.tag_add(tag, *indices)
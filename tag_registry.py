@@ -0,0 +1,83 @@
+"""
+동적 태그 등록 모듈
+색상/하이라이트/링크/폰트/구문 강조 태그 이름을 tag_config 옵션으로 해석하고,
+Text 위젯별로 이미 설정한 태그를 기억하여 위젯 수명 동안 태그당 한 번만 설정
+"""
+
+from functools import lru_cache
+
+import syntax_highlight
+
+
+@lru_cache(maxsize=4096)
+def tag_options(tag_name):
+    """동적 태그 이름에 해당하는 tag_config 옵션 반환 (동적 태그가 아니면 None)
+
+    반환된 딕셔너리는 캐시되어 공유되므로 수정하지 말 것
+    """
+    # 색상 태그 (예: color_#ff0000)
+    if tag_name.startswith("color_"):
+        return {"foreground": tag_name.split("_")[1]}
+
+    # 하이라이트 태그 (예: highlight_#ffff00)
+    if tag_name.startswith("highlight_"):
+        return {"background": tag_name.split("_")[1]}
+
+    # 링크 태그 (예: link_https://example.com)
+    if tag_name.startswith("link_"):
+        return {"foreground": "blue", "underline": True}
+
+    # 구문 강조 태그 (예: hl_keyword)
+    if tag_name.startswith(syntax_highlight.TAG_PREFIX):
+        return syntax_highlight.tag_options(tag_name)
+
+    # 폰트 태그 (f|Family|Size|Weight|Slant)
+    if tag_name.startswith("f|"):
+        parts = tag_name.split("|")
+        if len(parts) != 5:
+            return None
+        _, family, size, weight, slant = parts
+        style_parts = []
+        if weight == "bold":
+            style_parts.append("bold")
+        if slant == "italic":
+            style_parts.append("italic")
+        try:
+            return {"font": (family, int(size), " ".join(style_parts))}
+        except ValueError:
+            return None
+
+    return None
+
+
+class TagRegistry:
+    """Text 위젯 하나에 설정된 동적 태그 목록"""
+
+    def __init__(self, text_widget, on_link=None):
+        self.widget = text_widget
+        self.on_link = on_link  # 링크 태그 최초 설정 시 호출 (이벤트 바인딩용)
+        self._configured = set()
+
+    def __contains__(self, tag_name):
+        return tag_name in self._configured
+
+    def ensure(self, tag_name):
+        """태그가 아직 설정되지 않았으면 설정"""
+        if tag_name in self._configured:
+            return
+
+        options = tag_options(tag_name)
+        if options is not None:
+            self.widget.tag_config(tag_name, **options)
+            if self.on_link and tag_name.startswith("link_"):
+                self.on_link(tag_name)
+            # 구문 강조는 사용자가 지정한 색상/서식보다 우선순위를 낮춤
+            if tag_name.startswith(syntax_highlight.TAG_PREFIX):
+                self.widget.tag_lower(tag_name)
+        self._configured.add(tag_name)
+
+    def ensure_all(self, tag_names):
+        """여러 태그를 한 번에 등록 (메모 로드 전 일괄 설정)"""
+        for tag_name in tag_names:
+            if tag_name not in self._configured:
+                self.ensure(tag_name)
@@ -0,0 +1,72 @@
+"""
+실행 취소 관리 모듈 테스트
+지워진 임베드 위젯(표)이 실행 취소/다시 실행 후 다시 만들어지는지 확인 (디스플레이가 없으면 건너뜀)
+"""
+
+import tkinter as tk
+import unittest
+
+from table_widget import TableWidget
+from text_tracker import TextChangeTracker
+from undo_manager import UndoManager
+
+
+class UndoEmbeddedTableTest(unittest.TestCase):
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("디스플레이 없음")
+        self.root.withdraw()
+        self.text = tk.Text(self.root)
+        self.tracker = TextChangeTracker(self.text)
+        self.undo_manager = UndoManager(
+            self.text, self.tracker, describe_window=self.describe_window, restore_window=self.restore_window
+        )
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def describe_window(self, name):
+        widget = self.text.nametowidget(name)
+        if isinstance(widget, TableWidget):
+            return {"type": "table", "data": widget.get_table_data()}
+        return None
+
+    def restore_window(self, segment, index):
+        data = segment["data"]
+        table = TableWidget(self.text, rows=data.get("rows", 3), cols=data.get("cols", 3))
+        table.set_table_data(data)
+        self.text.window_create(index, window=table)
+        return True
+
+    def _tables(self):
+        return [self.text.nametowidget(name) for name in self.text.window_names()]
+
+    def test_undo_table_deletion(self):
+        self.text.insert("1.0", "앞\n\n뒤")
+        table = TableWidget(self.text, rows=2, cols=2)
+        table.cells[0][0].insert("1.0", "셀")
+        self.text.window_create("2.0", window=table)
+        data = table.get_table_data()
+        self.undo_manager.clear()
+
+        self.text.delete("1.0", "end-1c")
+        self.root.update()
+        self.assertFalse(table.winfo_exists())  # Tk가 지워진 임베드 위젯을 파괴함
+
+        self.assertTrue(self.undo_manager.undo())
+        self.assertEqual(self.text.get("1.0", "end-1c"), "앞\n\n뒤")
+        tables = self._tables()
+        self.assertEqual(len(tables), 1)
+        self.assertEqual(tables[0].get_table_data(), data)
+        self.assertEqual(self.text.index(str(tables[0])), "2.0")
+        self.assertTrue(self.undo_manager.can_redo())
+
+        self.assertTrue(self.undo_manager.redo())
+        self.assertEqual(self.text.get("1.0", "end-1c"), "")
+        self.assertEqual(self._tables(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+텍스트 통계 모듈
+문서 모델의 줄별 통계(단어 수, 한글 음절 수)를 편집된 줄만 다시 세어 합계를 유지하고,
+상태 표시줄에 쓸 읽기 시간 추정을 제공
+"""
+
+import re
+
+_HANGUL_SYLLABLE = re.compile("[가-힣]")
+
+# 읽기 속도 (분당): 한글은 음절, 그 밖의 언어는 단어 기준
+HANGUL_PER_MINUTE = 500
+WORDS_PER_MINUTE = 200
+
+
+def line_stats(text):
+    """한 줄의 (단어 수, 한글 음절 수, 한글이 없는 단어 수)"""
+    words = text.split()
+    hangul = len(_HANGUL_SYLLABLE.findall(text))
+    if not hangul:
+        return len(words), 0, len(words)
+    other = sum(1 for word in words if not _HANGUL_SYLLABLE.search(word))
+    return len(words), hangul, other
+
+
+class TextStats:
+    """문서 모델과 같은 변경 이벤트를 받아 줄별 통계 합계를 유지
+
+    변경 추적기에 DocumentModel.apply 다음에 등록해야 함 (바뀐 줄 내용을 모델에서 읽음)
+    """
+
+    def __init__(self, document):
+        self.document = document
+        self._lines = None  # 줄별 line_stats 결과 (None이면 다음 조회 때 전체 계산)
+        self._words = 0
+        self._hangul = 0
+        self._other = 0
+
+    def apply(self, edit):
+        """변경 이벤트 반영: 바뀐 줄만 다시 셈"""
+        if self._lines is None or edit.op in ("tag_add", "tag_remove"):
+            return
+        if edit.op == "reset" or not self.document.valid:
+            self._lines = None
+            return
+
+        first = edit.first_line - 1
+        old_end = min(edit.old_last, len(self._lines))
+        new_stats = [line_stats(self.document.line(number))
+                     for number in range(edit.first_line, edit.new_last + 1)]
+        self._add(self._lines[first:old_end], -1)
+        self._add(new_stats, 1)
+        self._lines[first:old_end] = new_stats
+
+        if len(self._lines) != self.document.line_count():
+            self._lines = None
+
+    def _add(self, stats, sign):
+        for words, hangul, other in stats:
+            self._words += sign * words
+            self._hangul += sign * hangul
+            self._other += sign * other
+
+    def _ensure(self):
+        if self._lines is not None:
+            return
+        self._lines = [line_stats(line) for line in self.document.lines()]
+        self._words = self._hangul = self._other = 0
+        self._add(self._lines, 1)
+
+    @property
+    def words(self):
+        self._ensure()
+        return self._words
+
+    @property
+    def hangul(self):
+        """한글 음절 수"""
+        self._ensure()
+        return self._hangul
+
+    def reading_minutes(self):
+        """예상 읽기 시간 (분)"""
+        self._ensure()
+        return self._hangul / HANGUL_PER_MINUTE + self._other / WORDS_PER_MINUTE
@@ -0,0 +1,284 @@
+"""
+텍스트 변경 추적 모듈
+Text 위젯의 Tcl 명령을 프록시로 감싸 insert/delete/태그/임베드 변경을 가로채고,
+변경된 줄 범위를 리스너에 알림 (증분 직렬화 등에 사용)
+"""
+
+import logging
+import re
+from collections import namedtuple
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# 텍스트 편집 이벤트
+# op: "insert" | "delete" | "replace" | "tag_add" | "tag_remove" | "embed" | "reset"
+# first_line / old_last / new_last: 변경 전 기준 first_line~old_last 줄이
+#   변경 후 first_line~new_last 줄로 바뀜 (1부터 시작, reset이면 모두 0)
+# start / end: 변경 전 기준 (줄, 열) 위치 (insert/embed는 end == start)
+# text: 삽입된 텍스트 (insert/replace), tag: 태그 이름 (tag_add/tag_remove)
+TextEdit = namedtuple("TextEdit", "op first_line old_last new_last start end text tag")
+
+RESET = TextEdit("reset", 0, 0, 0, None, None, None, None)
+
+# 변경 명령만 Python 훅을 거치고, 나머지(index, get, tag names 등)는 원래 명령으로 바로 전달
+# "sel" 태그 변경(마우스 선택)과 UNTRACKED_TAG_PATTERN 태그(구문 강조)도 내용 변경이 아니므로 훅을 거치지 않음
+UNTRACKED_TAG_PATTERN = "hl_*"
+
+_PROXY_SCRIPT = """
+proc %(widget)s {args} {
+    switch -exact -- [lindex $args 0] {
+        insert - delete - replace {}
+        tag {
+            if {[lindex $args 1] ni {add remove} || [lindex $args 2] eq "sel"
+                    || [string match {%(untracked)s} [lindex $args 2]]} {
+                return [%(orig)s {*}$args]
+            }
+        }
+        image - window {
+            if {[lindex $args 1] ne "create"} {
+                return [%(orig)s {*}$args]
+            }
+        }
+        edit {
+            if {[lindex $args 1] ni {undo redo}} {
+                return [%(orig)s {*}$args]
+            }
+        }
+        default {
+            return [%(orig)s {*}$args]
+        }
+    }
+    %(before)s {*}$args
+    set code [catch {%(orig)s {*}$args} result options]
+    %(after)s $code
+    return -options $options $result
+}
+"""
+
+
+# 이미 정규화된 "줄.열" 인덱스 (dump 결과 등): Tk에 묻지 않고 바로 해석
+_CANONICAL_INDEX = re.compile(r"\d+\.\d+$")
+
+
+def parse_index(index):
+    """"줄.열" 문자열을 (줄, 열) 정수 튜플로 변환"""
+    line, col = index.split(".")
+    return int(line), int(col)
+
+
+class TextChangeTracker:
+    """Text 위젯 변경 추적기
+
+    위젯 경로 이름의 Tcl 명령을 프록시 proc으로 교체하여,
+    Python 코드·기본 키 바인딩·붙여넣기 등 모든 경로의 변경을 한 곳에서 감지함
+    Tcl 오류는 원래대로 호출자에게 전달됨 (TclError 기반 로직 유지)
+    """
+
+    def __init__(self, text_widget):
+        self.widget = text_widget
+        self.generation = 0  # 내용/서식이 바뀔 때마다 증가
+        self._listeners = []
+        self._before_listeners = []
+        self._batch_listeners = []
+        self._batch_depth = 0
+        self._pending = []  # 진행 중인 변경 명령 스택 (중첩 호출 대비)
+        self._suspended = 0
+
+        self._orig = text_widget._w + "_orig"
+        tk = text_widget.tk
+        before = text_widget.register(self._before)
+        after = text_widget.register(self._after)
+        tk.call("rename", text_widget._w, self._orig)
+        tk.eval(_PROXY_SCRIPT % {"widget": text_widget._w, "orig": self._orig,
+                                 "before": before, "after": after, "untracked": UNTRACKED_TAG_PATTERN})
+
+    def add_listener(self, callback):
+        """변경 이벤트(TextEdit) 리스너 등록"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        """리스너 해제"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def add_before_listener(self, callback):
+        """변경 직전 이벤트 리스너 등록 (지워질 내용 등 변경 전 상태를 읽을 때 사용)
+
+        명령이 실패하면 같은 이벤트가 add_listener 쪽으로 전달되지 않을 수 있음
+        """
+        self._before_listeners.append(callback)
+
+    def add_batch_listener(self, callback):
+        """묶음 변경 시작/종료 리스너 등록 (callback(started: bool))"""
+        self._batch_listeners.append(callback)
+
+    @property
+    def in_batch(self):
+        """묶음 변경 진행 중 여부"""
+        return self._batch_depth > 0
+
+    @contextmanager
+    def batch(self):
+        """여러 변경을 하나의 편집 단위(실행 취소 한 번 등)로 묶음 (중첩 가능)"""
+        self.begin_batch()
+        try:
+            yield
+        finally:
+            self.end_batch()
+
+    def begin_batch(self):
+        """묶음 변경 시작 (after()로 나눠 진행하는 변경처럼 with 블록을 쓸 수 없을 때 사용)"""
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self._notify_batch(True)
+
+    def end_batch(self):
+        """begin_batch로 시작한 묶음 변경 종료"""
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._notify_batch(False)
+
+    @contextmanager
+    def suspend(self):
+        """대량 변경(메모 로드 등) 동안 개별 이벤트 대신 종료 시 reset 한 번만 알림"""
+        self._suspended += 1
+        try:
+            yield
+        finally:
+            self._suspended -= 1
+            if self._suspended == 0:
+                self.generation += 1
+                self._notify(RESET)
+
+    def detach(self):
+        """위젯 제거 후 남은 프록시 proc 정리"""
+        self._listeners.clear()
+        self._before_listeners.clear()
+        self._batch_listeners.clear()
+        try:
+            self.widget.tk.call("rename", self.widget._w, "")
+        except Exception:
+            pass
+
+    def _call(self, *args):
+        """프록시를 거치지 않고 원래 위젯 명령 호출"""
+        return self.widget.tk.call(self._orig, *args)
+
+    def _document_end(self):
+        """문서 끝(마지막 줄바꿈 이전) 위치"""
+        return parse_index(self._call("index", "end-1c"))
+
+    def _resolve(self, index, end=None):
+        """인덱스를 (줄, 열)로 변환하고 문서 끝(마지막 줄바꿈 이후)은 end-1c로 제한
+
+        end: 명령 하나에서 여러 인덱스를 해석할 때 한 번만 구한 문서 끝 위치
+        """
+        if end is None:
+            end = self._document_end()
+        return min(parse_index(self._call("index", index)), end)
+
+    def _tag_position(self, index, end):
+        """태그 명령 인덱스 해석: dump/tag_ranges에서 온 "줄.열"은 Python에서 바로 변환"""
+        index = str(index)
+        if _CANONICAL_INDEX.match(index):
+            return min(parse_index(index), end)
+        return self._resolve(index, end)
+
+    def _before(self, *args):
+        """변경 명령 실행 직전 호출: 변경 범위 계산"""
+        if self._suspended:
+            self._pending.append(None)
+            return
+
+        try:
+            edit = self._describe(args)
+        except Exception as e:
+            # 해석할 수 없는 명령은 전체 무효화로 처리
+            logger.debug(f"Unresolvable text command {args[:2]}: {e}")
+            edit = RESET
+        self._pending.append(edit)
+
+        if edit is not None and edit is not RESET:
+            for callback in list(self._before_listeners):
+                try:
+                    callback(edit)
+                except Exception as e:
+                    logger.error(f"Text before-change listener failed: {e}", exc_info=True)
+
+    def _after(self, code):
+        """변경 명령 실행 직후 호출: 성공한 경우에만 알림"""
+        edit = self._pending.pop() if self._pending else None
+        if code != "0":
+            return
+
+        self.generation += 1
+        if edit is not None:
+            self._notify(edit)
+
+    def _describe(self, args):
+        """Tcl 명령 인자를 TextEdit 이벤트로 변환 (변경 전 인덱스 기준)"""
+        op = args[0]
+
+        if op == "insert":
+            start = self._resolve(args[1])
+            text = "".join(args[2::2])
+            new_last = start[0] + text.count("\n")
+            return TextEdit("insert", start[0], start[0], new_last, start, start, text, None)
+
+        if op == "delete":
+            if len(args) > 3:
+                return RESET  # 여러 범위 동시 삭제는 드물어서 전체 무효화
+            document_end = self._document_end()
+            start = self._resolve(args[1], document_end)
+            end = self._resolve(args[2] if len(args) > 2 else f"{args[1]}+1c", document_end)
+            if end <= start:
+                return None
+            return TextEdit("delete", start[0], end[0], start[0], start, end, None, None)
+
+        if op == "replace":
+            document_end = self._document_end()
+            start = self._resolve(args[1], document_end)
+            end = max(self._resolve(args[2], document_end), start)
+            text = "".join(args[3::2])
+            new_last = start[0] + text.count("\n")
+            return TextEdit("replace", start[0], end[0], new_last, start, end, text, None)
+
+        if op == "tag":
+            tag = args[2]
+            indices = args[3:]
+            if not indices:
+                return None
+            # 여러 구간을 한 번에 바꾸는 명령(서식 일괄 적용)도 구간은 앞에서부터 차례로
+            # 주어지므로 첫/마지막 인덱스만 해석 (정규화된 인덱스는 Tk에 묻지 않음)
+            document_end = self._document_end()
+            last = indices[-1] if len(indices) % 2 == 0 else f"{indices[-1]}+1c"
+            start = self._tag_position(indices[0], document_end)
+            end = max(self._tag_position(last, document_end), start)
+            return TextEdit(f"tag_{args[1]}", start[0], end[0], end[0], start, end, None, tag)
+
+        if op in ("image", "window"):
+            start = self._resolve(args[2])
+            return TextEdit("embed", start[0], start[0], start[0], start, start, None, None)
+
+        # edit undo/redo: Tk 내부 실행 취소는 범위를 알 수 없으므로 전체 무효화
+        # (Tk 실행 취소가 꺼져 있으면 아무것도 바꾸지 않으므로 무시)
+        if not self.widget.tk.getboolean(self._call("cget", "-undo")):
+            return None
+        return RESET
+
+    def _notify_batch(self, started):
+        """묶음 리스너 호출"""
+        for callback in list(self._batch_listeners):
+            try:
+                callback(started)
+            except Exception as e:
+                logger.error(f"Text batch listener failed: {e}", exc_info=True)
+
+    def _notify(self, edit):
+        """리스너 호출 (리스너 오류가 편집을 막지 않도록 격리)"""
+        for callback in list(self._listeners):
+            try:
+                callback(edit)
+            except Exception as e:
+                logger.error(f"Text change listener failed: {e}", exc_info=True)
@@ -0,0 +1,132 @@
+"""
+메모 텍스트 유틸리티 모듈
+제목, 사이드바 미리보기처럼 메모 본문에서 파생되는 짧은 텍스트 계산
+"""
+
+import re
+
+# 체크리스트 기호 (insert_checklist에서 삽입)
+CHECKLIST_GLYPHS = "☐☑"
+
+# 사이드바 미리보기 최대 길이
+PREVIEW_LENGTH = 60
+
+# 목차/할 일 항목 이름 최대 길이와 메모 메타데이터에 캐시하는 미완료 항목 수
+LABEL_LENGTH = 40
+OPEN_TASKS_LIMIT = 20
+
+# 자동 제목 최대 길이와 제목 정책
+TITLE_LENGTH = 20
+TITLE_POLICIES = ("first_line", "first_heading", "first_sentence")
+DEFAULT_TITLE_POLICY = "first_line"
+HEADING_SCAN_LINES = 200  # 제목(#) 줄을 찾을 최대 줄 수 (없으면 첫 줄 사용)
+
+_SENTENCE_END = re.compile(r"[.!?。](?=\s|$)")
+
+
+def _iter_lines(content, start=0):
+    """전체 split 없이 줄을 앞에서부터 하나씩 반환"""
+    length = len(content)
+    while start <= length:
+        end = content.find("\n", start)
+        if end == -1:
+            yield content[start:]
+            return
+        yield content[start:end]
+        start = end + 1
+
+
+def heading_level(text):
+    """'# 제목' 형식이면 # 개수, 아니면 0"""
+    stripped = text.lstrip()
+    level = len(stripped) - len(stripped.lstrip("#"))
+    if 0 < level <= 6 and stripped[level:level + 1] == " ":
+        return level
+    return 0
+
+
+def derive_title(lines, policy=DEFAULT_TITLE_POLICY, length=TITLE_LENGTH):
+    """줄 iterable에서 정책에 따라 자동 제목 계산 (필요한 줄까지만 읽음, 없으면 빈 문자열)
+
+    first_line: 공백이 아닌 첫 줄
+    first_heading: 앞쪽 HEADING_SCAN_LINES줄 안의 첫 '# 제목' 줄 (없으면 첫 줄)
+    first_sentence: 공백이 아닌 첫 줄의 첫 문장
+    """
+    first = None
+    for number, line in enumerate(lines):
+        text = line.strip()
+        if policy == "first_heading" and heading_level(text):
+            first = text.lstrip("#").strip()
+            break
+        if text and first is None:
+            first = text
+            if policy != "first_heading":
+                break
+        if number >= HEADING_SCAN_LINES and first is not None:
+            break
+
+    if not first:
+        return ""
+    if policy == "first_sentence":
+        match = _SENTENCE_END.search(first)
+        if match:
+            first = first[:match.end()]
+
+    title = first[:length]
+    if len(first) > length:
+        title += "..."
+    return title
+
+
+def clean_line(line):
+    """체크리스트 기호를 제거하고 공백을 정리한 순수 텍스트"""
+    for glyph in CHECKLIST_GLYPHS:
+        line = line.replace(glyph, " ")
+    return " ".join(line.split())
+
+
+def short_label(text, length=LABEL_LENGTH):
+    """목차/할 일 목록에 표시할 짧은 항목 이름"""
+    text = clean_line(text)
+    return text[:length] + "..." if len(text) > length else text
+
+
+def checklist_items(content):
+    """본문의 체크리스트 항목을 (완료 여부, 항목 이름)으로 하나씩 반환"""
+    for line in _iter_lines(content):
+        stripped = line.strip()
+        if stripped and stripped[0] in CHECKLIST_GLYPHS:
+            yield stripped[0] == "☑", short_label(stripped)
+
+
+def checklist_summary(items, limit=OPEN_TASKS_LIMIT):
+    """(완료 여부, 항목 이름) 목록을 메모 메타데이터용 요약으로 변환
+
+    {"done": 완료 수, "total": 전체 수, "open": 미완료 항목 이름 (앞에서부터 최대 limit개)}
+    """
+    done = total = 0
+    open_items = []
+    for is_done, label in items:
+        total += 1
+        if is_done:
+            done += 1
+        elif len(open_items) < limit:
+            open_items.append(label)
+    return {"done": done, "total": total, "open": open_items}
+
+
+def make_preview(content, length=PREVIEW_LENGTH):
+    """제목 줄 다음의 첫 번째 비어 있지 않은 줄을 미리보기로 반환
+
+    content는 앞뒤 공백이 제거된 메모 본문 (첫 줄이 제목)
+    """
+    lines = _iter_lines(content)
+    next(lines, None)  # 제목 줄 건너뛰기
+
+    for line in lines:
+        text = clean_line(line)
+        if text:
+            if len(text) > length:
+                text = text[:length] + "..."
+            return text
+    return ""
@@ -0,0 +1,367 @@
+"""
+실행 취소 관리 모듈
+Tk 내장 실행 취소 대신 변경 추적 이벤트로 편집 기록을 남겨,
+서식(태그) 변경과 임베드 객체(이미지, 그림판, 표)까지 실행 취소/다시 실행
+연속 입력은 하나로 합치고, 한 이벤트 처리 중의 변경과 묶음 변경은 한 단계로 기록하며,
+기록이 차지하는 메모리를 한도 안으로 유지
+"""
+
+import logging
+import time
+import tkinter
+
+from text_tracker import parse_index
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUDGET_BYTES = 2 * 1024 * 1024  # 뷰(메모) 하나의 실행 취소 기록 한도
+COALESCE_SECONDS = 1.0  # 이 시간 안의 연속 입력/삭제는 한 단계로 합침
+RECORD_OVERHEAD = 64  # 기록 하나의 대략적인 고정 크기
+UNDO_MARK = "undo_restore"
+
+
+def _index(position):
+    return f"{position[0]}.{position[1]}"
+
+
+class _Record:
+    """편집 기록 하나
+
+    kind: insert(start~end에 삽입됨), delete(start에서 pieces가 지워짐),
+          tag(tag의 start~end 구간이 before → after 상태로 바뀜)
+    pieces: 삽입/삭제된 내용 (text, image, window 조각 목록, 삽입 기록은 실행 취소할 때 채움)
+    """
+
+    __slots__ = ("kind", "start", "end", "pieces", "tag", "before", "after", "time")
+
+    def __init__(self, kind, start, end=None, pieces=None, tag=None, before=None):
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.pieces = pieces
+        self.tag = tag
+        self.before = before
+        self.after = None
+        self.time = time.monotonic()
+
+    def size(self):
+        total = RECORD_OVERHEAD
+        for piece in self.pieces or ():
+            total += RECORD_OVERHEAD + (len(piece[1]) * 2 if piece[0] == "text" else 0)
+        for ranges in (self.before, self.after):
+            total += len(ranges or ()) * 16
+        return total
+
+
+class UndoManager:
+    """Text 위젯 하나의 실행 취소/다시 실행 기록
+
+    is_transient(tag): 기록하지 않을 화면 상태 태그(선택, 접기 등) 판별 함수
+    describe_window(path): 지워질 임베드 위젯을 다시 만들 수 있는 설명(저장용 세그먼트) 반환 함수
+    restore_window(description, index): 설명으로 위젯을 다시 만들어 index에 삽입하는 함수 (실패하면 False)
+    """
+
+    def __init__(self, text_widget, text_tracker, is_transient=None, budget_bytes=DEFAULT_BUDGET_BYTES,
+                 describe_window=None, restore_window=None):
+        self.widget = text_widget
+        self.tracker = text_tracker
+        self.is_transient = is_transient or (lambda tag: tag == "sel")
+        self.budget_bytes = budget_bytes
+        self.describe_window = describe_window or (lambda path: None)
+        self.restore_window = restore_window or (lambda description, index: False)
+
+        self._undo = []  # 단계(기록 목록)의 스택
+        self._redo = []
+        self._open = None  # 현재 이벤트 처리 중에 모이는 기록 (유휴 시점 또는 묶음 종료 시 한 단계로 확정)
+        self._seal_timer = None
+        self._captured = []  # 변경 직전에 읽은 (이벤트, 지워질 내용/이전 태그 구간)
+        self._applying = False  # 실행 취소 적용 중 (이때 생기는 변경은 기록하지 않음)
+        self._bytes = 0
+
+        text_tracker.add_before_listener(self._before_edit)
+        text_tracker.add_listener(self._on_edit)
+        text_tracker.add_batch_listener(self._on_batch)
+
+    # --- 상태 ---
+
+    def can_undo(self):
+        return bool(self._undo or self._open)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def clear(self):
+        """모든 기록 삭제 (메모 전환, 전체 다시 로드 등)"""
+        self._cancel_seal()
+        self._undo.clear()
+        self._redo.clear()
+        self._open = None
+        self._captured.clear()
+        self._bytes = 0
+
+    # --- 기록 ---
+
+    def _before_edit(self, edit):
+        """변경 직전: 지워질 내용이나 바뀌기 전 태그 구간을 읽어 둠"""
+        if self._applying:
+            return
+        if edit.op in ("delete", "replace"):
+            self._captured.append((edit, self.capture(_index(edit.start), _index(edit.end))))
+        elif edit.op in ("tag_add", "tag_remove") and not self.is_transient(edit.tag):
+            self._captured.append((edit, self.tag_ranges_in(edit.tag, _index(edit.start), _index(edit.end))))
+
+    def _take_captured(self, edit):
+        for i in range(len(self._captured) - 1, -1, -1):
+            if self._captured[i][0] is edit:
+                value = self._captured[i][1]
+                # 실패한 명령 등으로 남은 이전 항목은 함께 버림
+                del self._captured[:i + 1]
+                return value
+        return None
+
+    def _on_edit(self, edit):
+        """변경 직후: 기록 추가"""
+        if self._applying:
+            return
+        if edit.op == "reset":
+            # 범위를 알 수 없는 변경 이후에는 이전 기록의 위치가 맞지 않으므로 모두 버림
+            self.clear()
+            return
+
+        records = []
+        if edit.op in ("delete", "replace"):
+            pieces = self._take_captured(edit)
+            if pieces is None:
+                self.clear()
+                return
+            records.append(_Record("delete", _index(edit.start), pieces=pieces))
+        if edit.op in ("insert", "replace"):
+            start = _index(edit.start)
+            end = self.widget.index(f"{start}+{len(edit.text)}c")
+            records.append(_Record("insert", start, end))
+        elif edit.op == "embed":
+            start = _index(edit.start)
+            records.append(_Record("insert", start, self.widget.index(f"{start}+1c")))
+        elif edit.op in ("tag_add", "tag_remove"):
+            if self.is_transient(edit.tag):
+                return
+            before = self._take_captured(edit)
+            if before is None:
+                self.clear()
+                return
+            records.append(_Record("tag", _index(edit.start), _index(edit.end), tag=edit.tag, before=before))
+
+        if not records:
+            return
+        self._redo.clear()
+        if self._open is None:
+            self._open = []
+            if not self.tracker.in_batch:
+                self._seal_timer = self.widget.after_idle(self._seal)
+        self._open.extend(records)
+
+    def _on_batch(self, started):
+        """묶음 변경은 시작 전 기록을 확정하고, 묶음 전체를 한 단계로 기록"""
+        self._seal()
+        if started:
+            self._open = []
+
+    def _cancel_seal(self):
+        if self._seal_timer is not None:
+            try:
+                self.widget.after_cancel(self._seal_timer)
+            except Exception:
+                pass
+            self._seal_timer = None
+
+    def _seal(self):
+        """모인 기록을 한 단계로 확정 (연속 입력/삭제는 이전 단계에 합침)"""
+        self._cancel_seal()
+        group, self._open = self._open, None
+        if not group:
+            return
+
+        if not self._coalesce(group):
+            self._undo.append(group)
+            self._bytes += sum(record.size() for record in group)
+        self._enforce_budget()
+
+    def _coalesce(self, group):
+        """한 글자 입력/삭제 단계를 이전 단계에 합칠 수 있으면 합치고 True 반환"""
+        if len(group) != 1 or not self._undo or len(self._undo[-1]) != 1:
+            return False
+        record, last = group[0], self._undo[-1][0]
+        if record.kind != last.kind or record.time - last.time > COALESCE_SECONDS:
+            return False
+
+        if record.kind == "insert":
+            # 줄바꿈은 입력 단위를 나눔
+            if record.start != last.end or parse_index(record.end)[0] != parse_index(record.start)[0]:
+                return False
+            last.end = record.end
+        elif record.kind == "delete":
+            if any(piece[0] != "text" or "\n" in piece[1] for piece in record.pieces):
+                return False
+            removed = sum(len(piece[1]) for piece in record.pieces)
+            line, col = parse_index(record.start)
+            if record.start == last.start:
+                last.pieces = last.pieces + record.pieces  # Delete 키 (앞으로 지움)
+            elif parse_index(last.start) == (line, col + removed):
+                last.pieces = record.pieces + last.pieces  # Backspace (뒤로 지움)
+                last.start = record.start
+            else:
+                return False
+            self._bytes += record.size() - RECORD_OVERHEAD
+        else:
+            return False
+
+        last.time = record.time
+        return True
+
+    def _enforce_budget(self):
+        """한도를 넘으면 가장 오래된 단계부터 버림"""
+        while self._bytes > self.budget_bytes and len(self._undo) > 1:
+            dropped = self._undo.pop(0)
+            self._bytes -= sum(record.size() for record in dropped)
+
+    # --- 내용 읽기/복원 ---
+
+    def tag_ranges_in(self, tag, start, end):
+        """start~end 안의 tag 구간 (인덱스 문자열 평탄 목록)
+
+        문서 전체의 tag_ranges 대신 구간 안의 태그 전환만 dump 한 번으로 읽음
+        """
+        widget = self.widget
+        ranges = []
+        opened = start if tag in widget.tag_names(start) else None
+        for key, value, index in widget.dump(start, end, tag=True):
+            if value != tag:
+                continue
+            if key == "tagon" and opened is None:
+                opened = index
+            elif key == "tagoff" and opened is not None:
+                if opened != index:
+                    ranges.extend((opened, index))
+                opened = None
+        if opened is not None and opened != end:
+            ranges.extend((opened, end))
+        return ranges
+
+    def capture(self, start, end):
+        """start~end 내용을 태그 포함 조각 목록으로 읽음
+
+        조각: ("text", 텍스트, 태그), ("image", 이름, Tk 이미지, 태그), ("window", 위젯 설명, 태그)
+        Tk는 지워진 임베드 위젯을 파괴하므로 위젯 경로 대신 다시 만들 수 있는 설명을 저장
+        """
+        widget = self.widget
+        tags = {tag for tag in widget.tag_names(start) if not self.is_transient(tag)}
+        pieces = []
+        for key, value, index in widget.dump(start, end, text=True, tag=True, image=True, window=True):
+            if key == "tagon":
+                if not self.is_transient(value):
+                    tags.add(value)
+            elif key == "tagoff":
+                tags.discard(value)
+            elif key == "text":
+                pieces.append(("text", value, tuple(tags)))
+            elif key == "image":
+                pieces.append(("image", value, widget.image_cget(index, "image"), tuple(tags)))
+            elif key == "window":
+                pieces.append(("window", self.describe_window(value), tuple(tags)))
+        return pieces
+
+    def _restore(self, start, pieces):
+        """start 위치에 조각 목록을 다시 삽입하고 삽입된 끝 위치 반환"""
+        widget = self.widget
+        widget.mark_set(UNDO_MARK, start)
+        widget.mark_gravity(UNDO_MARK, "right")
+        for piece in pieces:
+            if piece[0] == "text":
+                widget.insert(UNDO_MARK, piece[1], piece[2])
+                continue
+
+            index = widget.index(UNDO_MARK)
+            if piece[0] == "image":
+                widget.image_create(index, image=piece[2], name=piece[1])
+            elif piece[1] is None or not self.restore_window(piece[1], index):
+                # 다시 만들 수 없는 위젯은 빼고 나머지 내용만 되살림
+                logger.warning("Embedded window could not be restored")
+                continue
+            for tag in piece[-1]:
+                widget.tag_add(tag, index)
+        end = widget.index(UNDO_MARK)
+        widget.mark_unset(UNDO_MARK)
+        return end
+
+    def _set_tag(self, record, ranges):
+        """record의 태그 구간을 ranges 상태로 되돌림"""
+        widget = self.widget
+        widget.tag_remove(record.tag, record.start, record.end)
+        if ranges:
+            widget.tk.call(widget._w, "tag", "add", record.tag, *ranges)
+
+    # --- 실행 취소 / 다시 실행 ---
+
+    def undo(self):
+        """마지막 단계 실행 취소 (없으면 False)"""
+        self._seal()
+        if not self._undo:
+            return False
+        group = self._undo.pop()
+        self._bytes -= sum(record.size() for record in group)
+
+        self._applying = True
+        try:
+            for record in reversed(group):
+                if record.kind == "insert":
+                    record.pieces = self.capture(record.start, record.end)
+                    self.widget.delete(record.start, record.end)
+                elif record.kind == "delete":
+                    record.end = self._restore(record.start, record.pieces)
+                else:
+                    record.after = self.tag_ranges_in(record.tag, record.start, record.end)
+                    self._set_tag(record, record.before)
+        except tkinter.TclError as e:
+            # 기록과 위젯 상태가 어긋난 경우: 남은 기록은 더 이상 적용할 수 없으므로 버림
+            logger.warning(f"Undo failed, clearing history: {e}")
+            self.clear()
+            return True
+        finally:
+            self._applying = False
+
+        self._redo.append(group)
+        self.widget.mark_set("insert", group[0].start)
+        self.widget.see("insert")
+        return True
+
+    def redo(self):
+        """마지막으로 취소한 단계 다시 실행 (없으면 False)"""
+        self._seal()
+        if not self._redo:
+            return False
+        group = self._redo.pop()
+
+        self._applying = True
+        try:
+            for record in group:
+                if record.kind == "insert":
+                    record.end = self._restore(record.start, record.pieces)
+                    record.pieces = None
+                elif record.kind == "delete":
+                    self.widget.delete(record.start, record.end)
+                else:
+                    self._set_tag(record, record.after)
+        except tkinter.TclError as e:
+            logger.warning(f"Redo failed, clearing history: {e}")
+            self.clear()
+            return True
+        finally:
+            self._applying = False
+
+        self._undo.append(group)
+        self._bytes += sum(record.size() for record in group)
+        self._enforce_budget()
+        last = group[-1]
+        self.widget.mark_set("insert", last.end if last.kind == "insert" else last.start)
+        self.widget.see("insert")
+        return True